@@ -0,0 +1,55 @@
+"""
+Response encodings for the JSON API. msgpack is an optional dependency
+(``uv sync --extra api``) imported on first use.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+
+
+class NotAcceptable(Exception):
+    """Raised when the requested encoding is not available."""
+
+
+def encode_json(data):
+    return json.dumps(
+        data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def _msgpack_default(value):
+    # Same representation as DjangoJSONEncoder for the types .values() yields.
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def encode_msgpack(data):
+    try:
+        import msgpack
+    except ImportError as exc:
+        raise NotAcceptable("msgpack no está instalado.") from exc
+    return msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+
+
+RENDERERS = {JSON: encode_json, MSGPACK: encode_msgpack}
+FORMATS = {"json": JSON, "msgpack": MSGPACK}
+
+
+def negotiate(request):
+    """Media type from ``?format=`` or the Accept header; JSON by default."""
+    if fmt := request.GET.get("format"):
+        if fmt not in FORMATS:
+            raise NotAcceptable(f"Formato desconocido: {fmt}.")
+        return FORMATS[fmt]
+    if request.accepts(MSGPACK) and not request.accepts(JSON):
+        return MSGPACK
+    return JSON
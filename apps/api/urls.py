@@ -0,0 +1,22 @@
+from django.urls import path
+
+from . import views
+
+app_name = "api"
+
+urlpatterns = [
+    path("productos/", views.ProductoApiView.as_view(), name="productos"),
+    path("productos/precios/", views.PrecioApiView.as_view(), name="precios"),
+    path("productos/<int:pk>/", views.ProductoApiView.as_view(), name="producto"),
+    path("unicidad/", views.UnicidadApiView.as_view(), name="unicidad"),
+    path("proveedores/", views.ProveedorApiView.as_view(), name="proveedores"),
+    path("proveedores/<int:pk>/", views.ProveedorApiView.as_view(), name="proveedor"),
+    path("trabajadores/", views.TrabajadorApiView.as_view(), name="trabajadores"),
+    path(
+        "trabajadores/<int:pk>/",
+        views.TrabajadorApiView.as_view(),
+        name="trabajador",
+    ),
+    path("empresa/", views.EmpresaApiView.as_view(), name="empresas"),
+    path("empresa/<int:pk>/", views.EmpresaApiView.as_view(), name="empresa"),
+]
@@ -0,0 +1,258 @@
+"""
+Read-only JSON API. Rows go straight from ``.values()`` to the encoder, with
+no model instances, keyset cursors instead of OFFSET, ``?fields=`` sparse
+fieldsets and ETags computed from the encoded body.
+"""
+
+import hashlib
+
+from django.core.exceptions import BadRequest
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views import View
+
+from apps.core import unicidad
+from apps.core.pagination import KeysetPaginator
+from apps.empresa.models import Empresa
+from apps.productos import precios
+from apps.productos.models import Producto
+from apps.proveedores.models import Proveedor
+from apps.trabajadores.models import Trabajador
+
+from .renderers import JSON, RENDERERS, NotAcceptable, encode_json, negotiate
+
+
+class ValuesKeysetPaginator(KeysetPaginator):
+    """KeysetPaginator over ``.values()`` dicts."""
+
+    def key(self, row):
+        return tuple(row[field] for field in self.ordering)
+
+
+class ApiView(View):
+    """
+    List (``/``) and detail (``/<pk>/``) of ``model``. ``fields`` lists the
+    public fields in output order; file fields are returned as URLs.
+    """
+
+    model = None
+    fields = ()
+    per_page = 50
+    max_per_page = 200
+    http_method_names = ["get", "head", "options"]
+
+    def get(self, request, pk=None):
+        try:
+            media_type = negotiate(request)
+            data = self.get_data(pk)
+        except NotAcceptable as exc:
+            return self.error(str(exc), 406)
+        except BadRequest as exc:
+            return self.error(str(exc), 400)
+        if data is None:
+            return self.error("No encontrado.", 404)
+        try:
+            body = RENDERERS[media_type](data)
+        except NotAcceptable as exc:
+            return self.error(str(exc), 406)
+        return self.respond(body, media_type)
+
+    def get_data(self, pk):
+        fields = self.get_fields()
+        if pk is None:
+            return self.get_list(fields)
+        return self.get_object(pk, fields)
+
+    def get_fields(self):
+        if not (requested := self.request.GET.get("fields")):
+            return list(self.fields)
+        fields = [name for name in requested.split(",") if name]
+        if unknown := set(fields) - set(self.fields):
+            raise BadRequest(f"Campos desconocidos: {', '.join(sorted(unknown))}.")
+        # The pk is always returned: clients need it to address the row.
+        return ["id", *(name for name in fields if name != "id")]
+
+    def get_queryset(self):
+        return self.model.objects.order_by()
+
+    def get_list(self, fields):
+        try:
+            per_page = int(self.request.GET.get("limit", self.per_page))
+        except ValueError as exc:
+            raise BadRequest("Límite inválido.") from exc
+        per_page = max(1, min(per_page, self.max_per_page))
+        paginator = ValuesKeysetPaginator(
+            self.get_queryset().values(*fields), ("id",), per_page
+        )
+        page = paginator.page(self.request.GET.get("cursor"))
+        return {
+            "results": self.serialize(page.object_list, fields),
+            "next": self.cursor_url(page.next_cursor),
+            "previous": self.cursor_url(page.previous_cursor),
+        }
+
+    def get_object(self, pk, fields):
+        rows = list(self.get_queryset().filter(pk=pk).values(*fields))
+        return self.serialize(rows, fields)[0] if rows else None
+
+    def serialize(self, rows, fields):
+        file_fields = [
+            field
+            for field in map(self.model._meta.get_field, fields)
+            if hasattr(field, "storage")
+        ]
+        for row in rows:
+            for field in file_fields:
+                if name := row[field.name]:
+                    row[field.name] = field.storage.url(name)
+                else:
+                    row[field.name] = None
+        return rows
+
+    def cursor_url(self, cursor):
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query["cursor"] = cursor
+        return self.request.build_absolute_uri(f"?{query.urlencode()}")
+
+    def respond(self, body, media_type):
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        response = get_conditional_response(self.request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type=media_type)
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def error(self, message, status):
+        return HttpResponse(
+            encode_json({"error": message}), content_type=JSON, status=status
+        )
+
+
+class ProductoApiView(ApiView):
+    model = Producto
+    fields = ("id", "nombre", "descripcion", "precio", "iva", "imagen")
+
+
+class PrecioApiView(ApiView):
+    """
+    Gross price quotes for a basket: ``?ids=1,2,3`` (up to ``max_ids``).
+    Unknown ids are listed under ``missing``.
+    """
+
+    max_ids = 500
+
+    def get_data(self, pk):
+        ids = self.get_ids()
+        cotizaciones = precios.cotizar(ids)
+        return {
+            "results": [
+                {"id": producto_id, **cotizaciones[producto_id]}
+                for producto_id in ids
+                if producto_id in cotizaciones
+            ],
+            "missing": [
+                producto_id for producto_id in ids if producto_id not in cotizaciones
+            ],
+        }
+
+    def get_ids(self):
+        try:
+            ids = [int(pk) for pk in self.request.GET.get("ids", "").split(",") if pk]
+        except ValueError as exc:
+            raise BadRequest("Ids inválidos.") from exc
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            raise BadRequest("Indique los ids de los productos.")
+        if len(ids) > self.max_ids:
+            raise BadRequest(f"Máximo {self.max_ids} productos por consulta.")
+        return ids
+
+
+class UnicidadApiView(ApiView):
+    """
+    Whether values of a unique field (``apps.core.unicidad``) are taken:
+    ``?campo=cedula&valor=X``, plus ``&excluir=<pk>`` when editing that row,
+    or a batch ``?campo=cedula&valores=a,b,c`` (up to ``max_valores``).
+    """
+
+    max_valores = 500
+
+    def get_data(self, pk):
+        campo = self.request.GET.get("campo", "")
+        if campo not in unicidad.CAMPOS:
+            raise BadRequest(f"Campo desconocido: {campo}.")
+        if "valores" in self.request.GET:
+            valores = self.get_valores()
+            tomados = unicidad.existentes(campo, valores)
+            return {
+                "campo": campo,
+                "tomados": [valor for valor in valores if valor in tomados],
+            }
+        if not (valor := self.request.GET.get("valor", "").strip()):
+            raise BadRequest("Indique el valor.")
+        return {
+            "campo": campo,
+            "valor": valor,
+            "disponible": not unicidad.existe(campo, valor, self.get_excluir()),
+        }
+
+    def get_valores(self):
+        valores = self.request.GET["valores"].split(",")
+        valores = list(dict.fromkeys(filter(None, map(str.strip, valores))))
+        if not valores:
+            raise BadRequest("Indique los valores.")
+        if len(valores) > self.max_valores:
+            raise BadRequest(f"Máximo {self.max_valores} valores por consulta.")
+        return valores
+
+    def get_excluir(self):
+        if not (excluir := self.request.GET.get("excluir")):
+            return None
+        try:
+            return int(excluir)
+        except ValueError as exc:
+            raise BadRequest("Id a excluir inválido.") from exc
+
+
+class ProveedorApiView(ApiView):
+    model = Proveedor
+    fields = (
+        "id",
+        "nombre",
+        "descripcion",
+        "telefono",
+        "pais",
+        "pais_codigo",
+        "correo",
+        "direccion",
+    )
+
+
+class TrabajadorApiView(ApiView):
+    model = Trabajador
+    fields = (
+        "id",
+        "nombre",
+        "apellido",
+        "correo",
+        "cedula",
+        "codigo_empleado",
+        "imagen",
+    )
+
+
+class EmpresaApiView(ApiView):
+    model = Empresa
+    fields = (
+        "id",
+        "nombre",
+        "direccion",
+        "mision",
+        "vision",
+        "anio_fundacion",
+        "ruc",
+        "imagen",
+    )
@@ -0,0 +1,54 @@
+"""
+Set-based bulk operations.
+
+Every operation runs inside a single transaction on the primary. Small
+selections are a single UPDATE/DELETE; selections larger than ``batch_size``
+are split into pk batches so no statement carries an unbounded IN list.
+"""
+
+from itertools import islice
+
+from django.db import router, transaction
+
+BULK_BATCH_SIZE = 1000
+
+
+def chunked(iterable, size):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _pk_batches(queryset, batch_size):
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    return chunked(pks.iterator(chunk_size=batch_size), batch_size)
+
+
+def bulk_update(queryset, batch_size=None, **values):
+    """Apply ``values`` to every row of ``queryset``; return rows updated."""
+    db = router.db_for_write(queryset.model)
+    queryset = queryset.using(db)
+    manager = queryset.model._base_manager.db_manager(db)
+    with transaction.atomic(using=db):
+        if not batch_size:
+            return queryset.update(**values)
+        # Materialise the pk list first: the updates below may change the
+        # columns the selection filters on.
+        batches = list(_pk_batches(queryset, batch_size))
+        return sum(manager.filter(pk__in=pks).update(**values) for pks in batches)
+
+
+def bulk_delete(queryset, batch_size=None):
+    """Delete every row of ``queryset``; return rows deleted."""
+    db = router.db_for_write(queryset.model)
+    queryset = queryset.using(db)
+    manager = queryset.model._base_manager.db_manager(db)
+    label = queryset.model._meta.label
+    with transaction.atomic(using=db):
+        if not batch_size:
+            return queryset.delete()[1].get(label, 0)
+        batches = list(_pk_batches(queryset, batch_size))
+        return sum(
+            manager.filter(pk__in=pks).delete()[1].get(label, 0) for pks in batches
+        )
@@ -0,0 +1,160 @@
+"""
+Home page carousels.
+
+``settings.CAROUSELS`` lists the images of each carousel. ``build`` reads
+every original once with Pillow, stores JPEG variants at
+``settings.CAROUSEL_WIDTHS`` and a tiny placeholder (inlined as a data URI),
+and writes a JSON manifest next to the images. Pages get the resolved
+manifest from the cache, so a render does no parsing and no storage I/O, and
+every ``<img>`` carries its size and a ``srcset``.
+
+Variant names carry a hash of their bytes, like the content-addressed
+uploads in ``apps.core.media``: media is served as immutable, so a name
+never gets new content and a rebuild never deletes a file a cached page may
+still point at. Only the manifest, which workers read from the storage, is
+replaced, once the variants it lists are saved.
+
+Images that are not in the manifest yet are served as they are.
+"""
+
+import base64
+import hashlib
+import json
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+MANIFEST_NAME = "carrusel/manifest.json"
+CACHE_KEY = "carruseles:manifest"
+PLACEHOLDER_WIDTH = 16
+DIGEST_LENGTH = 16
+
+
+def timeout():
+    return getattr(settings, "CAROUSEL_CACHE_TIMEOUT", 3600)
+
+
+def variant_name(name, width, data):
+    """'carrusel/foto.png', 480, data -> 'carrusel/foto-480w-<sha256[:16]>.jpg'"""
+    digest = hashlib.sha256(data).hexdigest()[:DIGEST_LENGTH]
+    return f"{posixpath.splitext(name)[0]}-{width}w-{digest}.jpg"
+
+
+def _jpeg(image, **options):
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", **options)
+    return buffer.getvalue()
+
+
+def procesar(storage, name, widths):
+    """(manifest entry, {variant name: JPEG bytes}) for one original."""
+    # Only this command needs Pillow; the web workers never import it.
+    from PIL import Image, ImageOps
+
+    with storage.open(name) as file:
+        image = ImageOps.exif_transpose(Image.open(file)).convert("RGB")
+    width, height = image.size
+
+    files, variants = {}, []
+    for target in sorted(w for w in set(widths) if w < width):
+        size = (target, max(1, round(height * target / width)))
+        data = _jpeg(
+            image.resize(size, Image.Resampling.LANCZOS),
+            quality=80,
+            optimize=True,
+            progressive=True,
+        )
+        variants.append([variant_name(name, target, data), target])
+        files[variants[-1][0]] = data
+    size = (PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width)))
+    placeholder = base64.b64encode(_jpeg(image.resize(size), quality=40)).decode()
+    entry = {
+        "width": width,
+        "height": height,
+        "placeholder": f"data:image/jpeg;base64,{placeholder}",
+        "variants": variants,
+    }
+    return entry, files
+
+
+def _save(storage, files):
+    # A variant that exists already holds these bytes: its name is their
+    # hash. The manifest is saved last and replaced; storages rename on
+    # conflict instead of overwriting.
+    contents = {
+        name: ContentFile(data)
+        for name, data in files.items()
+        if name != MANIFEST_NAME and not storage.exists(name)
+    }
+    if hasattr(storage, "save_many"):
+        storage.save_many(contents)
+    else:
+        for name, content in contents.items():
+            storage.save(name, content)
+    if storage.exists(MANIFEST_NAME):
+        storage.delete(MANIFEST_NAME)
+    storage.save(MANIFEST_NAME, ContentFile(files[MANIFEST_NAME]))
+
+
+def build(storage=None):
+    """
+    Process every configured image and write the manifest. Returns the
+    manifest and the configured images missing from the storage.
+    """
+    storage = storage or default_storage
+    names = dict.fromkeys(
+        name for images in settings.CAROUSELS.values() for name, _ in images
+    )
+    manifest, files, missing = {}, {}, []
+    for name in names:
+        if not storage.exists(name):
+            missing.append(name)
+            continue
+        manifest[name], variants = procesar(storage, name, settings.CAROUSEL_WIDTHS)
+        files.update(variants)
+    files[MANIFEST_NAME] = json.dumps({"images": manifest}).encode()
+    _save(storage, files)
+    cache.delete(CACHE_KEY)
+    return manifest, missing
+
+
+def load(storage):
+    if not storage.exists(MANIFEST_NAME):
+        return {}
+    with storage.open(MANIFEST_NAME) as file:
+        return json.load(file)["images"]
+
+
+def imagen(storage, name, alt, entry):
+    """Context of one slide for shared/carousel.html."""
+    image = {"src": storage.url(name), "alt": alt}
+    if entry:
+        sources = [*entry["variants"], [name, entry["width"]]]
+        image.update(
+            width=entry["width"],
+            height=entry["height"],
+            placeholder=entry["placeholder"],
+            srcset=", ".join(f"{storage.url(src)} {w}w" for src, w in sources),
+        )
+    return image
+
+
+def resolve(storage=None):
+    """{carousel: [slide, ...]} for every configured carousel."""
+    storage = storage or default_storage
+    manifest = load(storage)
+    return {
+        carousel: [
+            imagen(storage, name, alt, manifest.get(name)) for name, alt in images
+        ]
+        for carousel, images in settings.CAROUSELS.items()
+    }
+
+
+def imagenes(carousel):
+    """Slides of one carousel, from the cached manifest."""
+    return cache.get_or_set(CACHE_KEY, resolve, timeout())[carousel]
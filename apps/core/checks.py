@@ -0,0 +1,28 @@
+"""
+System checks for settings the caching modules depend on.
+"""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends whose entries live in one process: a delete or a bumped
+# generation in one worker is invisible to the others.
+PROCESS_LOCAL_CACHES = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            "The default cache is local to each process.",
+            hint=(
+                "Price quotes, uniqueness answers and supplier facets are "
+                "invalidated in the default cache after writes; with several "
+                "workers, configure a shared backend such as RedisCache."
+            ),
+            id="core.W001",
+        )
+    ]
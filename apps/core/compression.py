@@ -0,0 +1,133 @@
+"""
+Response body compression for ``apps.core.middleware.CompressionMiddleware``.
+
+brotli and zstd are used when their libraries are installed (``uv sync
+--extra compression``); gzip is always available. Compressed bodies are
+kept in a small per-process LRU keyed by a hash of the uncompressed body,
+so a page served with identical HTML again (the home page, an unchanged
+listing) is compressed once instead of on every hit. Hashing is an order of
+magnitude cheaper than compressing.
+
+Like GZipMiddleware, gzip and zstd bodies get up to ``MAX_RANDOM_BYTES`` of
+random padding (a random gzip file name, a zstd skippable frame) to blunt
+BREACH-style length attacks on secrets in the page. brotli has no place
+for padding, so ``PADDED`` lists the codings fit for such responses.
+"""
+
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from functools import cache, partial
+from importlib.util import find_spec
+
+from django.utils.text import compress_string
+
+# Levels meant for on-the-fly compression: most of the ratio for a
+# fraction of the CPU of the maximum levels.
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+# Same bound as django.middleware.gzip.GZipMiddleware.max_random_bytes.
+MAX_RANDOM_BYTES = 100
+PADDED = ("zstd", "gzip")
+
+# First of the 16 magic numbers zstd decoders skip, with the frame's data.
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+@cache
+def encoders():
+    """{content coding: compress function}, in order of preference."""
+    available = {}
+    if find_spec("brotli"):
+        import brotli
+
+        available["br"] = partial(brotli.compress, quality=BROTLI_QUALITY)
+    if find_spec("zstandard"):
+        import zstandard
+
+        available["zstd"] = partial(_zstd, zstandard.compress)
+    available["gzip"] = partial(compress_string, max_random_bytes=MAX_RANDOM_BYTES)
+    return available
+
+
+def _zstd(compress, body):
+    padding = secrets.token_bytes(secrets.randbelow(MAX_RANDOM_BYTES) + 1)
+    skippable = (
+        ZSTD_SKIPPABLE_MAGIC.to_bytes(4, "little")
+        + len(padding).to_bytes(4, "little")
+        + padding
+    )
+    return compress(body, level=ZSTD_LEVEL) + skippable
+
+
+def compressible(content_type):
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def negotiate(accept_encoding, codings=None):
+    """
+    The available coding with the highest q-value in an Accept-Encoding
+    header (ties go to the server's preference), or None. ``codings``
+    restricts the choice, e.g. to ``PADDED``.
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    qualities = {
+        coding: accepted.get(coding, accepted.get("*", 0.0))
+        for coding in encoders()
+        if codings is None or coding in codings
+    }
+    if not qualities:
+        return None
+    best = max(qualities, key=qualities.get)
+    return best if qualities[best] > 0 else None
+
+
+class CompressedCache:
+    """Thread-safe LRU of compressed bodies, bounded by their total size."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def compress(self, coding, body):
+        # Bodies too big to share the cache with others are not kept.
+        if len(body) > self.max_bytes // 8:
+            return encoders()[coding](body)
+
+        key = (coding, hashlib.blake2b(body, digest_size=16).digest())
+        with self.lock:
+            if (compressed := self.entries.get(key)) is not None:
+                self.entries.move_to_end(key)
+                return compressed
+
+        compressed = encoders()[coding](body)
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = compressed
+                self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
@@ -0,0 +1,130 @@
+"""
+Helpers for RunPython data migrations that have to scale past sample data.
+
+They take the historical model from ``apps.get_model`` and the database
+alias from ``schema_editor.connection.alias``, and never touch rows one
+query at a time.
+"""
+
+import sys
+import time
+
+from django.db import OperationalError, connections, transaction
+
+from .bulk import chunked
+
+
+def bulk_upsert(model, rows, key, update_fields=(), batch_size=500, using="default"):
+    """
+    Insert the ``rows`` (dicts) whose ``key`` value does not exist yet and,
+    if ``update_fields`` is given, update those fields on the ones that do.
+    Returns ``(created, updated)``.
+    """
+    manager = model._base_manager.db_manager(using)
+    created = updated = 0
+    for chunk in chunked(rows, batch_size):
+        lookup = {f"{key}__in": [row[key] for row in chunk]}
+        existing = {getattr(obj, key): obj for obj in manager.filter(**lookup)}
+
+        new = [model(**row) for row in chunk if row[key] not in existing]
+        manager.bulk_create(new, batch_size=batch_size)
+        created += len(new)
+
+        if update_fields:
+            changed = [
+                _assign(existing[row[key]], row, update_fields)
+                for row in chunk
+                if row[key] in existing
+            ]
+            manager.bulk_update(changed, update_fields, batch_size=batch_size)
+            updated += len(changed)
+    return created, updated
+
+
+def bulk_update_by_key(model, key, values, batch_size=500, using="default"):
+    """
+    Set fields on existing rows looked up by ``key``.
+
+    ``values`` maps each key value to a dict of ``{field: value}``; every
+    dict must name the same fields. Keys without a row are skipped. Returns
+    the number of rows updated.
+    """
+    manager = model._base_manager.db_manager(using)
+    updated = 0
+    for chunk in chunked(values.items(), batch_size):
+        by_key = dict(chunk)
+        fields = list(next(iter(by_key.values())))
+        objs = [
+            _assign(obj, by_key[getattr(obj, key)], fields)
+            for obj in manager.filter(**{f"{key}__in": by_key}).only("pk", key, *fields)
+        ]
+        manager.bulk_update(objs, fields)
+        updated += len(objs)
+    return updated
+
+
+def batched_backfill(
+    queryset,
+    apply,
+    batch_size=1000,
+    lock_timeout_ms=5000,
+    max_retries=3,
+    retry_delay=1.0,
+    stdout=None,
+    label="backfill",
+):
+    """
+    Call ``apply(batch_queryset)`` over ``queryset`` in primary-key order,
+    one transaction per batch.
+
+    Filter ``queryset`` down to the rows that still need work (e.g.
+    ``filter(column__isnull=True)``) and the backfill is resumable: a rerun
+    after an interruption only sees what is left. On PostgreSQL each batch
+    sets a lock_timeout so it gives up instead of queueing behind long
+    transactions, and is retried with backoff. Use it from migrations with
+    ``atomic = False``.
+    """
+    stdout = stdout or sys.stdout
+    using = queryset.db
+    manager = queryset.model._base_manager.db_manager(using)
+    total = queryset.count()
+    done = 0
+    last_pk = None
+
+    while True:
+        page = queryset.order_by("pk")
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                with transaction.atomic(using=using):
+                    _set_lock_timeout(using, lock_timeout_ms)
+                    apply(manager.filter(pk__in=pks))
+                break
+            except OperationalError as exc:
+                if attempt == max_retries:
+                    raise
+                stdout.write(f"  {label}: {exc}; reintento {attempt}/{max_retries}\n")
+                time.sleep(retry_delay * attempt)
+
+        last_pk = pks[-1]
+        done += len(pks)
+        stdout.write(f"  {label}: {done}/{total}\n")
+    return done
+
+
+def _assign(obj, values, fields):
+    for field in fields:
+        setattr(obj, field, values[field])
+    return obj
+
+
+def _set_lock_timeout(using, lock_timeout_ms):
+    connection = connections[using]
+    if lock_timeout_ms and connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL lock_timeout = '{int(lock_timeout_ms)}ms'")
@@ -0,0 +1,94 @@
+from django import forms
+from django.urls import reverse
+from django.utils.http import urlencode
+
+from .bulk import BULK_BATCH_SIZE, bulk_delete
+
+
+class IdListField(forms.Field):
+    """Primary keys submitted as repeated ``ids`` values (list checkboxes)."""
+
+    widget = forms.MultipleHiddenInput
+    hidden_widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            return sorted({int(pk) for pk in value})
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Selección inválida", code="invalid")
+
+
+class UniqueCheckMixin:
+    """
+    ModelForm mixin that points the ``unique_check_fields`` inputs at the
+    uniqueness pre-check endpoint, so the browser flags a taken value while
+    it is typed. The row being edited does not count as a duplicate.
+    """
+
+    unique_check_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in self.unique_check_fields:
+            query = {"campo": name}
+            if self.instance.pk is not None:
+                query["excluir"] = self.instance.pk
+            self.fields[name].widget.attrs[
+                "data-unique-url"
+            ] = f"{reverse('api:unicidad')}?{urlencode(query)}"
+
+
+class BulkActionForm(forms.Form):
+    """
+    Multi-select action over a model's rows.
+
+    Subclasses add actions by extending ``ACCION_CHOICES`` and overriding
+    ``apply`` and ``describe``.
+    """
+
+    ACCION_CHOICES = [("eliminar", "Eliminar seleccionados")]
+
+    accion = forms.ChoiceField(
+        label="Acción",
+        widget=forms.Select(attrs={"class": "form-select form-select-sm"}),
+    )
+    ids = IdListField(required=False)
+    todos = forms.BooleanField(
+        label="Aplicar a todos los registros",
+        required=False,
+        widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["accion"].choices = self.ACCION_CHOICES
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("ids") and not cleaned_data.get("todos"):
+            raise forms.ValidationError(
+                "Seleccione al menos un registro", code="empty_selection"
+            )
+        return cleaned_data
+
+    def get_queryset(self, model):
+        queryset = model._default_manager.all()
+        if self.cleaned_data["todos"]:
+            return queryset
+        return queryset.filter(pk__in=self.cleaned_data["ids"])
+
+    def apply(self, queryset, batch_size=None):
+        """Run the selected action and return the number of affected rows."""
+        if self.cleaned_data["accion"] == "eliminar":
+            return bulk_delete(queryset, batch_size=batch_size)
+        raise ValueError(f"Acción no soportada: {self.cleaned_data['accion']}")
+
+    def describe(self):
+        return dict(self.ACCION_CHOICES)[self.cleaned_data["accion"]]
+
+    def execute(self, queryset, total):
+        """Apply the action, batching selections larger than BULK_BATCH_SIZE."""
+        batch_size = BULK_BATCH_SIZE if total > BULK_BATCH_SIZE else None
+        return self.apply(queryset, batch_size=batch_size)
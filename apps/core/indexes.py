@@ -0,0 +1,56 @@
+"""
+Index helpers for models that run on PostgreSQL in production and on
+SQLite in development and tests.
+"""
+
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db.migrations import AddIndex
+from django.db.models import Index
+
+
+class OpClassIndex(Index):
+    """
+    Index whose ``OpClass`` expressions only keep their operator class on
+    PostgreSQL; other databases index the bare expressions.
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        index = self
+        if schema_editor.connection.vendor != "postgresql":
+            index = self.clone()
+            index.expressions = tuple(
+                (
+                    expression.get_source_expressions()[0]
+                    if isinstance(expression, OpClass)
+                    else expression
+                )
+                for expression in self.expressions
+            )
+        return super(OpClassIndex, index).create_sql(
+            model, schema_editor, using=using, **kwargs
+        )
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """
+    CREATE INDEX CONCURRENTLY on PostgreSQL, so building the index does not
+    block writes to the table; a plain AddIndex elsewhere. The migration
+    needs ``atomic = False``.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            AddIndex.database_forwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            AddIndex.database_backwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
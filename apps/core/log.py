@@ -0,0 +1,152 @@
+"""
+Production logging pipeline.
+
+Records are formatted as JSON lines in the calling thread and handed to a
+queue; a background QueueListener does the file I/O, so request threads
+never block on disk writes. Every worker process appends to the same file;
+rotation is left to logrotate, which no single worker can race.
+"""
+
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+from queue import SimpleQueue
+
+request_context = ContextVar("log_request_context", default=None)
+
+request_logger = logging.getLogger("apps.core.requests")
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with request fields when available."""
+
+    REQUEST_FIELDS = ("request_id", "view", "latency_ms", "method", "status")
+
+    def format(self, record):
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.thread,
+        }
+        context = request_context.get() or {}
+        for field in self.REQUEST_FIELDS:
+            value = getattr(record, field, context.get(field))
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+    def formatTime(self, record, datefmt=None):
+        seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+        return f"{seconds}.{int(record.msecs):03d}Z"
+
+
+class RequestSampleFilter(logging.Filter):
+    """Keep a ``rate`` fraction of INFO-and-below records; always keep the rest."""
+
+    def __init__(self, rate=1.0, name=""):
+        super().__init__(name)
+        self.rate = float(rate)
+
+    def filter(self, record):
+        if record.levelno > logging.INFO or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    File handler whose writes happen on a background thread.
+
+    The file is opened in append mode and reopened when it is renamed or
+    removed (WatchedFileHandler), so every gunicorn worker can write to it
+    while logrotate rotates it. Rotating from the workers themselves is
+    unsafe: each would rename the file under the others.
+
+    Configure it with the ``"()"`` factory key: from Python 3.12 on,
+    ``dictConfig`` gives QueueHandler subclasses named under ``"class"`` a
+    queue and listener of its own and rejects these arguments.
+
+    The listener thread is started by the first record each process logs,
+    not at import time, so workers forked by ``gunicorn --preload`` get one
+    of their own. It is stopped, and the queue drained, when logging shuts
+    down.
+    """
+
+    def __init__(self, filename, encoding="utf-8"):
+        super().__init__(SimpleQueue())
+        self.target = WatchedFileHandler(filename, encoding=encoding, delay=True)
+        self.listener = None
+        self.pid = None
+
+    def enqueue(self, record):
+        # Runs under the handler lock, which logging re-creates after fork.
+        if self.pid != os.getpid():
+            self.start()
+        super().enqueue(record)
+
+    def start(self):
+        # A forked child inherits the parent's queue but not its thread.
+        self.queue = SimpleQueue()
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+        self.pid = os.getpid()
+
+    def close(self):
+        if self.listener is not None and self.pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+        self.pid = None
+        self.target.close()
+        super().close()
+
+
+class RequestLogMiddleware:
+    """
+    Log one record per request with its id, view name and latency.
+
+    The request id comes from the X-Request-ID header when a proxy sets
+    one, and is echoed back in the response.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        context = {
+            "request_id": request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        }
+        token = request_context.set(context)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+            context["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            if request_logger.isEnabledFor(logging.INFO):
+                request_logger.info(
+                    "%s %s %s",
+                    request.method,
+                    request.get_full_path(),
+                    response.status_code,
+                    extra={
+                        **context,
+                        "method": request.method,
+                        "status": response.status_code,
+                    },
+                )
+            response["X-Request-ID"] = context["request_id"]
+            return response
+        finally:
+            request_context.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if context := request_context.get():
+            context["view"] = request.resolver_match.view_name
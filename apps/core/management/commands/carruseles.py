@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.core import carousels
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera las variantes redimensionadas, los marcadores de posición y el "
+        "manifiesto de las imágenes de los carruseles (settings.CAROUSELS)."
+    )
+    # Pillow and the storage are all this needs; skip loading the URLconf.
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        manifest, missing = carousels.build()
+        for name in missing:
+            self.stderr.write(self.style.WARNING(f"No existe: {name}"))
+        variants = sum(len(entry["variants"]) for entry in manifest.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(manifest)} imágenes procesadas, {variants} variantes "
+                f"({carousels.MANIFEST_NAME})."
+            )
+        )
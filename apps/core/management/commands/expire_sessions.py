@@ -0,0 +1,48 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Elimina las sesiones expiradas por lotes, sin bloquear la tabla de "
+        "sesiones con un único DELETE masivo."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Segundos de espera entre lotes para no saturar la base de datos.",
+        )
+
+    def handle(self, *args, batch_size, sleep, verbosity, **options):
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+        if not hasattr(store, "get_model_class"):
+            # Cookie and pure cache backends expire on their own.
+            store.clear_expired()
+            self.stdout.write("El backend de sesiones no usa la base de datos.")
+            return
+
+        model = store.get_model_class()
+        now = timezone.now()
+        total = 0
+        while keys := list(
+            model.objects.filter(expire_date__lt=now).values_list(
+                "session_key", flat=True
+            )[:batch_size]
+        ):
+            deleted, _ = model.objects.filter(session_key__in=keys).delete()
+            total += deleted
+            if verbosity > 1:
+                self.stdout.write(f"  lote: {deleted} sesiones")
+            if sleep:
+                time.sleep(sleep)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} sesiones expiradas eliminadas."))
@@ -0,0 +1,205 @@
+import logging
+import posixpath
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from apps.core.bloom import BloomFilter
+from apps.core.bulk import chunked
+from apps.core.media import discard_orphans, is_content_addressed
+from apps.core.routers import use_primary
+
+logger = logging.getLogger(__name__)
+
+
+def file_fields():
+    """(model, field) pairs of every concrete FileField/ImageField."""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField)
+    ]
+
+
+def media_roots(fields):
+    """Top-level storage directories the upload_to paths write into."""
+    return sorted(
+        {
+            field.upload_to.strip("/").split("/")[0]
+            for _, field in fields
+            if isinstance(field.upload_to, str) and field.upload_to.strip("/")
+        }
+    )
+
+
+def listdir_modified(storage, path):
+    """
+    ``(directories, [(name, modified time or None)])`` of ``path``. Storages
+    whose listing already carries the times (S3Storage) provide them;
+    otherwise they are looked up only for the files that need them.
+    """
+    if hasattr(storage, "listdir_modified"):
+        return storage.listdir_modified(path)
+    directories, files = storage.listdir(path)
+    return directories, [(name, None) for name in files]
+
+
+def walk(storage, path):
+    """
+    Yield ``(name, modified time or None)`` for every file under ``path``,
+    one directory listing at a time.
+    """
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            directories, files = listdir_modified(storage, current)
+        except FileNotFoundError:
+            continue
+        for name, modified in files:
+            yield posixpath.join(current, name), modified
+        pending.extend(posixpath.join(current, d) for d in directories)
+
+
+class Command(BaseCommand):
+    help = (
+        "Elimina (o mueve a cuarentena) los archivos multimedia que ninguna fila "
+        "referencia. Recorre el almacenamiento en streaming."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo lista los huérfanos, sin tocar el almacenamiento.",
+        )
+        parser.add_argument(
+            "--quarantine",
+            metavar="DIR",
+            help="Mueve los huérfanos a este directorio en lugar de eliminarlos.",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=3600,
+            help="Ignora archivos más recientes (segundos), p. ej. subidas en curso.",
+        )
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--bloom",
+            action="store_true",
+            help=(
+                "Usa un filtro de Bloom para las referencias (memoria acotada; "
+                "un falso positivo solo conserva un huérfano)."
+            ),
+        )
+        parser.add_argument("--error-rate", type=float, default=0.001)
+
+    def handle(self, *args, **options):
+        self.storage = default_storage
+        self.options = options
+        fields = file_fields()
+        started = time.monotonic()
+        referenced = self.referenced_names(fields, options["bloom"])
+        cutoff = timezone.now() - timedelta(seconds=options["min_age"])
+        self.quarantine = (options["quarantine"] or "").strip("/")
+
+        scanned = orphaned = processed = self.failed = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            for root in media_roots(fields):
+                entries = walk(self.storage, root)
+                for batch in chunked(entries, options["batch_size"]):
+                    scanned += len(batch)
+                    orphans = [
+                        name
+                        for name, modified in batch
+                        if name not in referenced
+                        and self.older_than(name, modified, cutoff)
+                    ]
+                    orphaned += len(orphans)
+                    if options["verbosity"] > 1:
+                        for name in orphans:
+                            self.stdout.write(f"  huérfano: {name}")
+                    if options["dry_run"] or not orphans:
+                        continue
+                    processed += self.discard_all(pool, orphans)
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        summary = f"{scanned} archivos revisados, {orphaned} huérfanos"
+        if options["dry_run"]:
+            summary += " (simulación)"
+        else:
+            action = "movidos a cuarentena" if self.quarantine else "eliminados"
+            summary += f", {processed} {action}"
+            if self.failed:
+                summary += f", {self.failed} con error (ver el log)"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{summary} en {elapsed:.2f} s ({scanned / elapsed:.0f} archivos/s)."
+            )
+        )
+
+    def referenced_names(self, fields, bloom):
+        querysets = [
+            model._base_manager.exclude(**{field.attname: ""})
+            .exclude(**{f"{field.attname}__isnull": True})
+            .values_list(field.attname, flat=True)
+            for model, field in fields
+        ]
+        with use_primary():
+            if bloom:
+                total = sum(qs.count() for qs in querysets)
+                names = BloomFilter(total, self.options["error_rate"])
+            else:
+                names = set()
+            for qs in querysets:
+                for name in qs.iterator(chunk_size=self.options["batch_size"]):
+                    names.add(name)
+        return names
+
+    def older_than(self, name, modified, cutoff):
+        if not self.options["min_age"]:
+            return True
+        if modified is None:
+            try:
+                modified = self.storage.get_modified_time(name)
+            except (FileNotFoundError, NotImplementedError):
+                return False
+        return modified < cutoff
+
+    def discard_all(self, pool, names):
+        """
+        Discard ``names``; content-addressed blobs only if their reference
+        count, re-read under its row lock, is still zero: an upload since
+        the snapshot may have started sharing them.
+        """
+        blobs = [name for name in names if is_content_addressed(name)]
+        others = [name for name in names if not is_content_addressed(name)]
+        discard = partial(self.discard_many, pool)
+        return len(discard(others)) + len(discard_orphans(blobs, discard))
+
+    def discard_many(self, pool, names):
+        done = [name for name, ok in zip(names, pool.map(self.discard, names)) if ok]
+        self.failed += len(names) - len(done)
+        return done
+
+    def discard(self, name):
+        try:
+            if self.quarantine:
+                with self.storage.open(name) as content:
+                    self.storage.save(posixpath.join(self.quarantine, name), content)
+            self.storage.delete(name)
+        except Exception:
+            logger.exception("gc_media: no se pudo descartar %s", name)
+            return False
+        return True
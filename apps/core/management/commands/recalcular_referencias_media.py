@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.media import recalcular
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula cuántas filas referencian cada imagen a partir de las "
+        "columnas de imagen."
+    )
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        archivos = recalcular()
+        self.stdout.write(
+            self.style.SUCCESS(f"Referencias recalculadas para {archivos} archivos.")
+        )
@@ -0,0 +1,208 @@
+"""
+Content-addressed media.
+
+Uploads are stored once per SHA-256 digest under ``<upload_to>/ab/<digest>.ext``
+and shared by every row that uploads the same bytes. A blob is deleted after
+the last row referencing it is deleted or points to another image.
+
+``ReferenciaMedia`` counts the rows pointing at each blob. An upload adds its
+reference, under the count's row lock, before it checks whether the blob is
+already stored; the cleanup takes the same lock, re-reads the count and only
+deletes a blob nobody references. An upload racing a cleanup therefore
+either keeps the blob alive or finds it gone and stores it again.
+``manage.py gc_media`` deletes blobs through the same lock
+(``discard_orphans``).
+
+The counts change in the transaction of the row write: models with a
+``ContentAddressedImageField`` save through ``AtomicSaveMixin``, so a save
+that fails (say, on a duplicate unique value) takes its reference back. The
+blob it may have stored is left to ``manage.py gc_media``.
+
+Writes that bypass the model (``QuerySet.update``, raw SQL, assigning a
+stored name to the field) leave the counts behind: rebuild them with
+``manage.py recalcular_referencias_media``.
+"""
+
+import hashlib
+import posixpath
+import re
+from collections import Counter
+from functools import cache, partial
+
+from django.apps import apps
+from django.db import models, router, transaction
+from django.db.models import Count
+from django.db.models.fields.files import ImageFieldFile
+from django.db.models.signals import post_delete
+
+from .models import ReferenciaMedia
+
+CONTENT_ADDRESSED_NAME = re.compile(r"(^|/)[0-9a-f]{2}/[0-9a-f]{64}(\.\w+)?$")
+
+
+def content_hash(content):
+    """Return the SHA-256 hex digest of a File, read in chunks."""
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def is_content_addressed(name):
+    return bool(name and CONTENT_ADDRESSED_NAME.search(name))
+
+
+@cache
+def content_addressed_fields():
+    """(model, field) pairs of every ContentAddressedImageField."""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, ContentAddressedImageField)
+    ]
+
+
+def count_references(name, using=None):
+    """Number of rows pointing at a stored file, read from the primary."""
+    using = using or router.db_for_write(ReferenciaMedia)
+    return (
+        ReferenciaMedia.objects.using(using)
+        .filter(nombre=name)
+        .values_list("total", flat=True)
+        .first()
+        or 0
+    )
+
+
+def recalcular(using=None):
+    """Rebuild every count from the image columns; return the number of blobs."""
+    using = using or router.db_for_write(ReferenciaMedia)
+    totales = Counter()
+    for model, field in content_addressed_fields():
+        for row in (
+            model._base_manager.using(using)
+            .exclude(**{field.attname: ""})
+            .exclude(**{f"{field.attname}__isnull": True})
+            .order_by()
+            .values(field.attname)
+            .annotate(total=Count("pk"))
+        ):
+            if is_content_addressed(row[field.attname]):
+                totales[row[field.attname]] += row["total"]
+    return ReferenciaMedia.objects.db_manager(using).reemplazar(totales)
+
+
+def delete_if_orphaned(storage, name, using=None):
+    """Delete a content-addressed blob once nothing references it."""
+    return bool(discard_orphans([name], partial(_delete, storage), using))
+
+
+def discard_orphans(names, discard, using=None):
+    """
+    Pass the content-addressed ``names`` nobody references to ``discard``
+    (which returns the ones it removed from storage) while their count rows
+    are locked, so an upload of the same bytes waits instead of reusing a
+    blob being removed. Returns the names discarded.
+    """
+    names = [name for name in names if is_content_addressed(name)]
+    if not names:
+        return []
+    using = using or router.db_for_write(ReferenciaMedia)
+    manager = ReferenciaMedia.objects.using(using)
+    with transaction.atomic(using=using):
+        # A row to lock also for blobs nobody ever counted.
+        manager.bulk_create(
+            [ReferenciaMedia(nombre=name) for name in names], ignore_conflicts=True
+        )
+        libres = list(
+            manager.select_for_update()
+            .filter(nombre__in=names, total__lte=0)
+            .values_list("nombre", flat=True)
+        )
+        descartados = list(discard(libres)) if libres else []
+        manager.filter(nombre__in=names, total__lte=0).delete()
+    return descartados
+
+
+def _delete(storage, names):
+    for name in names:
+        storage.delete(name)
+    return names
+
+
+class ContentAddressedFieldFile(ImageFieldFile):
+    def save(self, name, content, save=True):
+        ext = posixpath.splitext(name)[1].lower()
+        digest = content_hash(content)
+        name = self.field.generate_filename(
+            self.instance, f"{digest[:2]}/{digest}{ext}"
+        )
+        using = router.db_for_write(type(self.instance))
+        # Joins the transaction of the model's save (AtomicSaveMixin) when
+        # called from pre_save; with save=True it spans the save itself.
+        with transaction.atomic(using=using, savepoint=False):
+            # Counted first: the row lock keeps a cleanup from deleting the
+            # blob between the check below and this row being saved.
+            ReferenciaMedia.objects.db_manager(using).sumar(name, 1)
+            # Same bytes, same name: reuse the stored blob instead of a copy.
+            if not self.storage.exists(name):
+                name = self.storage.save(
+                    name, content, max_length=self.field.max_length
+                )
+            self.name = name
+            setattr(self.instance, self.field.attname, self.name)
+            self._committed = True
+
+            if save:
+                self.instance.save()
+
+    save.alters_data = True
+
+
+class ContentAddressedImageField(models.ImageField):
+    """
+    ImageField that deduplicates uploads by content and cleans up orphans.
+    Models using it save through ``apps.core.models.AtomicSaveMixin``.
+    """
+
+    attr_class = ContentAddressedFieldFile
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if not cls._meta.abstract:
+            post_delete.connect(self.cleanup_on_delete, sender=cls)
+
+    def pre_save(self, model_instance, add):
+        file = getattr(model_instance, self.attname)
+        using = router.db_for_write(type(model_instance))
+        # Only a new upload or a cleared field can orphan the stored image.
+        previous = None
+        if not add and model_instance.pk and not (file and file._committed):
+            previous = (
+                type(model_instance)
+                ._base_manager.using(using)
+                .filter(pk=model_instance.pk)
+                .values_list(self.attname, flat=True)
+                .first()
+            )
+        file = super().pre_save(model_instance, add)
+        if previous:
+            # Also when the upload has the same name: it was counted again.
+            self.release(previous, using)
+        return file
+
+    def cleanup_on_delete(self, sender, instance, using, **kwargs):
+        file = getattr(instance, self.attname)
+        if file:
+            self.release(file.name, using)
+
+    def release(self, name, using):
+        """Drop one reference to ``name`` and delete it after commit if orphaned."""
+        if not is_content_addressed(name):
+            return
+        ReferenciaMedia.objects.db_manager(using).sumar(name, -1)
+        transaction.on_commit(
+            lambda: delete_if_orphaned(self.storage, name, using), using=using
+        )
@@ -0,0 +1,175 @@
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.cache import cc_delim_re, patch_vary_headers
+
+from . import compression, preload
+from .routers import use_primary
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+class ReplicaPinningMiddleware:
+    """
+    Read-your-writes stickiness for the primary/replica router.
+
+    Unsafe requests run pinned to the primary and leave a short-lived cookie
+    behind, so the redirect that follows a write (and anything else the
+    client requests before replication catches up) also reads from the
+    primary.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(settings, "REPLICA_PIN_COOKIE_NAME", "db_pin")
+        self.pin_seconds = getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+    def __call__(self, request):
+        is_write = request.method not in SAFE_METHODS
+        pinned = is_write or self.cookie_name in request.COOKIES
+
+        with use_primary(pinned):
+            response = self.get_response(request)
+
+        if is_write:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=self.pin_seconds,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class SessionRefreshMiddleware:
+    """
+    Sliding session expiry without a write on every request.
+
+    Replaces SESSION_SAVE_EVERY_REQUEST: the session (and its cookie) is only
+    saved again once less than SESSION_REFRESH_THRESHOLD seconds of its
+    lifetime remain. Must sit below SessionMiddleware.
+    """
+
+    TOUCHED_KEY = "_touched"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = getattr(
+            settings, "SESSION_REFRESH_THRESHOLD", settings.SESSION_COOKIE_AGE // 4
+        )
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        session = getattr(request, "session", None)
+        if session is None or session.is_empty():
+            return response
+
+        now = int(time.time())
+        if session.modified:
+            # Already being saved: record the touch for free.
+            session[self.TOUCHED_KEY] = now
+            return response
+
+        touched = session.get(self.TOUCHED_KEY)
+        # An unknown or expired cookie loads as an empty session without key.
+        if session.session_key is None:
+            return response
+        if (
+            touched is None
+            or now - touched >= session.get_expiry_age() - self.threshold
+        ):
+            session[self.TOUCHED_KEY] = now
+        return response
+
+
+class PreloadLinkMiddleware:
+    """
+    ``Link: rel=preload`` headers for the critical assets of HTML pages,
+    looked up by the response's template in the preload manifest
+    (apps.core.preload). A proxy in front (nginx, a CDN) can turn them into
+    103 Early Hints; WSGI cannot send informational responses itself.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.headers = None
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            response.status_code == 200
+            and not response.streaming
+            and "Link" not in response
+            and response.get("Content-Type", "").startswith("text/html")
+            and (header := self.link_header(response))
+        ):
+            response["Link"] = header
+        return response
+
+    def link_header(self, response):
+        if self.headers is None:
+            manifest = preload.load_manifest(staticfiles_storage)
+            self.headers = {
+                name: preload.link_header(assets) for name, assets in manifest.items()
+            }
+        names = getattr(response, "template_name", None) or []
+        if isinstance(names, str):
+            names = [names]
+        for name in [*names, preload.DEFAULT_TEMPLATE]:
+            if isinstance(name, str) and name in self.headers:
+                return self.headers[name]
+        return None
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses with brotli, zstd or gzip, whichever the client
+    prefers among the installed ones (apps.core.compression). Streaming,
+    already encoded and ``Cache-Control: no-transform`` responses are left
+    alone, and identical bodies reuse the bytes compressed for an earlier
+    response. Responses that may carry a secret (a CSRF token in the page,
+    a cookie) only use the padded codings.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_length = getattr(settings, "COMPRESSION_MIN_LENGTH", 200)
+        self.cache = compression.CompressedCache(
+            getattr(settings, "COMPRESSION_CACHE_BYTES", 8 * 1024 * 1024)
+        )
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or len(response.content) < self.min_length
+            or not compression.compressible(response.get("Content-Type", ""))
+            or "no-transform"
+            in cc_delim_re.split(response.get("Cache-Control", "").lower())
+        ):
+            return response
+
+        patch_vary_headers(response, ["Accept-Encoding"])
+        secret = request.META.get("CSRF_COOKIE_NEEDS_UPDATE") or response.cookies
+        coding = compression.negotiate(
+            request.headers.get("Accept-Encoding", ""),
+            compression.PADDED if secret else None,
+        )
+        if coding is None:
+            return response
+        compressed = self.cache.compress(coding, response.content)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = coding
+        # Same as GZipMiddleware: the encoded bytes differ, so a strong ETag
+        # of the identity body becomes weak.
+        if (etag := response.get("ETag")) and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        return response
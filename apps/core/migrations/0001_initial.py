@@ -0,0 +1,27 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenciaMedia",
+            fields=[
+                (
+                    "nombre",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("total", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Referencias de archivo",
+                "verbose_name_plural": "Referencias de archivos",
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+from collections import Counter
+
+from django.db import migrations
+from django.db.models import Count
+
+from apps.core.media import is_content_addressed
+
+IMAGE_FIELDS = [
+    ("empresa", "Empresa", "imagen"),
+    ("productos", "Producto", "imagen"),
+    ("trabajadores", "Trabajador", "imagen"),
+]
+
+
+def backfill_referencias(apps, schema_editor):
+    ReferenciaMedia = apps.get_model("core", "ReferenciaMedia")
+    using = schema_editor.connection.alias
+
+    totales = Counter()
+    for app_label, model_name, field in IMAGE_FIELDS:
+        model = apps.get_model(app_label, model_name)
+        for row in (
+            model._base_manager.using(using)
+            .exclude(**{field: ""})
+            .exclude(**{f"{field}__isnull": True})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("pk"))
+        ):
+            if is_content_addressed(row[field]):
+                totales[row[field]] += row["total"]
+
+    ReferenciaMedia.objects.using(using).all().delete()
+    ReferenciaMedia.objects.using(using).bulk_create(
+        ReferenciaMedia(nombre=name, total=total) for name, total in totales.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("empresa", "0002_content_addressed_imagen"),
+        ("productos", "0004_content_addressed_imagen"),
+        ("trabajadores", "0002_content_addressed_imagen"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_referencias, migrations.RunPython.noop),
+    ]
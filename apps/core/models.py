@@ -0,0 +1,69 @@
+from django.db import models, router, transaction
+from django.db.models import F
+
+
+class AtomicSaveMixin:
+    """
+    Run ``save()`` in one transaction, so counters that field ``pre_save``
+    hooks and ``post_save`` receivers keep (media references, facets) roll
+    back with a failed INSERT or UPDATE instead of drifting. Inside an
+    outer transaction it adds no savepoint.
+    """
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+
+    save.alters_data = True
+
+
+class ContadorManager(models.Manager):
+    def sumar(self, key, delta):
+        """
+        Add ``delta`` to the count of ``key`` with one F() update, creating
+        the row first when it is missing; concurrent first writers insert it
+        once and both updates apply.
+        """
+        if not self.filter(pk=key).update(total=F("total") + delta):
+            self.bulk_create([self.model(pk=key)], ignore_conflicts=True)
+            self.filter(pk=key).update(total=F("total") + delta)
+
+    def reemplazar(self, totales):
+        """Replace every count with ``totales`` ({key: total}) in one transaction."""
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            self.bulk_create(self.model(pk=key, total=n) for key, n in totales.items())
+        return len(totales)
+
+
+class Contador(models.Model):
+    """
+    A count per primary key that receivers keep up to date with
+    ``objects.db_manager(using).sumar(key, delta)``, so readers need no
+    aggregate; ``reemplazar`` rebuilds them all from a recount.
+    """
+
+    # Not unsigned: a count that drifted must not make deletes fail.
+    total = models.IntegerField(default=0)
+
+    objects = ContadorManager()
+
+    class Meta:
+        abstract = True
+
+
+class ReferenciaMedia(Contador):
+    """
+    Number of rows pointing at a content-addressed blob, kept up to date by
+    ``apps.core.media`` so orphan cleanup needs no scan of the image columns.
+    """
+
+    nombre = models.CharField(max_length=255, primary_key=True)
+
+    class Meta:
+        verbose_name = "Referencias de archivo"
+        verbose_name_plural = "Referencias de archivos"
+
+    def __str__(self):
+        return f"{self.nombre}: {self.total}"
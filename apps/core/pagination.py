@@ -0,0 +1,138 @@
+"""
+Keyset (seek) pagination.
+
+Pages are addressed by the sort key of their boundary row instead of an
+OFFSET, so the database seeks straight to the page through an index and
+page 500 costs the same as page 1. Cursors are opaque url-safe strings.
+"""
+
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import attrgetter, or_
+
+from django.core.exceptions import BadRequest, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+def encode_cursor(values, reverse=False):
+    payload = json.dumps([list(values), reverse], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, fields):
+    """
+    Return (values, reverse), each value converted with the model field it
+    seeks on, or raise BadRequest for a tampered cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values, reverse = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise BadRequest("Cursor inválido.") from exc
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise BadRequest("Cursor inválido.")
+    try:
+        # Sort keys are never NULL, and "x" must not reach an integer lookup.
+        values = [
+            field.to_python(value) if value is not None else None
+            for field, value in zip(fields, values)
+        ]
+    except (ValidationError, TypeError) as exc:
+        raise BadRequest("Cursor inválido.") from exc
+    if None in values:
+        raise BadRequest("Cursor inválido.")
+    return values, bool(reverse)
+
+
+def resolve_field(model, path):
+    """Model field a ``__``-separated ordering path ends at."""
+    *relations, name = path.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    return model._meta.pk if name == "pk" else model._meta.get_field(name)
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate ``queryset`` on ``ordering``, a tuple of ascending, non-null
+    field paths whose last entry is unique (usually the pk), e.g.
+    ``("nombre", "id")``. The database only seeks through an index on those
+    columns of the paginated table; an ordering through a join, such as
+    ``("producto__nombre", "producto_id")``, still avoids OFFSET but sorts
+    every row the filter matches.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.fields = [resolve_field(queryset.model, f) for f in self.ordering]
+        self.per_page = per_page
+        self._key = attrgetter(*(f.replace("__", ".") for f in self.ordering))
+
+    def key(self, obj):
+        value = self._key(obj)
+        return value if len(self.ordering) > 1 else (value,)
+
+    def seek(self, values, reverse):
+        # (a, b) > (x, y)  <=>  a > x OR (a = x AND b > y)
+        lookup = "lt" if reverse else "gt"
+        return reduce(
+            or_,
+            (
+                Q(
+                    **dict(zip(self.ordering[:i], values[:i])),
+                    **{f"{self.ordering[i]}__{lookup}": values[i]},
+                )
+                for i in range(len(self.ordering))
+            ),
+        )
+
+    def page(self, cursor=None):
+        values, reverse = (
+            decode_cursor(cursor, self.fields) if cursor else (None, False)
+        )
+        ordering = [f"-{f}" if reverse else f for f in self.ordering]
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self.seek(values, reverse))
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(self.key(rows[-1]))
+        if rows and has_previous:
+            previous_cursor = encode_cursor(self.key(rows[0]), reverse=True)
+        return KeysetPage(rows, next_cursor, previous_cursor)
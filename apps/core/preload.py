@@ -0,0 +1,116 @@
+"""
+Preload hints for the assets every page needs before first paint.
+
+The manifest maps each project template to the same-origin stylesheets,
+scripts and static images referenced by it and the templates it extends, in
+document order. Third-party assets (CDNs) are left to their tags: a preload
+whose CORS mode differs from the tag's is fetched a second time, and the
+connection to their origin is already warmed by ``rel=preconnect``. ``collectstatic`` writes it to the static files storage (see
+``PreloadStaticFilesStorage``) and ``apps.core.middleware.PreloadLinkMiddleware``
+turns it into ``Link: rel=preload`` headers.
+"""
+
+import json
+import re
+from urllib.parse import urlsplit
+
+from django.contrib.staticfiles.storage import StaticFilesStorage
+from django.core.files.base import ContentFile
+from django.template import engines
+from django.template.loader_tags import ExtendsNode
+from django.templatetags.static import static
+
+from .templating import template_names
+
+MANIFEST_NAME = "preload.json"
+
+# Every page extends base.html; responses without a template name use it.
+DEFAULT_TEMPLATE = "base.html"
+
+TAG = re.compile(r"<(link|script|img)\b([^>]*)>", re.IGNORECASE)
+ATTRIBUTE = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+STATIC_TAG = re.compile(r"""\{%\s*static\s+['"]([^'"]+)['"]\s*%\}""")
+
+
+def _url(value):
+    """
+    Resolve ``{% static %}``; None for URLs that depend on the context or
+    point at another origin.
+    """
+    value = STATIC_TAG.sub(lambda match: static(match[1]), value)
+    if not value or "{" in value or urlsplit(value).netloc:
+        return None
+    return value
+
+
+def assets(source):
+    """[(url, as)] of the same-origin assets in a template source."""
+    found = []
+    for tag, attributes in TAG.findall(source):
+        attributes = dict(ATTRIBUTE.findall(attributes))
+        tag = tag.lower()
+        if tag == "link" and "stylesheet" in attributes.get("rel", "").split():
+            url, kind = _url(attributes.get("href", "")), "style"
+        elif tag == "script":
+            url, kind = _url(attributes.get("src", "")), "script"
+        elif tag == "img" and STATIC_TAG.search(attributes.get("src", "")):
+            # Only static images: media depends on the page's data.
+            url, kind = _url(attributes["src"]), "image"
+        else:
+            continue
+        if url:
+            found.append((url, kind))
+    return found
+
+
+def template_assets(engine, name):
+    """Assets of ``name`` and its parent templates, outermost first."""
+    sources = []
+    while name:
+        template = engine.get_template(name)
+        sources.append(template.source)
+        extends = template.nodelist.get_nodes_by_type(ExtendsNode)
+        parent = extends[0].parent_name.var if extends else None
+        name = parent if isinstance(parent, str) else None
+    found = [asset for source in reversed(sources) for asset in assets(source)]
+    return list(dict.fromkeys(found))
+
+
+def build_manifest():
+    """{template name: [[url, as], ...]} for every template that has assets."""
+    engine = engines["django"].engine
+    manifest = {}
+    for name in template_names(engine):
+        if found := template_assets(engine, name):
+            manifest[name] = [list(asset) for asset in found]
+    return manifest
+
+
+def save_manifest(storage):
+    if storage.exists(MANIFEST_NAME):
+        storage.delete(MANIFEST_NAME)
+    storage.save(MANIFEST_NAME, ContentFile(json.dumps(build_manifest()).encode()))
+
+
+def load_manifest(storage):
+    """
+    The manifest collected into ``storage``, or one built from the templates
+    when static files have not been collected (development, tests).
+    """
+    if storage.exists(MANIFEST_NAME):
+        with storage.open(MANIFEST_NAME) as file:
+            return json.load(file)
+    return build_manifest()
+
+
+def link_header(assets):
+    return ", ".join(f"<{url}>; rel=preload; as={kind}" for url, kind in assets)
+
+
+class PreloadStaticFilesStorage(StaticFilesStorage):
+    """StaticFilesStorage that writes the preload manifest on collectstatic."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            save_manifest(self)
+        yield from ()
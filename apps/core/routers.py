@@ -0,0 +1,47 @@
+"""
+Primary/replica database routing.
+
+Reads go to one of the aliases listed in ``settings.DATABASE_REPLICAS`` and
+writes always go to ``default``. Code that must see its own writes (form
+views, the request right after a POST) runs inside ``use_primary()``.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY_DB = "default"
+
+_pinned = ContextVar("db_pinned_to_primary", default=False)
+
+
+@contextmanager
+def use_primary(enabled=True):
+    """Route every read inside the block to the primary database."""
+    token = _pinned.set(_pinned.get() or enabled)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = getattr(settings, "DATABASE_REPLICAS", [])
+        if _pinned.get() or not replicas:
+            return PRIMARY_DB
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary, so objects loaded from
+        # any of them may be related to each other.
+        return True
@@ -0,0 +1,205 @@
+"""
+S3-compatible object storage for media files (AWS S3, MinIO, R2...).
+
+Configure it through ``STORAGES["default"]["OPTIONS"]``. boto3 is an optional
+dependency (``uv sync --extra storage``) imported on first use.
+"""
+
+import mimetypes
+import posixpath
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from urllib.parse import quote
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+
+MB = 1024 * 1024
+
+
+@deconstructible(path="apps.core.storage.S3Storage")
+class S3Storage(Storage):
+    """
+    Storage backed by an S3-compatible bucket.
+
+    Files above ``multipart_threshold`` are uploaded in parts of
+    ``multipart_chunksize`` by up to ``max_concurrency`` threads. ``url()``
+    never performs I/O: it builds a CDN URL when ``custom_domain`` is set and
+    otherwise signs a presigned GET URL locally.
+    """
+
+    def __init__(
+        self,
+        bucket_name,
+        endpoint_url=None,
+        region_name=None,
+        access_key=None,
+        secret_key=None,
+        location="",
+        custom_domain=None,
+        url_protocol="https",
+        querystring_auth=True,
+        querystring_expire=3600,
+        multipart_threshold=8 * MB,
+        multipart_chunksize=8 * MB,
+        max_concurrency=8,
+        cache_control=None,
+    ):
+        self.bucket_name = bucket_name
+        self.endpoint_url = endpoint_url
+        self.region_name = region_name
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.location = location.strip("/")
+        self.custom_domain = custom_domain
+        self.url_protocol = url_protocol
+        self.querystring_auth = querystring_auth
+        self.querystring_expire = querystring_expire
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+        self.cache_control = cache_control
+
+    @cached_property
+    def client(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as exc:
+            raise ImproperlyConfigured(
+                "S3Storage requires boto3 (uv sync --extra storage)."
+            ) from exc
+        # Clients are thread-safe; the pool is sized for parallel uploads.
+        return boto3.session.Session().client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            region_name=self.region_name,
+            aws_access_key_id=self.access_key,
+            aws_secret_access_key=self.secret_key,
+            config=Config(
+                signature_version="s3v4",
+                max_pool_connections=self.max_concurrency * 2,
+            ),
+        )
+
+    @cached_property
+    def transfer_config(self):
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=self.multipart_chunksize,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _key(self, name):
+        name = name.replace("\\", "/").lstrip("/")
+        return posixpath.join(self.location, name) if self.location else name
+
+    def _head(self, name):
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.head_object(Bucket=self.bucket_name, Key=self._key(name))
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _open(self, name, mode="rb"):
+        if "w" in mode:
+            raise ValueError("S3Storage files are read-only; use save().")
+        body = tempfile.SpooledTemporaryFile(max_size=self.multipart_threshold)
+        self.client.download_fileobj(
+            self.bucket_name, self._key(name), body, Config=self.transfer_config
+        )
+        body.seek(0)
+        return File(body, name)
+
+    def _save(self, name, content):
+        extra = {
+            "ContentType": getattr(content, "content_type", None)
+            or mimetypes.guess_type(name)[0]
+            or "application/octet-stream"
+        }
+        if self.cache_control:
+            extra["CacheControl"] = self.cache_control
+        content.seek(0)
+        self.client.upload_fileobj(
+            content,
+            self.bucket_name,
+            self._key(name),
+            ExtraArgs=extra,
+            Config=self.transfer_config,
+        )
+        return name
+
+    def save_many(self, files, max_length=None):
+        """
+        Save several files (e.g. image derivatives) concurrently.
+        ``files`` maps names to content; returns the stored names in order.
+        """
+        items = list(files.items())
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(
+                pool.map(lambda item: self.save(*item, max_length=max_length), items)
+            )
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket_name, Key=self._key(name))
+
+    def exists(self, name):
+        return self._head(name) is not None
+
+    def size(self, name):
+        head = self._head(name)
+        if head is None:
+            raise FileNotFoundError(name)
+        return head["ContentLength"]
+
+    def get_modified_time(self, name):
+        head = self._head(name)
+        if head is None:
+            raise FileNotFoundError(name)
+        return head["LastModified"]
+
+    def listdir(self, path):
+        directories, files = self.listdir_modified(path)
+        return directories, [name for name, _ in files]
+
+    def listdir_modified(self, path):
+        """
+        Like ``listdir()``, but each file comes as a ``(name, modified time)``
+        pair taken from the same listing, without a HEAD request per file.
+        """
+        prefix = self._key(path).rstrip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        directories, files = [], []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=prefix, Delimiter="/"
+        ):
+            for entry in page.get("CommonPrefixes", ()):
+                directories.append(entry["Prefix"][len(prefix) :].rstrip("/"))
+            for entry in page.get("Contents", ()):
+                files.append((entry["Key"][len(prefix) :], entry["LastModified"]))
+        return directories, files
+
+    def url(self, name):
+        key = self._key(name)
+        if self.custom_domain:
+            return f"{self.url_protocol}://{self.custom_domain}/{quote(key)}"
+        if self.querystring_auth:
+            # Signed locally with the configured credentials, no request.
+            return self.client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket_name, "Key": key},
+                ExpiresIn=self.querystring_expire,
+            )
+        if self.endpoint_url:
+            endpoint = self.endpoint_url.rstrip("/")
+            return f"{endpoint}/{self.bucket_name}/{quote(key)}"
+        return f"https://{self.bucket_name}.s3.amazonaws.com/{quote(key)}"
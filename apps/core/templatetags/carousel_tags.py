@@ -0,0 +1,11 @@
+from django import template
+
+from apps.core import carousels
+
+register = template.Library()
+
+
+@register.simple_tag
+def carousel_images(carousel):
+    """``{% carousel_images "empresa" as images %}``: slides of settings.CAROUSELS."""
+    return carousels.imagenes(carousel)
@@ -0,0 +1,89 @@
+"""
+Tags for the ``shared/form_field.html`` and ``shared/image_field.html``
+field templates.
+
+An include pushes the whole page context and looks the template up again
+for every field. These tags parse their arguments once, at compile time,
+keep the compiled field template on the node, and render it in a context
+holding only its own arguments::
+
+    {% load form_tags %}
+    {% form_field form.nombre icon="fas fa-user" color="text-cosmetics-pink" col_class="col-md-6 mb-3" %}
+    {% image_field form.imagen object=object %}
+
+The templates stay the only copy of the markup.
+"""
+
+from django import template
+from django.template.base import token_kwargs
+
+register = template.Library()
+
+
+class FieldNode(template.Node):
+    """Base node: ``field`` plus keyword arguments resolved on render."""
+
+    template_name = None
+    required = ()
+    optional = ()
+
+    def __init__(self, field, kwargs):
+        self.field = field
+        self.kwargs = kwargs
+        self.field_template = None
+
+    @classmethod
+    def parse(cls, parser, token):
+        bits = token.split_contents()
+        tag_name = bits[0]
+        if len(bits) < 2:
+            raise template.TemplateSyntaxError(f"'{tag_name}' requires a form field.")
+        kwargs = token_kwargs(bits[2:], parser, support_legacy=False)
+        if len(kwargs) != len(bits) - 2:
+            raise template.TemplateSyntaxError(
+                f"'{tag_name}' only takes keyword arguments after the field."
+            )
+        if unknown := set(kwargs) - {*cls.required, *cls.optional}:
+            raise template.TemplateSyntaxError(
+                f"'{tag_name}' got unknown arguments: {', '.join(sorted(unknown))}."
+            )
+        if missing := set(cls.required) - set(kwargs):
+            raise template.TemplateSyntaxError(
+                f"'{tag_name}' requires: {', '.join(sorted(missing))}."
+            )
+        return cls(parser.compile_filter(bits[1]), kwargs)
+
+    def render(self, context):
+        values = {name: value.resolve(context) for name, value in self.kwargs.items()}
+        values["field"] = self.field.resolve(context)
+        if self.field_template is None:
+            # The node lives as long as the compiled page, so with the
+            # cached loader the field template is looked up once.
+            self.field_template = context.template.engine.get_template(
+                self.template_name
+            )
+        return self.field_template.render(context.new(self.get_context(values)))
+
+    def get_context(self, values):
+        return values
+
+
+class FormFieldNode(FieldNode):
+    template_name = "shared/form_field.html"
+    required = ("icon", "color")
+    optional = ("col_class", "help_text")
+
+
+class ImageFieldNode(FieldNode):
+    template_name = "shared/image_field.html"
+    optional = ("col_class", "help_text", "object")
+
+    def get_context(self, values):
+        # The current file is the object's attribute named like the field.
+        if obj := values.pop("object", None):
+            values["imagen"] = getattr(obj, values["field"].name, None)
+        return values
+
+
+register.tag("form_field", FormFieldNode.parse)
+register.tag("image_field", ImageFieldNode.parse)
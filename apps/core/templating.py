@@ -0,0 +1,42 @@
+"""
+Template warm-up for worker boot.
+
+With the cached loader every template is read and compiled once per
+process, on its first use. ``warm_templates`` does that ahead of time for
+every file under the project template directories (``DIRS``), so the first
+requests a worker serves do not pay for it. Call it before forking (e.g.
+from the WSGI module with gunicorn ``--preload``) to share the compiled
+templates between workers.
+"""
+
+import logging
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+
+def template_names(engine):
+    """Names of every file under the engine's DIRS, e.g. 'shared/pagination.html'."""
+    for directory in map(Path, engine.dirs):
+        for path in sorted(directory.rglob("*")):
+            if path.is_file():
+                yield path.relative_to(directory).as_posix()
+
+
+def warm_templates():
+    """Compile every project template; return how many were compiled."""
+    compiled = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for name in template_names(engine.engine):
+            try:
+                engine.get_template(name)
+            except TemplateSyntaxError:
+                logger.exception("No se pudo compilar la plantilla %s", name)
+            else:
+                compiled += 1
+    return compiled
@@ -0,0 +1,100 @@
+"""
+Uniqueness pre-checks for unique fields, before the form is submitted.
+
+Apps register their unique fields with ``registrar`` in ``ready()``; the
+check is an ``EXISTS`` on the field's unique index. "Free" answers are
+cached for a few seconds, since a user typing a cédula asks for the same
+values more than once; "taken" answers are never cached. Saving a
+registered model drops the entries for its values once the transaction
+commits, so a value taken by a new row is not reported free from the cache.
+Bulk writes send no signals and should call ``invalidar`` themselves; at
+worst a stale answer lives until it expires, and the database still
+rejects the duplicate on save. Entries are dropped from the default cache,
+so it has to be one every worker reads.
+
+The checks read the primary: a replica lagging behind a save would report
+the value free, and that answer would then be cached.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
+
+from .routers import use_primary
+
+# {name: (model, field name)} of the registered fields.
+CAMPOS = {}
+
+
+def timeout():
+    return getattr(settings, "UNICIDAD_CACHE_TIMEOUT", 30)
+
+
+def _key(campo, valor):
+    digest = hashlib.blake2b(valor.encode(), digest_size=16).hexdigest()
+    return f"unicidad:{campo}:{digest}"
+
+
+def registrar(model, *fields):
+    """Register unique ``fields`` of ``model`` under their own names."""
+    for field in fields:
+        if CAMPOS.get(field, (model, field)) != (model, field):
+            raise ValueError(f"Campo de unicidad duplicado: {field}")
+        CAMPOS[field] = (model, field)
+    post_save.connect(_invalidar_instancia, sender=model, weak=False)
+
+
+def existe(campo, valor, excluir=None):
+    """
+    Whether a row other than pk ``excluir`` already holds ``valor`` in the
+    registered field ``campo``.
+    """
+    key = _key(campo, valor)
+    if cache.get(key) is not None:
+        return False
+    model, field = CAMPOS[campo]
+    queryset = model._default_manager.filter(**{field: valor})
+    if excluir is not None:
+        queryset = queryset.exclude(pk=excluir)
+    with use_primary():
+        tomado = queryset.exists()
+    # Only an answer about every row can be shared with other callers.
+    if not tomado and excluir is None:
+        cache.set(key, False, timeout=timeout())
+    return tomado
+
+
+def existentes(campo, valores):
+    """The subset of ``valores`` already held by some row, in one query."""
+    valores = list(dict.fromkeys(valores))
+    keys = {_key(campo, valor): valor for valor in valores}
+    libres = {keys[key] for key in cache.get_many(keys)}
+    model, field = CAMPOS[campo]
+    if not (faltan := [valor for valor in valores if valor not in libres]):
+        return set()
+    with use_primary():
+        tomados = set(
+            model._default_manager.filter(**{f"{field}__in": faltan})
+            .order_by()
+            .values_list(field, flat=True)
+        )
+    cache.set_many(
+        {_key(campo, valor): False for valor in faltan if valor not in tomados},
+        timeout=timeout(),
+    )
+    return tomados
+
+
+def invalidar(campo, valores):
+    """Drop the cached answers for ``valores`` after the current transaction."""
+    keys = [_key(campo, valor) for valor in valores]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _invalidar_instancia(sender, instance, **kwargs):
+    for campo, (model, field) in CAMPOS.items():
+        if model is sender:
+            invalidar(campo, [getattr(instance, field)])
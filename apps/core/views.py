@@ -0,0 +1,66 @@
+from django.contrib import messages
+from django.shortcuts import redirect
+from django.views.generic import FormView
+
+from .routers import use_primary
+
+
+class PrimaryDatabaseMixin:
+    """Serve the whole view from the primary database, including its reads."""
+
+    def dispatch(self, request, *args, **kwargs):
+        with use_primary():
+            response = super().dispatch(request, *args, **kwargs)
+            # Template responses are rendered lazily by the handler; render
+            # here so queries made by the template stay on the primary too.
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+            return response
+
+
+class BulkActionView(PrimaryDatabaseMixin, FormView):
+    """
+    Two-step bulk action: the first POST previews how many rows the action
+    touches, the second (with ``confirmar``) runs it in one transaction.
+    """
+
+    model = None
+    template_name = "shared/bulk_confirm.html"
+    success_message = "{count} {verbose_name_plural} procesados: {accion}."
+
+    def get(self, request, *args, **kwargs):
+        return redirect(self.get_success_url())
+
+    def form_invalid(self, form):
+        for error in form.non_field_errors():
+            messages.error(self.request, error)
+        for field, errors in form.errors.items():
+            if field != "__all__":
+                messages.error(self.request, f"{form[field].label}: {errors[0]}")
+        return redirect(self.get_success_url())
+
+    def form_valid(self, form):
+        queryset = form.get_queryset(self.model)
+        total = queryset.count()
+
+        if "confirmar" not in self.request.POST:
+            return self.render_to_response(
+                self.get_context_data(form=form, total=total)
+            )
+
+        count = form.execute(queryset, total)
+        messages.success(
+            self.request,
+            self.success_message.format(
+                count=count,
+                verbose_name_plural=self.model._meta.verbose_name_plural.lower(),
+                accion=form.describe(),
+            ),
+        )
+        return redirect(self.get_success_url())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["verbose_name_plural"] = self.model._meta.verbose_name_plural
+        context["cancel_url"] = self.get_success_url()
+        return context
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class EmpresaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.empresa"
+
+    def ready(self):
+        from apps.core import unicidad
+
+        from .models import Empresa
+
+        unicidad.registrar(Empresa, "ruc")
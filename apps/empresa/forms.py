@@ -2,10 +2,14 @@ from datetime import datetime
 
 from django import forms
 
+from apps.core.forms import UniqueCheckMixin
+
 from .models import Empresa
 
 
-class EmpresaForm(forms.ModelForm):
+class EmpresaForm(UniqueCheckMixin, forms.ModelForm):
+    unique_check_fields = ("ruc",)
+
     class Meta:
         model = Empresa
         fields = [
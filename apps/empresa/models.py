@@ -4,15 +4,18 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 
+from apps.core.media import ContentAddressedImageField
+from apps.core.models import AtomicSaveMixin
 
-class Empresa(models.Model):
+
+class Empresa(AtomicSaveMixin, models.Model):
     nombre = models.CharField(max_length=200, verbose_name="Nombre")
     direccion = models.TextField(verbose_name="Dirección")
     mision = models.TextField(verbose_name="Misión")
     vision = models.TextField(verbose_name="Visión")
     anio_fundacion = models.IntegerField(verbose_name="Año de fundación")
     ruc = models.CharField(max_length=20, unique=True, verbose_name="RUC")
-    imagen = models.ImageField(
+    imagen = ContentAddressedImageField(
         upload_to="empresa/", blank=True, null=True, verbose_name="Imagen"
     )
 
@@ -5,6 +5,8 @@ from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic import CreateView, UpdateView, DeleteView
 
+from apps.core.views import PrimaryDatabaseMixin
+
 from .forms import EmpresaForm
 from .models import Empresa
 
@@ -18,7 +20,7 @@ class EmpresaView(View):
             return render(request, "empresa/no_info.html")
 
 
-class EmpresaCreateView(CreateView):
+class EmpresaCreateView(PrimaryDatabaseMixin, CreateView):
     model = Empresa
     form_class = EmpresaForm
     template_name = "empresa/create.html"
@@ -37,7 +39,7 @@ class EmpresaCreateView(CreateView):
         return super().form_valid(form)
 
 
-class EmpresaUpdateView(UpdateView):
+class EmpresaUpdateView(PrimaryDatabaseMixin, UpdateView):
     model = Empresa
     form_class = EmpresaForm
     template_name = "empresa/update.html"
@@ -53,7 +55,7 @@ class EmpresaUpdateView(UpdateView):
         return super().form_valid(form)
 
 
-class EmpresaDeleteView(DeleteView):
+class EmpresaDeleteView(PrimaryDatabaseMixin, DeleteView):
     model = Empresa
     template_name = "empresa/delete.html"
     success_url = reverse_lazy("empresa:detail")
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import connections, router
+
+from apps.inventario.models import MovimientoStock
+from apps.inventario.partitions import ensure_monthly_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Crea por adelantado las particiones mensuales del historial de "
+        "movimientos de stock (solo PostgreSQL). Programar con cron."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--meses",
+            type=int,
+            default=3,
+            help="Número de meses a crear a partir del mes actual.",
+        )
+
+    def handle(self, *args, meses, **options):
+        connection = connections[router.db_for_write(MovimientoStock)]
+        if connection.vendor != "postgresql":
+            self.stdout.write("La base de datos no usa particiones.")
+            return
+        created = ensure_monthly_partitions(connection, months=meses)
+        for name in created:
+            self.stdout.write(f"  {name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(created)} particiones creadas."))
@@ -0,0 +1,125 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:43
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+from apps.inventario.partitions import create_ledger_table, drop_ledger_table
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("productos", "0005_producto_proveedores"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Stock",
+            fields=[
+                (
+                    "producto",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stock",
+                        serialize=False,
+                        to="productos.producto",
+                    ),
+                ),
+                (
+                    "disponible",
+                    models.PositiveIntegerField(default=0, verbose_name="Disponible"),
+                ),
+                (
+                    "reservado",
+                    models.PositiveIntegerField(default=0, verbose_name="Reservado"),
+                ),
+                (
+                    "actualizado",
+                    models.DateTimeField(auto_now=True, verbose_name="Actualizado"),
+                ),
+            ],
+            options={
+                "verbose_name": "Stock",
+                "verbose_name_plural": "Stock",
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(("disponible__gte", 0)),
+                        name="stock_disponible_gte_0",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(("reservado__gte", 0)),
+                        name="stock_reservado_gte_0",
+                    ),
+                ],
+            },
+        ),
+        # The table is created by RunPython: PostgreSQL gets a monthly
+        # partitioned, append-only table.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="MovimientoStock",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "tipo",
+                            models.CharField(
+                                choices=[
+                                    ("ingreso", "Ingreso"),
+                                    ("reserva", "Reserva"),
+                                    ("liberacion", "Liberación"),
+                                    ("salida", "Salida"),
+                                ],
+                                max_length=12,
+                            ),
+                        ),
+                        (
+                            "cantidad",
+                            models.PositiveIntegerField(verbose_name="Cantidad"),
+                        ),
+                        ("referencia", models.CharField(blank=True, max_length=100)),
+                        (
+                            "creado",
+                            models.DateTimeField(
+                                default=django.utils.timezone.now, verbose_name="Fecha"
+                            ),
+                        ),
+                        (
+                            "producto",
+                            models.ForeignKey(
+                                db_constraint=False,
+                                db_index=False,
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="movimientos",
+                                to="productos.producto",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Movimiento de stock",
+                        "verbose_name_plural": "Movimientos de stock",
+                        "ordering": ["-creado"],
+                        "indexes": [
+                            models.Index(
+                                fields=["producto", "creado"],
+                                name="inventario_mov_prod_creado",
+                            )
+                        ],
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_ledger_table, drop_ledger_table),
+    ]
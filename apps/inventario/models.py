@@ -0,0 +1,91 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.productos.models import Producto
+
+
+class Stock(models.Model):
+    """Current stock of a product. Only changed through apps.inventario.stock."""
+
+    producto = models.OneToOneField(
+        Producto, on_delete=models.CASCADE, primary_key=True, related_name="stock"
+    )
+    disponible = models.PositiveIntegerField(default=0, verbose_name="Disponible")
+    reservado = models.PositiveIntegerField(default=0, verbose_name="Reservado")
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="Actualizado")
+
+    class Meta:
+        verbose_name = "Stock"
+        verbose_name_plural = "Stock"
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(disponible__gte=0), name="stock_disponible_gte_0"
+            ),
+            models.CheckConstraint(
+                condition=models.Q(reservado__gte=0), name="stock_reservado_gte_0"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.producto_id}: {self.disponible} (+{self.reservado} reservado)"
+
+
+class LedgerQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise TypeError("El historial de movimientos es de solo inserción.")
+
+    def delete(self):
+        raise TypeError("El historial de movimientos es de solo inserción.")
+
+    delete.queryset_only = True
+
+
+class MovimientoStock(models.Model):
+    """
+    Append-only stock ledger. On PostgreSQL the table is range-partitioned by
+    month on ``creado`` (see apps.inventario.partitions).
+    """
+
+    class Tipo(models.TextChoices):
+        INGRESO = "ingreso", "Ingreso"
+        RESERVA = "reserva", "Reserva"
+        LIBERACION = "liberacion", "Liberación"
+        SALIDA = "salida", "Salida"
+
+    # No database FK: ledger rows outlive deleted products. Lookups by product
+    # use the (producto, creado) index.
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="movimientos",
+    )
+    tipo = models.CharField(max_length=12, choices=Tipo.choices)
+    # Units moved; always positive, the direction follows ``tipo``.
+    cantidad = models.PositiveIntegerField(verbose_name="Cantidad")
+    referencia = models.CharField(max_length=100, blank=True)
+    creado = models.DateTimeField(default=timezone.now, verbose_name="Fecha")
+
+    objects = LedgerQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Movimiento de stock"
+        verbose_name_plural = "Movimientos de stock"
+        ordering = ["-creado"]
+        indexes = [
+            models.Index(
+                fields=["producto", "creado"], name="inventario_mov_prod_creado"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.get_tipo_display()} {self.cantidad} ({self.producto_id})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("El historial de movimientos es de solo inserción.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("El historial de movimientos es de solo inserción.")
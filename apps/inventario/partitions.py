@@ -0,0 +1,121 @@
+"""
+Monthly range partitioning of the stock ledger on PostgreSQL.
+
+The parent table is partitioned on ``creado`` with one partition per month
+plus a DEFAULT partition as a safety net. Partitions should exist before
+rows for their month arrive (``manage.py crear_particiones`` from cron);
+when a late run finds the month's rows already in DEFAULT, it moves them to
+the new partition in the same transaction. Old months can be detached or
+dropped without touching the live ones. A trigger
+rejects UPDATE and DELETE so the ledger stays append-only. Other databases
+get a plain table.
+"""
+
+from datetime import date
+
+from django.db import transaction
+
+TABLE = "inventario_movimientostock"
+DEFAULT = f"{TABLE}_default"
+
+CREATE_PARENT = f"""
+CREATE TABLE {TABLE} (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    producto_id bigint NOT NULL,
+    tipo varchar(12) NOT NULL,
+    cantidad integer NOT NULL CHECK (cantidad >= 0),
+    referencia varchar(100) NOT NULL,
+    creado timestamp with time zone NOT NULL,
+    PRIMARY KEY (id, creado)
+) PARTITION BY RANGE (creado);
+CREATE INDEX inventario_mov_prod_creado ON {TABLE} (producto_id, creado);
+CREATE TABLE {DEFAULT} PARTITION OF {TABLE} DEFAULT;
+CREATE FUNCTION {TABLE}_append_only() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'El historial de movimientos es de solo inserción';
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER {TABLE}_append_only
+    BEFORE UPDATE OR DELETE ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION {TABLE}_append_only();
+"""
+
+DROP_PARENT = f"""
+DROP TABLE IF EXISTS {TABLE} CASCADE;
+DROP FUNCTION IF EXISTS {TABLE}_append_only();
+"""
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_y{month.year}m{month.month:02d}"
+
+
+def ensure_monthly_partitions(connection, start=None, months=3):
+    """
+    Create the partitions for ``months`` months from ``start`` (default: the
+    current month). Idempotent; returns the names of the partitions created.
+    """
+    if connection.vendor != "postgresql":
+        return []
+    first = add_months(start or date.today(), 0)
+    created = []
+    with connection.cursor() as cursor:
+        for offset in range(months):
+            month = add_months(first, offset)
+            name = partition_name(month)
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+            with transaction.atomic(using=connection.alias):
+                create_partition(cursor, month)
+            created.append(name)
+    return created
+
+
+def create_partition(cursor, month):
+    bounds = [month, add_months(month, 1)]
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {DEFAULT} WHERE creado >= %s AND creado < %s)",
+        bounds,
+    )
+    if cursor.fetchone()[0]:
+        # PostgreSQL refuses a partition for rows DEFAULT already holds. Swap
+        # in an empty DEFAULT and insert the old one's rows again, so they
+        # land in the new partition; INSERT, unlike the DELETE this would
+        # otherwise need, passes the append-only trigger. The DETACH locks
+        # the ledger until the transaction commits.
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT}")
+        cursor.execute(f"ALTER TABLE {DEFAULT} RENAME TO {DEFAULT}_old")
+        cursor.execute(f"CREATE TABLE {DEFAULT} PARTITION OF {TABLE} DEFAULT")
+        cursor.execute(_create_sql(month), bounds)
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {DEFAULT}_old")
+        cursor.execute(f"DROP TABLE {DEFAULT}_old")
+    else:
+        cursor.execute(_create_sql(month), bounds)
+
+
+def _create_sql(month):
+    return (
+        f"CREATE TABLE {partition_name(month)} PARTITION OF {TABLE} "
+        "FOR VALUES FROM (%s) TO (%s)"
+    )
+
+
+def create_ledger_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.create_model(apps.get_model("inventario", "MovimientoStock"))
+        return
+    schema_editor.execute(CREATE_PARENT)
+    ensure_monthly_partitions(schema_editor.connection)
+
+
+def drop_ledger_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.delete_model(apps.get_model("inventario", "MovimientoStock"))
+        return
+    schema_editor.execute(DROP_PARENT)
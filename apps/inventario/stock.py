@@ -0,0 +1,96 @@
+"""
+Stock changes safe under concurrent orders.
+
+Every change is a single conditional UPDATE with F() expressions, e.g.
+``UPDATE ... SET disponible = disponible - 3 WHERE producto_id = 7 AND
+disponible >= 3``. The row lock taken by the UPDATE serialises concurrent
+writers and the WHERE clause is re-checked against the committed row, so
+there are no lost updates and stock never goes negative, without a
+SELECT ... FOR UPDATE round trip. Each change appends a ledger row in the
+same transaction.
+"""
+
+from django.db import router, transaction
+from django.db.models import F
+from django.db.models.functions import Now
+
+from .models import MovimientoStock, Stock
+
+Tipo = MovimientoStock.Tipo
+
+
+class StockInsuficiente(Exception):
+    """Raised when a product has less stock than requested."""
+
+    def __init__(self, producto_ids):
+        self.producto_ids = sorted(producto_ids)
+        super().__init__(f"Stock insuficiente para: {self.producto_ids}")
+
+
+def _apply(cantidades, tipo, referencia, guard, **changes):
+    """
+    Apply ``changes(cantidad)`` to every product in ``cantidades`` in one
+    transaction, or none if any row fails ``guard``.
+    """
+    cantidades = {pk: qty for pk, qty in cantidades.items() if qty}
+    if any(qty < 0 for qty in cantidades.values()):
+        raise ValueError("Las cantidades deben ser positivas.")
+    using = router.db_for_write(Stock)
+    with transaction.atomic(using=using):
+        faltantes = []
+        # Fixed pk order so concurrent multi-product orders cannot deadlock.
+        for pk in sorted(cantidades):
+            qty = cantidades[pk]
+            filters = {f"{guard}__gte": qty} if guard else {}
+            updated = (
+                Stock.objects.using(using)
+                .filter(producto_id=pk, **filters)
+                .update(
+                    actualizado=Now(),
+                    **{field: F(field) + sign * qty for field, sign in changes.items()},
+                )
+            )
+            if not updated:
+                faltantes.append(pk)
+        if faltantes:
+            raise StockInsuficiente(faltantes)
+        MovimientoStock.objects.using(using).bulk_create(
+            MovimientoStock(
+                producto_id=pk, tipo=tipo, cantidad=qty, referencia=referencia
+            )
+            for pk, qty in cantidades.items()
+        )
+
+
+def ingresar(cantidades, referencia=""):
+    """Add received units to the available stock."""
+    using = router.db_for_write(Stock)
+    with transaction.atomic(using=using):
+        Stock.objects.using(using).bulk_create(
+            [Stock(producto_id=pk) for pk in cantidades], ignore_conflicts=True
+        )
+        _apply(cantidades, Tipo.INGRESO, referencia, None, disponible=1)
+
+
+def reservar(cantidades, referencia=""):
+    """Move units from available to reserved (e.g. items in a pending order)."""
+    _apply(
+        cantidades, Tipo.RESERVA, referencia, "disponible", disponible=-1, reservado=1
+    )
+
+
+def liberar(cantidades, referencia=""):
+    """Return reserved units to the available stock (cancelled order)."""
+    _apply(
+        cantidades, Tipo.LIBERACION, referencia, "reservado", reservado=-1, disponible=1
+    )
+
+
+def confirmar(cantidades, referencia=""):
+    """Ship reserved units: they leave the reserved stock for good."""
+    _apply(cantidades, Tipo.SALIDA, referencia, "reservado", reservado=-1)
+
+
+def descontar(cantidades, referencia=""):
+    """Sell units straight from the available stock, without a reservation."""
+    _apply(cantidades, Tipo.SALIDA, referencia, "disponible", disponible=-1)
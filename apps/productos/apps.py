@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProductosConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.productos"
+
+    def ready(self):
+        # Connects the receivers that keep the price quote cache fresh.
+        from . import precios  # noqa: F401
@@ -1,5 +1,13 @@
+from decimal import ROUND_HALF_UP, Decimal
+
 from django import forms
+from django.db.models import DecimalField, ExpressionWrapper, F, Max, Min, Value
+from django.db.models.functions import Greatest, Least, Round
+
+from apps.core.bulk import bulk_update
+from apps.core.forms import BulkActionForm
 
+from . import precios
 from .models import Producto
 
 
@@ -40,3 +48,108 @@ class ProductoForm(forms.ModelForm):
         if precio <= 0:
             raise forms.ValidationError("El precio debe ser mayor que cero")
         return precio
+
+
+# Bounds of Producto.precio: clean_precio wants it above zero and the column
+# holds max_digits=10 with two decimals.
+PRECIO_MINIMO = Decimal("0.01")
+PRECIO_MAXIMO = Decimal("99999999.99")
+
+
+class ProductoBulkForm(BulkActionForm):
+    ACCION_CHOICES = [
+        ("precio", "Cambiar precio (%)"),
+        ("iva", "Reasignar IVA"),
+        *BulkActionForm.ACCION_CHOICES,
+    ]
+
+    porcentaje = forms.DecimalField(
+        label="Porcentaje",
+        required=False,
+        max_digits=5,
+        decimal_places=2,
+        min_value=Decimal("-99.99"),
+        max_value=Decimal("999.99"),
+        widget=forms.NumberInput(
+            attrs={
+                "class": "form-control form-control-sm",
+                "step": "0.01",
+                "placeholder": "% precio",
+            }
+        ),
+    )
+    iva = forms.TypedChoiceField(
+        label="IVA",
+        required=False,
+        coerce=int,
+        empty_value=None,
+        choices=[("", "IVA"), *Producto.IVA_CHOICES],
+        widget=forms.Select(attrs={"class": "form-select form-select-sm"}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        accion = cleaned_data.get("accion")
+        if accion == "precio" and cleaned_data.get("porcentaje") is None:
+            self.add_error("porcentaje", "Indique el porcentaje de cambio")
+        if accion == "iva" and cleaned_data.get("iva") is None:
+            self.add_error("iva", "Seleccione el IVA a asignar")
+        if accion == "precio" and not self.errors:
+            self.validar_precios()
+        return cleaned_data
+
+    def factor(self):
+        return 1 + self.cleaned_data["porcentaje"] / 100
+
+    def validar_precios(self):
+        """Reject a change that takes a selected price out of the column's range."""
+        extremos = self.get_queryset(Producto).aggregate(
+            minimo=Min("precio"), maximo=Max("precio")
+        )
+        if extremos["minimo"] is None:
+            return
+        factor = self.factor()
+        minimo, maximo = (
+            (extremos[extremo] * factor).quantize(PRECIO_MINIMO, ROUND_HALF_UP)
+            for extremo in ("minimo", "maximo")
+        )
+        if minimo < PRECIO_MINIMO:
+            self.add_error(
+                "porcentaje", "El cambio dejaría algún precio en cero o negativo"
+            )
+        elif maximo > PRECIO_MAXIMO:
+            self.add_error(
+                "porcentaje", f"El cambio dejaría algún precio sobre {PRECIO_MAXIMO}"
+            )
+
+    def apply(self, queryset, batch_size=None):
+        match self.cleaned_data["accion"]:
+            case "precio":
+                precio = ExpressionWrapper(
+                    F("precio") * Value(self.factor()),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                )
+                # clean() checked the selection; rows edited since then are
+                # clamped rather than left to fail the UPDATE.
+                values = {
+                    "precio": Least(
+                        Greatest(Round(precio, 2), Value(PRECIO_MINIMO)),
+                        Value(PRECIO_MAXIMO),
+                    )
+                }
+            case "iva":
+                values = {"iva": self.cleaned_data["iva"]}
+            case _:
+                return super().apply(queryset, batch_size=batch_size)
+        count = bulk_update(queryset, batch_size=batch_size, **values)
+        # queryset.update() sends no signals; drop every cached price quote.
+        precios.invalidar_todos()
+        return count
+
+    def describe(self):
+        match self.cleaned_data["accion"]:
+            case "precio":
+                return f"precio {self.cleaned_data['porcentaje']:+}%"
+            case "iva":
+                return f"IVA {self.cleaned_data['iva']}%"
+        return super().describe()
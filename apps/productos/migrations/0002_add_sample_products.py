@@ -2,6 +2,8 @@
 
 from django.db import migrations
 
+from apps.core.data_migrations import bulk_upsert
+
 
 def create_sample_products(apps, schema_editor):
     Producto = apps.get_model("productos", "Producto")
@@ -79,10 +81,13 @@ def create_sample_products(apps, schema_editor):
         },
     ]
 
-    for producto_data in productos_iniciales:
-        Producto.objects.get_or_create(
-            nombre=producto_data["nombre"], defaults=producto_data
-        )
+    # Insert-only, like get_or_create: existing products are left as they are
+    bulk_upsert(
+        Producto,
+        productos_iniciales,
+        key="nombre",
+        using=schema_editor.connection.alias,
+    )
 
 
 def remove_sample_products(apps, schema_editor):
@@ -99,7 +104,9 @@ def remove_sample_products(apps, schema_editor):
         "Delineador Líquido Negro",
         "Protector Solar Facial SPF 50",
     ]
-    Producto.objects.filter(nombre__in=nombres_productos).delete()
+    Producto.objects.using(schema_editor.connection.alias).filter(
+        nombre__in=nombres_productos
+    ).delete()
 
 
 class Migration(migrations.Migration):
@@ -2,6 +2,8 @@
 
 from django.db import migrations
 
+from apps.core.data_migrations import bulk_update_by_key
+
 
 def update_product_images(apps, schema_editor):
     Producto = apps.get_model("productos", "Producto")
@@ -20,14 +22,16 @@ def update_product_images(apps, schema_editor):
         "Protector Solar Facial SPF 50": "productos/samples/sunscreen.jpg",
     }
 
-    # Update each product with its corresponding image
-    for nombre, imagen_path in images_mapping.items():
-        try:
-            producto = Producto.objects.get(nombre=nombre)
-            producto.imagen = imagen_path
-            producto.save()
-        except Producto.DoesNotExist:
-            pass  # Product doesn't exist, skip
+    # Update each existing product with its corresponding image
+    bulk_update_by_key(
+        Producto,
+        "nombre",
+        {
+            nombre: {"imagen": imagen_path}
+            for nombre, imagen_path in images_mapping.items()
+        },
+        using=schema_editor.connection.alias,
+    )
 
 
 def remove_product_images(apps, schema_editor):
@@ -47,13 +51,12 @@ def remove_product_images(apps, schema_editor):
     ]
 
     # Remove images from products
-    for nombre in product_names:
-        try:
-            producto = Producto.objects.get(nombre=nombre)
-            producto.imagen = None
-            producto.save()
-        except Producto.DoesNotExist:
-            pass
+    bulk_update_by_key(
+        Producto,
+        "nombre",
+        {nombre: {"imagen": None} for nombre in product_names},
+        using=schema_editor.connection.alias,
+    )
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:39
+
+import apps.core.media
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("productos", "0003_update_product_images"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="producto",
+            name="imagen",
+            field=apps.core.media.ContentAddressedImageField(
+                blank=True, null=True, upload_to="productos/", verbose_name="Imagen"
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:41
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("productos", "0004_content_addressed_imagen"),
+        ("proveedores", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductoProveedor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "costo",
+                    models.DecimalField(
+                        decimal_places=2,
+                        max_digits=10,
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Costo",
+                    ),
+                ),
+                (
+                    "producto",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suministros",
+                        to="productos.producto",
+                    ),
+                ),
+                (
+                    "proveedor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suministros",
+                        to="proveedores.proveedor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Producto de proveedor",
+                "verbose_name_plural": "Productos de proveedores",
+            },
+        ),
+        migrations.AddField(
+            model_name="producto",
+            name="proveedores",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="productos",
+                through="productos.ProductoProveedor",
+                to="proveedores.proveedor",
+                verbose_name="Proveedores",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productoproveedor",
+            constraint=models.UniqueConstraint(
+                fields=("proveedor", "producto"), name="unique_proveedor_producto"
+            ),
+        ),
+    ]
@@ -2,8 +2,11 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
 
+from apps.core.media import ContentAddressedImageField
+from apps.core.models import AtomicSaveMixin
 
-class Producto(models.Model):
+
+class Producto(AtomicSaveMixin, models.Model):
     IVA_CHOICES = [
         (15, "15%"),
         (0, "0%"),
@@ -18,9 +21,16 @@ class Producto(models.Model):
         verbose_name="Precio",
     )
     iva = models.IntegerField(choices=IVA_CHOICES, verbose_name="IVA")
-    imagen = models.ImageField(
+    imagen = ContentAddressedImageField(
         upload_to="productos/", blank=True, null=True, verbose_name="Imagen"
     )
+    proveedores = models.ManyToManyField(
+        "proveedores.Proveedor",
+        through="ProductoProveedor",
+        related_name="productos",
+        blank=True,
+        verbose_name="Proveedores",
+    )
 
     class Meta:
         verbose_name = "Producto"
@@ -39,3 +49,32 @@ class Producto(models.Model):
 
     def get_absolute_url(self):
         return reverse("productos:detail", kwargs={"pk": self.pk})
+
+
+class ProductoProveedor(models.Model):
+    """Supplier catalogue entry: a product a supplier provides, at cost."""
+
+    producto = models.ForeignKey(
+        Producto, on_delete=models.CASCADE, related_name="suministros"
+    )
+    proveedor = models.ForeignKey(
+        "proveedores.Proveedor", on_delete=models.CASCADE, related_name="suministros"
+    )
+    costo = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[MinValueValidator(0)],
+        verbose_name="Costo",
+    )
+
+    class Meta:
+        verbose_name = "Producto de proveedor"
+        verbose_name_plural = "Productos de proveedores"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["proveedor", "producto"], name="unique_proveedor_producto"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.proveedor_id} - {self.producto_id}"
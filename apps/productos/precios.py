@@ -0,0 +1,104 @@
+"""
+Gross price quotes for many products at once.
+
+``cotizar`` answers from a short-lived per-product cache and fetches every
+miss with a single ``IN`` query. The gross price is computed in SQL in
+integer cents, with the IVA amount rounded half up like checkout, so no
+model instances are built and no float arithmetic is involved on any
+backend.
+
+Saves and deletes drop the product's entry once the transaction commits;
+bulk updates bump a generation number that is part of every key, which
+invalidates all entries at once. A read racing a write can at worst cache
+the old price until the entry expires. Both live in the default cache, which
+must be shared by every worker (``check --deploy`` warns about LocMemCache);
+a per-process cache would keep serving prices another worker invalidated.
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import BigIntegerField, F, Value
+from django.db.models.functions import Cast, Round
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Producto
+
+GENERACION_KEY = "precios:generacion"
+
+
+def timeout():
+    return getattr(settings, "PRECIOS_CACHE_TIMEOUT", 60)
+
+
+def _generacion():
+    return cache.get_or_set(GENERACION_KEY, 1, timeout=None)
+
+
+def _key(generacion, pk):
+    return f"precio:{generacion}:{pk}"
+
+
+def consultar(ids):
+    """``.values()`` rows with the gross price in cents for ``ids``."""
+    centavos = Cast(Round(F("precio") * 100), BigIntegerField())
+    return (
+        Producto.objects.filter(pk__in=ids)
+        .order_by()
+        .annotate(centavos=centavos)
+        .annotate(iva_centavos=(F("centavos") * F("iva") + Value(50)) / Value(100))
+        .values("id", "precio", "iva", con_iva=F("centavos") + F("iva_centavos"))
+    )
+
+
+def cotizar(ids):
+    """
+    {pk: {"precio", "iva", "precio_con_iva"}} for the products in ``ids``
+    that exist.
+    """
+    ids = list(dict.fromkeys(ids))
+    generacion = _generacion()
+    keys = {_key(generacion, pk): pk for pk in ids}
+    cotizaciones = {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+    if faltan := [pk for pk in ids if pk not in cotizaciones]:
+        nuevas = {
+            row["id"]: {
+                "precio": row["precio"],
+                "iva": row["iva"],
+                "precio_con_iva": Decimal(row["con_iva"]).scaleb(-2),
+            }
+            for row in consultar(faltan)
+        }
+        cache.set_many(
+            {_key(generacion, pk): value for pk, value in nuevas.items()},
+            timeout=timeout(),
+        )
+        cotizaciones.update(nuevas)
+    return cotizaciones
+
+
+def invalidar(pk):
+    """Drop the cached quote of one product after the current transaction."""
+    transaction.on_commit(lambda: cache.delete(_key(_generacion(), pk)))
+
+
+def invalidar_todos():
+    """Invalidate every cached quote (after bulk updates) on commit."""
+
+    def bump():
+        try:
+            cache.incr(GENERACION_KEY)
+        except ValueError:
+            cache.set(GENERACION_KEY, 1, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=Producto)
+@receiver(post_delete, sender=Producto)
+def invalidar_producto(sender, instance, **kwargs):
+    invalidar(instance.pk)
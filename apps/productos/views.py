@@ -1,8 +1,12 @@
 from django.contrib import messages
+from django.db.models import Prefetch
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
-from .forms import ProductoForm
+from apps.core.views import BulkActionView, PrimaryDatabaseMixin
+from apps.proveedores.models import Proveedor
+
+from .forms import ProductoBulkForm, ProductoForm
 from .models import Producto
 
 
@@ -12,8 +16,24 @@ class ProductoListView(ListView):
     context_object_name = "productos"
     paginate_by = 12
 
+    def get_queryset(self):
+        # Stock is joined; supplier names take one extra query for the page.
+        return (
+            super()
+            .get_queryset()
+            .select_related("stock")
+            .prefetch_related(
+                Prefetch("proveedores", queryset=Proveedor.objects.only("nombre"))
+            )
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["bulk_form"] = ProductoBulkForm()
+        return context
 
-class ProductoCreateView(CreateView):
+
+class ProductoCreateView(PrimaryDatabaseMixin, CreateView):
     model = Producto
     form_class = ProductoForm
     template_name = "productos/create.html"
@@ -24,7 +44,7 @@ class ProductoCreateView(CreateView):
         return super().form_valid(form)
 
 
-class ProductoUpdateView(UpdateView):
+class ProductoUpdateView(PrimaryDatabaseMixin, UpdateView):
     model = Producto
     form_class = ProductoForm
     template_name = "productos/update.html"
@@ -35,7 +55,7 @@ class ProductoUpdateView(UpdateView):
         return super().form_valid(form)
 
 
-class ProductoDeleteView(DeleteView):
+class ProductoDeleteView(PrimaryDatabaseMixin, DeleteView):
     model = Producto
     template_name = "productos/delete.html"
     success_url = reverse_lazy("productos:list")
@@ -43,3 +63,9 @@ class ProductoDeleteView(DeleteView):
     def delete(self, request, *args, **kwargs):
         messages.success(self.request, "Producto eliminado exitosamente.")
         return super().delete(request, *args, **kwargs)
+
+
+class ProductoBulkView(BulkActionView):
+    model = Producto
+    form_class = ProductoBulkForm
+    success_url = reverse_lazy("productos:list")
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProveedoresConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.proveedores"
+
+    def ready(self):
+        # Connects the receivers that keep the country counts up to date.
+        from . import facetas  # noqa: F401
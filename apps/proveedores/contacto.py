@@ -0,0 +1,68 @@
+"""
+Canonical supplier contact details, for finding duplicates.
+
+``Proveedor.save`` stores the phone in E.164 (``+593221234567``) and the
+address lower-cased next to what the user typed, in indexed columns, so
+``duplicados`` is a GROUP BY over an index instead of normalising every
+row in Python.
+"""
+
+from django.db.models import Count
+
+from . import paises
+
+# E.164 allows at most 15 digits; shorter than 8 is not a full number.
+MIN_DIGITOS = 8
+MAX_DIGITOS = 15
+
+CAMPOS = {"telefono": "telefono_e164", "correo": "correo_normalizado"}
+
+
+def telefono_e164(telefono, pais_codigo=""):
+    """
+    ``telefono`` in E.164, or "" when it cannot be made one. Numbers without
+    a "+" or "00" international prefix take the calling code of
+    ``pais_codigo``, dropping its national trunk prefix (``paises.TRONCALES``).
+    """
+    telefono = (telefono or "").strip()
+    digitos = "".join(filter(str.isdigit, telefono))
+    if telefono.startswith("+"):
+        pass
+    elif digitos.startswith("00"):
+        digitos = digitos[2:]
+    elif prefijo := paises.PREFIJOS.get(pais_codigo):
+        digitos = prefijo + digitos.removeprefix(paises.TRONCALES.get(pais_codigo, "0"))
+    else:
+        return ""
+    if not MIN_DIGITOS <= len(digitos) <= MAX_DIGITOS or digitos.startswith("0"):
+        return ""
+    return f"+{digitos}"
+
+
+def correo_normalizado(correo):
+    return (correo or "").strip().lower()
+
+
+def duplicados(queryset, campo):
+    """
+    ``{clave: [(pk, nombre), ...]}`` of the canonical ``campo`` values
+    ("telefono" or "correo") that more than one row of ``queryset`` shares.
+    """
+    columna = CAMPOS[campo]
+    claves = list(
+        queryset.exclude(**{columna: ""})
+        .order_by()
+        .values(columna)
+        .annotate(filas=Count("pk"))
+        .filter(filas__gt=1)
+        .values_list(columna, flat=True)
+    )
+    grupos = {clave: [] for clave in claves}
+    filas = (
+        queryset.filter(**{f"{columna}__in": claves})
+        .order_by(columna, "pk")
+        .values_list(columna, "pk", "nombre")
+    )
+    for clave, pk, nombre in filas.iterator(chunk_size=2000):
+        grupos[clave].append((pk, nombre))
+    return grupos
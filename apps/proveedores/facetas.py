@@ -0,0 +1,128 @@
+"""
+Supplier counts per country for the list filter.
+
+The counts live in ``FacetaPais`` and are adjusted by one row on every save
+and delete of a supplier, inside the transaction that ``AtomicSaveMixin``
+or the delete collector opens, so they never need a GROUP BY over the
+suppliers. A ``delete()`` of many suppliers is tallied
+while the collector announces its rows and applied as one update per
+country once they are gone. The list reads the counts from the cache,
+refilled from the primary; any change drops the cached copy once the
+transaction commits, in the shared default cache, so other workers see the
+drop too. A read racing a write can at worst cache the old counts until the
+entry expires.
+
+Writes that bypass the model (``QuerySet.update``, raw SQL) leave the
+counts behind: rebuild them with ``manage.py recalcular_facetas``.
+"""
+
+from collections import Counter
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.core.routers import use_primary
+
+from . import paises
+from .models import FacetaPais, Proveedor
+
+CACHE_KEY = "proveedores:facetas:pais"
+
+# {delete() origin: [Counter of deltas, rows not deleted yet]}
+_eliminando = WeakKeyDictionary()
+
+
+def timeout():
+    return getattr(settings, "FACETAS_CACHE_TIMEOUT", 300)
+
+
+def por_pais():
+    """[{"codigo", "nombre", "total"}] of the recognised countries, largest first."""
+    return cache.get_or_set(CACHE_KEY, _consultar, timeout=timeout())
+
+
+def _consultar():
+    # A lagging replica would cache counts older than the write that just
+    # invalidated them.
+    with use_primary():
+        facetas = [
+            {"codigo": codigo, "nombre": paises.nombre(codigo), "total": total}
+            for codigo, total in FacetaPais.objects.filter(total__gt=0)
+            .exclude(codigo="")
+            .values_list("codigo", "total")
+        ]
+    return sorted(facetas, key=lambda faceta: (-faceta["total"], faceta["nombre"]))
+
+
+def recalcular(using=None):
+    """Rebuild every count from the suppliers; return the number of codes."""
+    using = using or router.db_for_write(FacetaPais)
+    totales = dict(
+        Proveedor.objects.using(using)
+        .order_by()
+        .values_list("pais_codigo")
+        .annotate(total=Count("pk"))
+    )
+    total = FacetaPais.objects.db_manager(using).reemplazar(totales)
+    invalidar(using)
+    return total
+
+
+def invalidar(using=None):
+    transaction.on_commit(lambda: cache.delete(CACHE_KEY), using=using)
+
+
+@receiver(pre_save, sender=Proveedor)
+def recordar_pais(sender, instance, raw, using, **kwargs):
+    # Rows loaded with pais_codigo deferred do not know their stored code.
+    if not instance._state.adding and not hasattr(instance, "_pais_codigo_guardado"):
+        instance._pais_codigo_guardado = (
+            sender.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("pais_codigo", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Proveedor)
+def contar_guardado(sender, instance, created, using, **kwargs):
+    anterior = None if created else getattr(instance, "_pais_codigo_guardado", None)
+    if anterior != instance.pais_codigo:
+        if anterior is not None:
+            FacetaPais.objects.db_manager(using).sumar(anterior, -1)
+        FacetaPais.objects.db_manager(using).sumar(instance.pais_codigo, 1)
+        invalidar(using)
+    instance._pais_codigo_guardado = instance.pais_codigo
+
+
+@receiver(pre_delete, sender=Proveedor)
+def anotar_eliminado(sender, instance, origin, **kwargs):
+    # The collector sends every pre_delete of a delete() before its first
+    # DELETE and every post_delete after it, so the last post_delete of an
+    # origin can apply the whole tally.
+    if origin is None:
+        return
+    pendiente = _eliminando.setdefault(origin, [Counter(), 0])
+    pendiente[0][instance.pais_codigo] -= 1
+    pendiente[1] += 1
+
+
+@receiver(post_delete, sender=Proveedor)
+def contar_eliminado(sender, instance, using, origin, **kwargs):
+    pendiente = _eliminando.get(origin) if origin is not None else None
+    if pendiente is None:
+        FacetaPais.objects.db_manager(using).sumar(instance.pais_codigo, -1)
+        invalidar(using)
+        return
+    pendiente[1] -= 1
+    if pendiente[1]:
+        return
+    del _eliminando[origin]
+    for codigo, delta in pendiente[0].items():
+        FacetaPais.objects.db_manager(using).sumar(codigo, delta)
+    invalidar(using)
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from apps.proveedores.contacto import CAMPOS, duplicados
+from apps.proveedores.models import Proveedor
+
+
+class Command(BaseCommand):
+    help = "Lista los proveedores que comparten teléfono (E.164) o correo normalizado."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--campo",
+            choices=sorted(CAMPOS),
+            action="append",
+            help="Campo a comparar; por defecto, todos.",
+        )
+        parser.add_argument(
+            "--limite",
+            type=int,
+            default=50,
+            help="Grupos mostrados por campo (0: todos).",
+        )
+
+    def handle(self, *args, campo, limite, **options):
+        for nombre in campo or sorted(CAMPOS):
+            grupos = duplicados(Proveedor.objects.all(), nombre)
+            filas = sum(map(len, grupos.values()))
+            self.stdout.write(
+                f"{nombre}: {len(grupos)} valores repetidos en {filas} proveedores"
+            )
+            for clave, proveedores in list(grupos.items())[: limite or None]:
+                self.stdout.write(f"  {clave}")
+                for pk, proveedor in proveedores:
+                    self.stdout.write(f"    #{pk} {proveedor}")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.proveedores.facetas import recalcular
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula el número de proveedores por país a partir de los "
+        "proveedores registrados."
+    )
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        paises = recalcular()
+        self.stdout.write(
+            self.style.SUCCESS(f"Conteos recalculados para {paises} países.")
+        )
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("proveedores", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FacetaPais",
+            fields=[
+                (
+                    "codigo",
+                    models.CharField(max_length=2, primary_key=True, serialize=False),
+                ),
+                ("total", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Proveedores por país",
+                "verbose_name_plural": "Proveedores por país",
+            },
+        ),
+        migrations.AddField(
+            model_name="proveedor",
+            name="pais_codigo",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=2,
+                verbose_name="Código de país",
+            ),
+        ),
+    ]
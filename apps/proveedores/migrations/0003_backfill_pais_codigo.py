@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count
+
+from apps.core.data_migrations import batched_backfill
+from apps.proveedores import paises
+
+
+def backfill_pais_codigo(apps, schema_editor):
+    Proveedor = apps.get_model("proveedores", "Proveedor")
+    FacetaPais = apps.get_model("proveedores", "FacetaPais")
+    using = schema_editor.connection.alias
+
+    def apply(batch):
+        por_codigo = defaultdict(list)
+        for pk, pais in batch.values_list("pk", "pais"):
+            por_codigo[paises.codigo(pais)].append(pk)
+        for codigo, pks in por_codigo.items():
+            if codigo:
+                batch.filter(pk__in=pks).update(pais_codigo=codigo)
+
+    # Unrecognised names stay "" and are looked at again on a rerun.
+    batched_backfill(
+        Proveedor.objects.using(using).filter(pais_codigo=""),
+        apply,
+        label="pais_codigo",
+    )
+
+    FacetaPais.objects.using(using).all().delete()
+    FacetaPais.objects.using(using).bulk_create(
+        FacetaPais(codigo=row["pais_codigo"], total=row["total"])
+        for row in Proveedor.objects.using(using)
+        .order_by()
+        .values("pais_codigo")
+        .annotate(total=Count("pk"))
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("proveedores", "0002_pais_codigo"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_pais_codigo, migrations.RunPython.noop),
+    ]
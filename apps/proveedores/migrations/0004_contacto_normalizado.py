@@ -0,0 +1,35 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("proveedores", "0003_backfill_pais_codigo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="proveedor",
+            name="correo_normalizado",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=254,
+                verbose_name="Correo normalizado",
+            ),
+        ),
+        migrations.AddField(
+            model_name="proveedor",
+            name="telefono_e164",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=16,
+                verbose_name="Teléfono (E.164)",
+            ),
+        ),
+    ]
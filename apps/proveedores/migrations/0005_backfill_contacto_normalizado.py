@@ -0,0 +1,42 @@
+from django.db import migrations
+
+from apps.core.data_migrations import batched_backfill
+from apps.proveedores import contacto
+
+
+def backfill_contacto(apps, schema_editor):
+    Proveedor = apps.get_model("proveedores", "Proveedor")
+
+    def apply(batch):
+        proveedores = [
+            Proveedor(
+                pk=pk,
+                telefono_e164=contacto.telefono_e164(telefono, pais_codigo),
+                correo_normalizado=contacto.correo_normalizado(correo),
+            )
+            for pk, telefono, pais_codigo, correo in batch.values_list(
+                "pk", "telefono", "pais_codigo", "correo"
+            )
+        ]
+        batch.bulk_update(proveedores, ["telefono_e164", "correo_normalizado"])
+
+    # correo is required, so every row that still needs work has it empty.
+    batched_backfill(
+        Proveedor.objects.using(schema_editor.connection.alias).filter(
+            correo_normalizado=""
+        ),
+        apply,
+        label="contacto",
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("proveedores", "0004_contacto_normalizado"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_contacto, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,45 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.urls import reverse
 
+from apps.core.models import AtomicSaveMixin, Contador
 
-class Proveedor(models.Model):
+from . import contacto, paises
+
+# Columns computed in save() from the fields users edit.
+DERIVADOS = {
+    "pais": {"pais_codigo", "telefono_e164"},
+    "telefono": {"telefono_e164"},
+    "correo": {"correo_normalizado"},
+}
+
+
+class Proveedor(AtomicSaveMixin, models.Model):
     nombre = models.CharField(max_length=200, verbose_name="Nombre")
     descripcion = models.TextField(verbose_name="Descripción")
     telefono = models.CharField(max_length=20, verbose_name="Teléfono")
     pais = models.CharField(max_length=100, verbose_name="País")
+    pais_codigo = models.CharField(
+        max_length=2,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name="Código de país",
+    )
+    telefono_e164 = models.CharField(
+        max_length=16,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name="Teléfono (E.164)",
+    )
     correo = models.EmailField(verbose_name="Correo electrónico")
+    correo_normalizado = models.CharField(
+        max_length=254,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name="Correo normalizado",
+    )
     direccion = models.TextField(verbose_name="Dirección")
 
     class Meta:
@@ -18,5 +50,59 @@ class Proveedor(models.Model):
     def __str__(self):
         return self.nombre
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored code, so a save can move the row between facet counts.
+        if "pais_codigo" in instance.__dict__:
+            instance._pais_codigo_guardado = instance.pais_codigo
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.pais_codigo = paises.codigo(self.pais)
+        self.telefono_e164 = contacto.telefono_e164(self.telefono, self.pais_codigo)
+        self.correo_normalizado = contacto.correo_normalizado(self.correo)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields).union(
+                *(DERIVADOS.get(name, ()) for name in update_fields)
+            )
+        super().save(*args, **kwargs)
+
+    def sincronizar_catalogo(self, costos):
+        """
+        Replace this supplier's catalogue with ``costos`` ({producto_id: costo})
+        using one upsert and one delete.
+        """
+        ProductoProveedor = self.suministros.model
+        db = router.db_for_write(ProductoProveedor)
+        with transaction.atomic(using=db):
+            ProductoProveedor.objects.using(db).bulk_create(
+                [
+                    ProductoProveedor(proveedor=self, producto_id=pk, costo=costo)
+                    for pk, costo in costos.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["proveedor", "producto"],
+                update_fields=["costo"],
+            )
+            self.suministros.using(db).exclude(producto_id__in=list(costos)).delete()
+
     def get_absolute_url(self):
         return reverse("proveedores:detail", kwargs={"pk": self.pk})
+
+
+class FacetaPais(Contador):
+    """
+    Number of suppliers per country code, kept up to date by
+    ``apps.proveedores.facetas`` so the list filter needs no GROUP BY.
+    """
+
+    codigo = models.CharField(max_length=2, primary_key=True)
+
+    class Meta:
+        verbose_name = "Proveedores por país"
+        verbose_name_plural = "Proveedores por país"
+
+    def __str__(self):
+        return f"{paises.nombre(self.codigo)}: {self.total}"
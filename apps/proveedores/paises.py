@@ -0,0 +1,168 @@
+"""
+Country names to ISO 3166-1 alpha-2 codes.
+
+``Proveedor.pais`` stays the free text the user typed; ``codigo`` maps it
+to the code stored in ``Proveedor.pais_codigo``, which is what filters and
+counts group by. Matching ignores case, accents and punctuation, and knows
+the usual Spanish and English names and abbreviations of the countries
+suppliers come from. Unknown names map to "".
+"""
+
+import re
+import unicodedata
+
+# {code: Spanish name}, also the labels shown in the list filter.
+NOMBRES = {
+    "AR": "Argentina",
+    "AU": "Australia",
+    "BE": "Bélgica",
+    "BO": "Bolivia",
+    "BR": "Brasil",
+    "CA": "Canadá",
+    "CH": "Suiza",
+    "CL": "Chile",
+    "CN": "China",
+    "CO": "Colombia",
+    "CR": "Costa Rica",
+    "CU": "Cuba",
+    "DE": "Alemania",
+    "DO": "República Dominicana",
+    "EC": "Ecuador",
+    "ES": "España",
+    "FR": "Francia",
+    "GB": "Reino Unido",
+    "GT": "Guatemala",
+    "HN": "Honduras",
+    "IN": "India",
+    "IT": "Italia",
+    "JP": "Japón",
+    "KR": "Corea del Sur",
+    "MX": "México",
+    "NI": "Nicaragua",
+    "NL": "Países Bajos",
+    "PA": "Panamá",
+    "PE": "Perú",
+    "PT": "Portugal",
+    "PY": "Paraguay",
+    "SE": "Suecia",
+    "SV": "El Salvador",
+    "TH": "Tailandia",
+    "TR": "Turquía",
+    "US": "Estados Unidos",
+    "UY": "Uruguay",
+    "VE": "Venezuela",
+}
+
+# International calling codes, for numbers typed without one.
+PREFIJOS = {
+    "AR": "54",
+    "AU": "61",
+    "BE": "32",
+    "BO": "591",
+    "BR": "55",
+    "CA": "1",
+    "CH": "41",
+    "CL": "56",
+    "CN": "86",
+    "CO": "57",
+    "CR": "506",
+    "CU": "53",
+    "DE": "49",
+    "DO": "1",
+    "EC": "593",
+    "ES": "34",
+    "FR": "33",
+    "GB": "44",
+    "GT": "502",
+    "HN": "504",
+    "IN": "91",
+    "IT": "39",
+    "JP": "81",
+    "KR": "82",
+    "MX": "52",
+    "NI": "505",
+    "NL": "31",
+    "PA": "507",
+    "PE": "51",
+    "PT": "351",
+    "PY": "595",
+    "SE": "46",
+    "SV": "503",
+    "TH": "66",
+    "TR": "90",
+    "US": "1",
+    "UY": "598",
+    "VE": "58",
+}
+
+# National trunk prefixes that differ from "0": the North American "1",
+# and Italy, whose numbers keep their leading 0 after the calling code.
+TRONCALES = {
+    "CA": "1",
+    "DO": "1",
+    "IT": "",
+    "US": "1",
+}
+
+# Other spellings, keyed like ``_clave`` leaves them.
+ALIAS = {
+    "alemania": "DE",
+    "germany": "DE",
+    "belgium": "BE",
+    "brazil": "BR",
+    "canada": "CA",
+    "switzerland": "CH",
+    "corea": "KR",
+    "corea del sur": "KR",
+    "south korea": "KR",
+    "korea": "KR",
+    "dominican republic": "DO",
+    "spain": "ES",
+    "france": "FR",
+    "reino unido": "GB",
+    "inglaterra": "GB",
+    "gran bretana": "GB",
+    "united kingdom": "GB",
+    "england": "GB",
+    "uk": "GB",
+    "italy": "IT",
+    "japan": "JP",
+    "mexico": "MX",
+    "holanda": "NL",
+    "netherlands": "NL",
+    "holland": "NL",
+    "peru": "PE",
+    "sweden": "SE",
+    "thailand": "TH",
+    "turkey": "TR",
+    "estados unidos": "US",
+    "estados unidos de america": "US",
+    "eeuu": "US",
+    "ee uu": "US",
+    "usa": "US",
+    "united states": "US",
+    "united states of america": "US",
+}
+
+
+def _clave(texto):
+    """Lower case without accents, punctuation or repeated spaces."""
+    texto = unicodedata.normalize("NFKD", texto)
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]", " ", texto.lower()).split())
+
+
+_CODIGOS = {
+    **{_clave(nombre): codigo for codigo, nombre in NOMBRES.items()},
+    **{codigo.lower(): codigo for codigo in NOMBRES},
+    **ALIAS,
+}
+
+
+def codigo(pais):
+    """ISO alpha-2 code of the country named ``pais``, or ""."""
+    return _CODIGOS.get(_clave(pais or ""), "")
+
+
+def nombre(codigo):
+    return NOMBRES.get(codigo, codigo)
@@ -7,6 +7,8 @@ app_name = "proveedores"
 urlpatterns = [
     path("", views.ProveedorListView.as_view(), name="list"),
     path("create/", views.ProveedorCreateView.as_view(), name="create"),
+    path("bulk/", views.ProveedorBulkView.as_view(), name="bulk"),
+    path("<int:pk>/", views.ProveedorDetailView.as_view(), name="detail"),
     path("<int:pk>/update/", views.ProveedorUpdateView.as_view(), name="update"),
     path("<int:pk>/delete/", views.ProveedorDeleteView.as_view(), name="delete"),
 ]
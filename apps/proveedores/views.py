@@ -1,7 +1,18 @@
 from django.contrib import messages
 from django.urls import reverse_lazy
-from django.views.generic import CreateView, DeleteView, ListView, UpdateView
+from django.views.generic import (
+    CreateView,
+    DeleteView,
+    DetailView,
+    ListView,
+    UpdateView,
+)
 
+from apps.core.forms import BulkActionForm
+from apps.core.pagination import KeysetPaginator
+from apps.core.views import BulkActionView, PrimaryDatabaseMixin
+
+from . import facetas
 from .forms import ProveedorForm
 from .models import Proveedor
 
@@ -12,8 +23,40 @@ class ProveedorListView(ListView):
     context_object_name = "proveedores"
     paginate_by = 12
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if pais := self.request.GET.get("pais", "").upper():
+            queryset = queryset.filter(pais_codigo=pais)
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["bulk_form"] = BulkActionForm()
+        context["facetas"] = facetas.por_pais()
+        context["pais"] = self.request.GET.get("pais", "").upper()
+        return context
+
 
-class ProveedorCreateView(CreateView):
+class ProveedorDetailView(DetailView):
+    model = Proveedor
+    template_name = "proveedores/detail.html"
+    context_object_name = "proveedor"
+    paginate_by = 20
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        suministros = self.object.suministros.select_related("producto")
+        # Name order goes through the join, so no index serves the seek: the
+        # (proveedor, producto) unique index finds this supplier's rows and
+        # they are sorted, which a supplier's catalogue keeps cheap.
+        paginator = KeysetPaginator(
+            suministros, ("producto__nombre", "producto_id"), self.paginate_by
+        )
+        context["page_obj"] = paginator.page(self.request.GET.get("cursor"))
+        return context
+
+
+class ProveedorCreateView(PrimaryDatabaseMixin, CreateView):
     model = Proveedor
     form_class = ProveedorForm
     template_name = "proveedores/create.html"
@@ -24,7 +67,7 @@ class ProveedorCreateView(CreateView):
         return super().form_valid(form)
 
 
-class ProveedorUpdateView(UpdateView):
+class ProveedorUpdateView(PrimaryDatabaseMixin, UpdateView):
     model = Proveedor
     form_class = ProveedorForm
     template_name = "proveedores/update.html"
@@ -35,7 +78,7 @@ class ProveedorUpdateView(UpdateView):
         return super().form_valid(form)
 
 
-class ProveedorDeleteView(DeleteView):
+class ProveedorDeleteView(PrimaryDatabaseMixin, DeleteView):
     model = Proveedor
     template_name = "proveedores/delete.html"
     success_url = reverse_lazy("proveedores:list")
@@ -43,3 +86,9 @@ class ProveedorDeleteView(DeleteView):
     def delete(self, request, *args, **kwargs):
         messages.success(self.request, "Proveedor eliminado exitosamente.")
         return super().delete(request, *args, **kwargs)
+
+
+class ProveedorBulkView(BulkActionView):
+    model = Proveedor
+    form_class = BulkActionForm
+    success_url = reverse_lazy("proveedores:list")
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TrabajadoresConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.trabajadores"
+
+    def ready(self):
+        from apps.core import unicidad
+
+        from .models import Trabajador
+
+        unicidad.registrar(Trabajador, "cedula", "codigo_empleado")
@@ -0,0 +1,48 @@
+"""
+Type-ahead search of the staff directory.
+
+Every term of the query must be a prefix of the name, surname, cédula or
+employee code (case-insensitive), so "ana pér" finds "Ana Pérez". Prefix
+matches are answered from the ``UPPER(col) text_pattern_ops`` indexes declared
+in ``Trabajador.Meta`` on PostgreSQL.
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from .models import Trabajador
+
+CAMPOS = ("nombre", "apellido", "cedula", "codigo_empleado")
+MIN_LENGTH = 2
+MAX_TERMS = 3
+LIMIT = 10
+
+
+def terminos(q):
+    """Search terms of ``q``; empty when it is too short to be selective."""
+    q = (q or "").strip()
+    if len(q) < MIN_LENGTH:
+        return []
+    return q.split()[:MAX_TERMS]
+
+
+def filtrar(queryset, q):
+    """Workers matching every term of ``q`` (all of them for an empty query)."""
+    for termino in terminos(q):
+        queryset = queryset.filter(
+            reduce(or_, (Q(**{f"{campo}__istartswith": termino}) for campo in CAMPOS))
+        )
+    return queryset
+
+
+def buscar(q, limit=LIMIT):
+    """Up to ``limit`` matches as ``.values()`` dicts, by name."""
+    if not terminos(q):
+        return []
+    return list(
+        filtrar(Trabajador.objects.all(), q)
+        .order_by("nombre", "apellido", "pk")
+        .values("id", *CAMPOS)[:limit]
+    )
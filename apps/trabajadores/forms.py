@@ -1,9 +1,13 @@
 from django import forms
 
+from apps.core.forms import UniqueCheckMixin
+
 from .models import Trabajador
 
 
-class TrabajadorForm(forms.ModelForm):
+class TrabajadorForm(UniqueCheckMixin, forms.ModelForm):
+    unique_check_fields = ("cedula", "codigo_empleado")
+
     class Meta:
         model = Trabajador
         fields = ["nombre", "apellido", "correo", "cedula", "codigo_empleado", "imagen"]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:39
+
+import apps.core.media
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trabajadores", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="trabajador",
+            name="imagen",
+            field=apps.core.media.ContentAddressedImageField(
+                blank=True, null=True, upload_to="trabajadores/", verbose_name="Imagen"
+            ),
+        ),
+    ]
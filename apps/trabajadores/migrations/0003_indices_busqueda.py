@@ -0,0 +1,57 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:53
+
+import apps.core.indexes
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("trabajadores", "0002_content_addressed_imagen"),
+    ]
+
+    operations = [
+        apps.core.indexes.AddIndexConcurrentlyOnPostgres(
+            model_name="trabajador",
+            index=apps.core.indexes.OpClassIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("nombre"),
+                    name="text_pattern_ops",
+                ),
+                name="trab_nombre_prefix_idx",
+            ),
+        ),
+        apps.core.indexes.AddIndexConcurrentlyOnPostgres(
+            model_name="trabajador",
+            index=apps.core.indexes.OpClassIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("apellido"),
+                    name="text_pattern_ops",
+                ),
+                name="trab_apellido_prefix_idx",
+            ),
+        ),
+        apps.core.indexes.AddIndexConcurrentlyOnPostgres(
+            model_name="trabajador",
+            index=apps.core.indexes.OpClassIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("cedula"),
+                    name="text_pattern_ops",
+                ),
+                name="trab_cedula_prefix_idx",
+            ),
+        ),
+        apps.core.indexes.AddIndexConcurrentlyOnPostgres(
+            model_name="trabajador",
+            index=apps.core.indexes.OpClassIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("codigo_empleado"),
+                    name="text_pattern_ops",
+                ),
+                name="trab_codigo_prefix_idx",
+            ),
+        ),
+    ]
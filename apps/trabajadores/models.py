@@ -1,8 +1,14 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 
+from apps.core.indexes import OpClassIndex
+from apps.core.media import ContentAddressedImageField
+from apps.core.models import AtomicSaveMixin
 
-class Trabajador(models.Model):
+
+class Trabajador(AtomicSaveMixin, models.Model):
     nombre = models.CharField(max_length=100, verbose_name="Nombre")
     apellido = models.CharField(max_length=100, verbose_name="Apellido")
     correo = models.EmailField(verbose_name="Correo electrónico")
@@ -10,7 +16,7 @@ class Trabajador(models.Model):
     codigo_empleado = models.CharField(
         max_length=20, unique=True, verbose_name="Código de empleado"
     )
-    imagen = models.ImageField(
+    imagen = ContentAddressedImageField(
         upload_to="trabajadores/", blank=True, null=True, verbose_name="Imagen"
     )
 
@@ -18,6 +24,27 @@ class Trabajador(models.Model):
         verbose_name = "Trabajador"
         verbose_name_plural = "Trabajadores"
         ordering = ["nombre", "apellido"]
+        # istartswith compiles to UPPER(col::text) LIKE UPPER('ana%') on
+        # PostgreSQL; with text_pattern_ops these indexes serve that LIKE
+        # under any collation (apps.trabajadores.busqueda).
+        indexes = [
+            OpClassIndex(
+                OpClass(Upper("nombre"), name="text_pattern_ops"),
+                name="trab_nombre_prefix_idx",
+            ),
+            OpClassIndex(
+                OpClass(Upper("apellido"), name="text_pattern_ops"),
+                name="trab_apellido_prefix_idx",
+            ),
+            OpClassIndex(
+                OpClass(Upper("cedula"), name="text_pattern_ops"),
+                name="trab_cedula_prefix_idx",
+            ),
+            OpClassIndex(
+                OpClass(Upper("codigo_empleado"), name="text_pattern_ops"),
+                name="trab_codigo_prefix_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.nombre} {self.apellido}"
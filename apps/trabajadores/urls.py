@@ -7,6 +7,8 @@ app_name = "trabajadores"
 urlpatterns = [
     path("", views.TrabajadorListView.as_view(), name="list"),
     path("create/", views.TrabajadorCreateView.as_view(), name="create"),
+    path("buscar/", views.TrabajadorBuscarView.as_view(), name="buscar"),
+    path("bulk/", views.TrabajadorBulkView.as_view(), name="bulk"),
     path("<int:pk>/update/", views.TrabajadorUpdateView.as_view(), name="update"),
     path("<int:pk>/delete/", views.TrabajadorDeleteView.as_view(), name="delete"),
 ]
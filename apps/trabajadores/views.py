@@ -1,7 +1,13 @@
 from django.contrib import messages
-from django.urls import reverse_lazy
+from django.http import JsonResponse
+from django.urls import reverse, reverse_lazy
+from django.views import View
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
+from apps.core.forms import BulkActionForm
+from apps.core.views import BulkActionView, PrimaryDatabaseMixin
+
+from . import busqueda
 from .forms import TrabajadorForm
 from .models import Trabajador
 
@@ -12,8 +18,33 @@ class TrabajadorListView(ListView):
     context_object_name = "trabajadores"
     paginate_by = 8
 
+    def get_queryset(self):
+        return busqueda.filtrar(super().get_queryset(), self.request.GET.get("q"))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["bulk_form"] = BulkActionForm()
+        context["q"] = self.request.GET.get("q", "")
+        return context
+
+
+class TrabajadorBuscarView(View):
+    """Type-ahead suggestions: ``?q=ana`` -> {"results": [...]}."""
+
+    http_method_names = ["get"]
+
+    def get(self, request):
+        results = busqueda.buscar(request.GET.get("q"))
+        for trabajador in results:
+            trabajador["label"] = f"{trabajador['nombre']} {trabajador['apellido']}"
+            trabajador["detail"] = (
+                f"{trabajador['cedula']} · {trabajador['codigo_empleado']}"
+            )
+            trabajador["url"] = reverse("trabajadores:update", args=[trabajador["id"]])
+        return JsonResponse({"results": results})
 
-class TrabajadorCreateView(CreateView):
+
+class TrabajadorCreateView(PrimaryDatabaseMixin, CreateView):
     model = Trabajador
     form_class = TrabajadorForm
     template_name = "trabajadores/create.html"
@@ -24,7 +55,7 @@ class TrabajadorCreateView(CreateView):
         return super().form_valid(form)
 
 
-class TrabajadorUpdateView(UpdateView):
+class TrabajadorUpdateView(PrimaryDatabaseMixin, UpdateView):
     model = Trabajador
     form_class = TrabajadorForm
     template_name = "trabajadores/update.html"
@@ -35,7 +66,7 @@ class TrabajadorUpdateView(UpdateView):
         return super().form_valid(form)
 
 
-class TrabajadorDeleteView(DeleteView):
+class TrabajadorDeleteView(PrimaryDatabaseMixin, DeleteView):
     model = Trabajador
     template_name = "trabajadores/delete.html"
     success_url = reverse_lazy("trabajadores:list")
@@ -43,3 +74,9 @@ class TrabajadorDeleteView(DeleteView):
     def delete(self, request, *args, **kwargs):
         messages.success(self.request, "Trabajador eliminado exitosamente.")
         return super().delete(request, *args, **kwargs)
+
+
+class TrabajadorBulkView(BulkActionView):
+    model = Trabajador
+    form_class = BulkActionForm
+    success_url = reverse_lazy("trabajadores:list")
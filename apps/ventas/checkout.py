@@ -0,0 +1,84 @@
+"""
+Checkout in one transaction: one query for the products, one INSERT for the
+sale and one bulk INSERT for its lines, then stock and the rollups.
+Line amounts are computed once here and stored; nothing downstream calls
+Producto.get_precio_con_iva per line.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from apps.inventario import stock
+from apps.productos.models import Producto
+
+from . import resumenes
+from .models import LineaVenta, Venta
+
+CENT = Decimal("0.01")
+
+
+class VentaInvalida(Exception):
+    """Raised when a sale has no lines or refers to unknown products."""
+
+
+def calcular_linea(producto, cantidad):
+    """
+    Unsaved LineaVenta with the product snapshot and its amounts, rounded to
+    cents: the subtotal, then the IVA half up. Producto.get_precio_con_iva
+    does not round, so a line total can differ from
+    ``cantidad * get_precio_con_iva()`` by a cent.
+    """
+    subtotal = (producto.precio * cantidad).quantize(CENT)
+    iva_monto = (subtotal * producto.iva / 100).quantize(CENT, ROUND_HALF_UP)
+    return LineaVenta(
+        producto=producto,
+        nombre=producto.nombre,
+        precio_unitario=producto.precio,
+        iva=producto.iva,
+        cantidad=cantidad,
+        subtotal=subtotal,
+        iva_monto=iva_monto,
+        total=subtotal + iva_monto,
+    )
+
+
+def registrar_venta(trabajador, cantidades, fecha=None):
+    """
+    Record a sale of ``cantidades`` ({producto_id: cantidad}) by
+    ``trabajador``. Raises VentaInvalida or stock.StockInsuficiente, in which
+    case nothing is written.
+    """
+    cantidades = {pk: qty for pk, qty in cantidades.items() if qty}
+    if not cantidades:
+        raise VentaInvalida("La venta no tiene productos.")
+    using = router.db_for_write(Venta)
+    with transaction.atomic(using=using):
+        productos = (
+            Producto.objects.using(using)
+            .only("nombre", "precio", "iva")
+            .in_bulk(list(cantidades))
+        )
+        if faltantes := set(cantidades) - set(productos):
+            raise VentaInvalida(f"Productos inexistentes: {sorted(faltantes)}")
+
+        lineas = [
+            calcular_linea(productos[pk], qty) for pk, qty in sorted(cantidades.items())
+        ]
+        venta = Venta.objects.using(using).create(
+            trabajador=trabajador,
+            codigo_empleado=trabajador.codigo_empleado,
+            fecha=fecha or timezone.now(),
+            unidades=sum(linea.cantidad for linea in lineas),
+            subtotal=sum(linea.subtotal for linea in lineas),
+            iva_total=sum(linea.iva_monto for linea in lineas),
+            total=sum(linea.total for linea in lineas),
+        )
+        for linea in lineas:
+            linea.venta = venta
+        LineaVenta.objects.using(using).bulk_create(lineas)
+
+        stock.descontar(cantidades, referencia=f"venta-{venta.pk}")
+        resumenes.acumular(venta, lineas, using)
+    return venta
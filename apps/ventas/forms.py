@@ -0,0 +1,123 @@
+from collections import Counter
+from datetime import timedelta
+
+from django import forms
+from django.utils import timezone
+
+from apps.productos.models import Producto
+from apps.trabajadores.models import Trabajador
+
+
+class VentaForm(forms.Form):
+    trabajador = forms.ModelChoiceField(
+        queryset=Trabajador.objects.all(),
+        label="Vendedor",
+        empty_label="Seleccione un trabajador",
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
+
+class LineaVentaForm(forms.Form):
+    producto = forms.TypedChoiceField(
+        label="Producto",
+        coerce=int,
+        empty_value=None,
+        required=False,
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+    cantidad = forms.IntegerField(
+        label="Cantidad",
+        min_value=1,
+        required=False,
+        widget=forms.NumberInput(attrs={"class": "form-control", "min": "1"}),
+    )
+
+    def __init__(self, *args, productos=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["producto"].choices = [("", "Seleccione un producto"), *productos]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("producto") and not cleaned_data.get("cantidad"):
+            self.add_error("cantidad", "Indique la cantidad.")
+        return cleaned_data
+
+
+class BaseLineaVentaFormSet(forms.BaseFormSet):
+    def __init__(self, *args, **kwargs):
+        # Product choices are loaded once and shared by every line form.
+        productos = [
+            (p.pk, f"{p.nombre} (${p.precio})")
+            for p in Producto.objects.only("nombre", "precio")
+        ]
+        kwargs.setdefault("form_kwargs", {})["productos"] = productos
+        super().__init__(*args, **kwargs)
+
+    def clean(self):
+        if any(self.errors):
+            return
+        if not self.cantidades():
+            raise forms.ValidationError("Agregue al menos un producto.")
+
+    def cantidades(self):
+        """{producto_id: cantidad}, adding up repeated products."""
+        total = Counter()
+        for form in self.forms:
+            if form.cleaned_data.get("producto"):
+                total[form.cleaned_data["producto"]] += form.cleaned_data["cantidad"]
+        return dict(total)
+
+
+LineaVentaFormSet = forms.formset_factory(
+    LineaVentaForm, formset=BaseLineaVentaFormSet, extra=5
+)
+
+
+class ReporteForm(forms.Form):
+    """Report filters, read from the query string; every field is optional."""
+
+    DIAS_POR_DEFECTO = 30
+
+    dimension = forms.ChoiceField(
+        label="Agrupar por",
+        required=False,
+        choices=[
+            ("total", "Total"),
+            ("producto", "Producto"),
+            ("iva", "Tasa de IVA"),
+            ("trabajador", "Trabajador"),
+        ],
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+    periodo = forms.ChoiceField(
+        label="Periodo",
+        required=False,
+        choices=[("dia", "Día"), ("semana", "Semana"), ("mes", "Mes")],
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+    desde = forms.DateField(
+        label="Desde",
+        required=False,
+        widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}),
+    )
+    hasta = forms.DateField(
+        label="Hasta",
+        required=False,
+        widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        hasta = cleaned_data.get("hasta") or timezone.localdate()
+        desde = cleaned_data.get("desde") or hasta - timedelta(
+            days=self.DIAS_POR_DEFECTO - 1
+        )
+        if desde > hasta:
+            raise forms.ValidationError("La fecha inicial es posterior a la final.")
+        cleaned_data.update(
+            dimension=cleaned_data.get("dimension") or "total",
+            periodo=cleaned_data.get("periodo") or "dia",
+            desde=desde,
+            hasta=hasta,
+        )
+        return cleaned_data
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.ventas.resumenes import reconstruir
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye los resúmenes de ventas (por día, producto, IVA y "
+        "trabajador) a partir de las ventas registradas."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Filas insertadas por consulta.",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        start = time.monotonic()
+        escritas = reconstruir(batch_size=batch_size)
+        for model, filas in escritas.items():
+            self.stdout.write(f"  {model._meta.verbose_name_plural}: {filas}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Resúmenes reconstruidos en {time.monotonic() - start:.1f} s."
+            )
+        )
@@ -0,0 +1,196 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("productos", "0005_producto_proveedores"),
+        ("trabajadores", "0002_content_addressed_imagen"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumenVentaDiario",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("fecha", models.DateField(unique=True, verbose_name="Fecha")),
+                (
+                    "ventas",
+                    models.PositiveIntegerField(default=0, verbose_name="Ventas"),
+                ),
+                (
+                    "unidades",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Subtotal",
+                    ),
+                ),
+                (
+                    "iva_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de ventas diario",
+                "verbose_name_plural": "Resúmenes de ventas diarios",
+                "ordering": ["-fecha"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Venta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "codigo_empleado",
+                    models.CharField(max_length=20, verbose_name="Código de empleado"),
+                ),
+                (
+                    "fecha",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Fecha",
+                    ),
+                ),
+                (
+                    "unidades",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Subtotal",
+                    ),
+                ),
+                (
+                    "iva_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+                (
+                    "trabajador",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="ventas",
+                        to="trabajadores.trabajador",
+                        verbose_name="Vendedor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Venta",
+                "verbose_name_plural": "Ventas",
+                "ordering": ["-fecha", "-id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="LineaVenta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("nombre", models.CharField(max_length=200, verbose_name="Producto")),
+                (
+                    "precio_unitario",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=10, verbose_name="Precio unitario"
+                    ),
+                ),
+                ("iva", models.IntegerField(verbose_name="IVA (%)")),
+                ("cantidad", models.PositiveIntegerField(verbose_name="Cantidad")),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=12, verbose_name="Subtotal"
+                    ),
+                ),
+                (
+                    "iva_monto",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+                (
+                    "producto",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="lineas_venta",
+                        to="productos.producto",
+                    ),
+                ),
+                (
+                    "venta",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lineas",
+                        to="ventas.venta",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Línea de venta",
+                "verbose_name_plural": "Líneas de venta",
+                "ordering": ["id"],
+            },
+        ),
+    ]
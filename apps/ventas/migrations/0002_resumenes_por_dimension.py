@@ -0,0 +1,186 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("productos", "0005_producto_proveedores"),
+        ("ventas", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumenVentaIva",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "unidades",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Subtotal",
+                    ),
+                ),
+                (
+                    "iva_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+                ("fecha", models.DateField(verbose_name="Fecha")),
+                ("iva", models.IntegerField(verbose_name="IVA (%)")),
+            ],
+            options={
+                "verbose_name": "Resumen de ventas por IVA",
+                "verbose_name_plural": "Resúmenes de ventas por IVA",
+                "ordering": ["-fecha", "iva"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("fecha", "iva"), name="unique_resumen_iva_fecha"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenVentaTrabajador",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "unidades",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Subtotal",
+                    ),
+                ),
+                (
+                    "iva_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+                ("fecha", models.DateField(verbose_name="Fecha")),
+                (
+                    "codigo_empleado",
+                    models.CharField(max_length=20, verbose_name="Código de empleado"),
+                ),
+                (
+                    "ventas",
+                    models.PositiveIntegerField(default=0, verbose_name="Ventas"),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de ventas por trabajador",
+                "verbose_name_plural": "Resúmenes de ventas por trabajador",
+                "ordering": ["-fecha", "codigo_empleado"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("fecha", "codigo_empleado"),
+                        name="unique_resumen_trabajador_fecha",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenVentaProducto",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "unidades",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "subtotal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Subtotal",
+                    ),
+                ),
+                (
+                    "iva_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="IVA"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12, verbose_name="Total"
+                    ),
+                ),
+                ("fecha", models.DateField(verbose_name="Fecha")),
+                ("nombre", models.CharField(max_length=200, verbose_name="Producto")),
+                (
+                    "producto",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="productos.producto",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de ventas por producto",
+                "verbose_name_plural": "Resúmenes de ventas por producto",
+                "ordering": ["-fecha", "producto"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("fecha", "producto"),
+                        name="unique_resumen_producto_fecha",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("productos", "0005_producto_proveedores"),
+        ("ventas", "0002_resumenes_por_dimension"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="resumenventadiario",
+            options={
+                "ordering": ["-fecha", "ranura"],
+                "verbose_name": "Resumen de ventas diario",
+                "verbose_name_plural": "Resúmenes de ventas diarios",
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name="resumenventaiva",
+            name="unique_resumen_iva_fecha",
+        ),
+        migrations.RemoveConstraint(
+            model_name="resumenventaproducto",
+            name="unique_resumen_producto_fecha",
+        ),
+        migrations.RemoveConstraint(
+            model_name="resumenventatrabajador",
+            name="unique_resumen_trabajador_fecha",
+        ),
+        migrations.AddField(
+            model_name="resumenventadiario",
+            name="ranura",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Ranura"),
+        ),
+        migrations.AddField(
+            model_name="resumenventaiva",
+            name="ranura",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Ranura"),
+        ),
+        migrations.AddField(
+            model_name="resumenventaproducto",
+            name="ranura",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Ranura"),
+        ),
+        migrations.AddField(
+            model_name="resumenventatrabajador",
+            name="ranura",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Ranura"),
+        ),
+        migrations.AlterField(
+            model_name="resumenventadiario",
+            name="fecha",
+            field=models.DateField(verbose_name="Fecha"),
+        ),
+        migrations.AddConstraint(
+            model_name="resumenventadiario",
+            constraint=models.UniqueConstraint(
+                fields=("fecha", "ranura"), name="unique_resumen_diario_fecha"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="resumenventaiva",
+            constraint=models.UniqueConstraint(
+                fields=("fecha", "iva", "ranura"), name="unique_resumen_iva_fecha"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="resumenventaproducto",
+            constraint=models.UniqueConstraint(
+                fields=("fecha", "producto", "ranura"),
+                name="unique_resumen_producto_fecha",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="resumenventatrabajador",
+            constraint=models.UniqueConstraint(
+                fields=("fecha", "codigo_empleado", "ranura"),
+                name="unique_resumen_trabajador_fecha",
+            ),
+        ),
+    ]
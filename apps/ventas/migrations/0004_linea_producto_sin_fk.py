@@ -0,0 +1,26 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("productos", "0005_producto_proveedores"),
+        ("ventas", "0003_resumenes_por_ranura"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="lineaventa",
+            name="producto",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="lineas_venta",
+                to="productos.producto",
+            ),
+        ),
+    ]
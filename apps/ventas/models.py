@@ -0,0 +1,179 @@
+from django.db import models
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.productos.models import Producto
+from apps.trabajadores.models import Trabajador
+
+
+def money(**kwargs):
+    return models.DecimalField(max_digits=12, decimal_places=2, **kwargs)
+
+
+class Venta(models.Model):
+    """A sale. Totals are computed once at checkout (apps.ventas.checkout)."""
+
+    trabajador = models.ForeignKey(
+        Trabajador,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="ventas",
+        verbose_name="Vendedor",
+    )
+    # Snapshot so the sale still names its seller if the worker is deleted.
+    codigo_empleado = models.CharField(max_length=20, verbose_name="Código de empleado")
+    fecha = models.DateTimeField(
+        default=timezone.now, db_index=True, verbose_name="Fecha"
+    )
+    unidades = models.PositiveIntegerField(default=0, verbose_name="Unidades")
+    subtotal = money(default=0, verbose_name="Subtotal")
+    iva_total = money(default=0, verbose_name="IVA")
+    total = money(default=0, verbose_name="Total")
+
+    class Meta:
+        verbose_name = "Venta"
+        verbose_name_plural = "Ventas"
+        ordering = ["-fecha", "-id"]
+
+    def __str__(self):
+        return f"Venta #{self.pk}"
+
+    def get_absolute_url(self):
+        return reverse("ventas:detail", kwargs={"pk": self.pk})
+
+
+class LineaVenta(models.Model):
+    """Sale line with the product name, price and IVA as they were when sold."""
+
+    venta = models.ForeignKey(Venta, on_delete=models.CASCADE, related_name="lineas")
+    # No database FK: the line keeps the id of a deleted product, so the
+    # per-product rollups can still be rebuilt from it.
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="lineas_venta",
+    )
+    nombre = models.CharField(max_length=200, verbose_name="Producto")
+    precio_unitario = models.DecimalField(
+        max_digits=10, decimal_places=2, verbose_name="Precio unitario"
+    )
+    iva = models.IntegerField(verbose_name="IVA (%)")
+    cantidad = models.PositiveIntegerField(verbose_name="Cantidad")
+    subtotal = money(verbose_name="Subtotal")
+    iva_monto = money(verbose_name="IVA")
+    total = money(verbose_name="Total")
+
+    class Meta:
+        verbose_name = "Línea de venta"
+        verbose_name_plural = "Líneas de venta"
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.cantidad} x {self.nombre}"
+
+
+class Resumen(models.Model):
+    """Sums shared by the sales rollups (see apps.ventas.resumenes)."""
+
+    # Each key is split over several rows so concurrent checkouts do not all
+    # wait on one row lock; readers sum the slots.
+    ranura = models.PositiveSmallIntegerField(default=0, verbose_name="Ranura")
+    unidades = models.PositiveIntegerField(default=0, verbose_name="Unidades")
+    subtotal = money(default=0, verbose_name="Subtotal")
+    iva_total = money(default=0, verbose_name="IVA")
+    total = money(default=0, verbose_name="Total")
+
+    class Meta:
+        abstract = True
+
+
+class ResumenVentaDiario(Resumen):
+    """Daily sales rollup, kept up to date by checkout."""
+
+    fecha = models.DateField(verbose_name="Fecha")
+    ventas = models.PositiveIntegerField(default=0, verbose_name="Ventas")
+
+    class Meta:
+        verbose_name = "Resumen de ventas diario"
+        verbose_name_plural = "Resúmenes de ventas diarios"
+        ordering = ["-fecha", "ranura"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fecha", "ranura"], name="unique_resumen_diario_fecha"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.fecha}: {self.total}"
+
+
+class ResumenVentaProducto(Resumen):
+    """Daily sales of one product."""
+
+    fecha = models.DateField(verbose_name="Fecha")
+    # No database FK: rollups outlive deleted products, like the stock ledger.
+    producto = models.ForeignKey(
+        Producto,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    nombre = models.CharField(max_length=200, verbose_name="Producto")
+
+    class Meta:
+        verbose_name = "Resumen de ventas por producto"
+        verbose_name_plural = "Resúmenes de ventas por producto"
+        ordering = ["-fecha", "producto"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fecha", "producto", "ranura"],
+                name="unique_resumen_producto_fecha",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.fecha} {self.nombre}: {self.total}"
+
+
+class ResumenVentaIva(Resumen):
+    """Daily sales at one IVA rate."""
+
+    fecha = models.DateField(verbose_name="Fecha")
+    iva = models.IntegerField(verbose_name="IVA (%)")
+
+    class Meta:
+        verbose_name = "Resumen de ventas por IVA"
+        verbose_name_plural = "Resúmenes de ventas por IVA"
+        ordering = ["-fecha", "iva"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fecha", "iva", "ranura"], name="unique_resumen_iva_fecha"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.fecha} {self.iva}%: {self.total}"
+
+
+class ResumenVentaTrabajador(Resumen):
+    """Daily sales of one seller, keyed by the employee code snapshot."""
+
+    fecha = models.DateField(verbose_name="Fecha")
+    codigo_empleado = models.CharField(max_length=20, verbose_name="Código de empleado")
+    ventas = models.PositiveIntegerField(default=0, verbose_name="Ventas")
+
+    class Meta:
+        verbose_name = "Resumen de ventas por trabajador"
+        verbose_name_plural = "Resúmenes de ventas por trabajador"
+        ordering = ["-fecha", "codigo_empleado"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fecha", "codigo_empleado", "ranura"],
+                name="unique_resumen_trabajador_fecha",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.fecha} {self.codigo_empleado}: {self.total}"
@@ -0,0 +1,95 @@
+"""
+Sales reports read only from the rollups in apps.ventas.resumenes, so their
+cost depends on the number of days and keys in the range, not on the number
+of sales. Weeks and months are summed from the daily rows.
+"""
+
+from django.db.models import DateField, F, Max, Sum
+from django.db.models.functions import Trunc
+
+from .models import (
+    ResumenVentaDiario,
+    ResumenVentaIva,
+    ResumenVentaProducto,
+    ResumenVentaTrabajador,
+)
+
+# dimension: (rollup, grouping key, label aggregate)
+DIMENSIONES = {
+    "total": (ResumenVentaDiario, None, None),
+    "producto": (ResumenVentaProducto, "producto_id", Max("nombre")),
+    "iva": (ResumenVentaIva, "iva", None),
+    "trabajador": (ResumenVentaTrabajador, "codigo_empleado", None),
+}
+
+# Daily rows need no truncation.
+PERIODOS = {
+    "dia": F("fecha"),
+    "semana": Trunc("fecha", "week", output_field=DateField()),
+    "mes": Trunc("fecha", "month", output_field=DateField()),
+}
+
+SUMAS = ["unidades", "subtotal", "iva_total", "total"]
+
+
+def columnas(dimension):
+    """Sum columns of a report; only sales rollups count sales."""
+    model = DIMENSIONES[dimension][0]
+    has_ventas = any(f.name == "ventas" for f in model._meta.fields)
+    return ["ventas", *SUMAS] if has_ventas else SUMAS
+
+
+def etiqueta(dimension, fila):
+    if dimension == "total":
+        return "Total"
+    if dimension == "iva":
+        return f"IVA {fila['clave']}%"
+    return fila.get("nombre") or str(fila["clave"])
+
+
+def reporte(dimension="total", periodo="dia", desde=None, hasta=None):
+    """
+    Rows of {periodo, clave, etiqueta, <sums>} ordered by period and key,
+    for the days between ``desde`` and ``hasta`` (both inclusive).
+    """
+    model, clave, nombre = DIMENSIONES[dimension]
+    queryset = model.objects.all()
+    if desde:
+        queryset = queryset.filter(fecha__gte=desde)
+    if hasta:
+        queryset = queryset.filter(fecha__lte=hasta)
+
+    grupo = ["periodo", clave] if clave else ["periodo"]
+    extra = {"nombre": nombre} if nombre else {}
+    filas = (
+        queryset.annotate(periodo=PERIODOS[periodo])
+        .values(*grupo)
+        .annotate(**extra, **{campo: Sum(campo) for campo in columnas(dimension)})
+        .order_by(*grupo)
+    )
+    resultado = []
+    for fila in filas:
+        fila["clave"] = fila.pop(clave) if clave else None
+        fila["etiqueta"] = etiqueta(dimension, fila)
+        fila.pop("nombre", None)
+        resultado.append(fila)
+    return resultado
+
+
+def serie(filas, campo="total"):
+    """
+    Chart-ready shape of ``reporte`` rows: one label per period and one
+    dataset per key, with zeros for periods without sales.
+    """
+    periodos = sorted({fila["periodo"] for fila in filas})
+    posicion = {periodo: i for i, periodo in enumerate(periodos)}
+    datasets = {}
+    for fila in filas:
+        dataset = datasets.setdefault(
+            fila["clave"], {"label": fila["etiqueta"], "data": [0] * len(periodos)}
+        )
+        dataset["data"][posicion[fila["periodo"]]] = float(fila[campo])
+    return {
+        "labels": [periodo.isoformat() for periodo in periodos],
+        "datasets": list(datasets.values()),
+    }
@@ -0,0 +1,146 @@
+"""
+Sales rollups. Checkout adds each sale to the summary rows of its day (total,
+per product, per IVA rate and per seller) in the same transaction, so
+reports read a few rows per day and key instead of scanning raw sales.
+
+Every key is spread over ``RANURAS`` rows (``Resumen.ranura``) and each
+sale goes to the slot of its id, so concurrent checkouts of the same day
+update different rows instead of queueing on one row lock. Readers sum
+the slots, which ``reportes.reporte`` does with its GROUP BY anyway.
+``reconstruir`` rebuilds every rollup from the raw sales into slot 0.
+"""
+
+from collections import defaultdict
+
+from django.db import router, transaction
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import (
+    LineaVenta,
+    ResumenVentaDiario,
+    ResumenVentaIva,
+    ResumenVentaProducto,
+    ResumenVentaTrabajador,
+    Venta,
+)
+
+RESUMENES = [
+    ResumenVentaDiario,
+    ResumenVentaProducto,
+    ResumenVentaIva,
+    ResumenVentaTrabajador,
+]
+
+RANURAS = 8
+
+
+def _sumas(unidades, subtotal, iva_total, total, **extra):
+    return {
+        "unidades": unidades,
+        "subtotal": subtotal,
+        "iva_total": iva_total,
+        "total": total,
+        **extra,
+    }
+
+
+def _incrementar(model, using, filas):
+    """
+    Add ``filas`` ({key tuple: (claves, datos, sumas)}) to ``model``: one
+    INSERT for the missing rows, then one F() update per row in key order
+    so concurrent checkouts cannot deadlock.
+    """
+    manager = model.objects.using(using)
+    manager.bulk_create(
+        [model(**claves, **datos) for claves, datos, _ in filas.values()],
+        ignore_conflicts=True,
+    )
+    for key in sorted(filas):
+        claves, datos, sumas = filas[key]
+        manager.filter(**claves).update(
+            **datos, **{field: F(field) + value for field, value in sumas.items()}
+        )
+
+
+def acumular(venta, lineas, using):
+    """Add ``venta`` and its ``lineas`` to the rollups of its (local) day."""
+    dia = {"fecha": timezone.localdate(venta.fecha), "ranura": venta.pk % RANURAS}
+    sumas_venta = _sumas(venta.unidades, venta.subtotal, venta.iva_total, venta.total)
+    _incrementar(
+        ResumenVentaDiario,
+        using,
+        {(): (dia, {}, {**sumas_venta, "ventas": 1})},
+    )
+    _incrementar(
+        ResumenVentaTrabajador,
+        using,
+        {
+            (venta.codigo_empleado,): (
+                {**dia, "codigo_empleado": venta.codigo_empleado},
+                {},
+                {**sumas_venta, "ventas": 1},
+            )
+        },
+    )
+
+    productos, ivas = {}, defaultdict(lambda: _sumas(0, 0, 0, 0))
+    for linea in lineas:
+        productos[linea.producto_id] = (
+            {**dia, "producto_id": linea.producto_id},
+            {"nombre": linea.nombre},
+            _sumas(linea.cantidad, linea.subtotal, linea.iva_monto, linea.total),
+        )
+        por_iva = ivas[linea.iva]
+        por_iva["unidades"] += linea.cantidad
+        por_iva["subtotal"] += linea.subtotal
+        por_iva["iva_total"] += linea.iva_monto
+        por_iva["total"] += linea.total
+    _incrementar(ResumenVentaProducto, using, productos)
+    _incrementar(
+        ResumenVentaIva,
+        using,
+        {iva: ({**dia, "iva": iva}, {}, sumas) for iva, sumas in ivas.items()},
+    )
+
+
+def reconstruir(using=None, batch_size=1000):
+    """
+    Rebuild every rollup from the raw sales with GROUP BY queries, over the
+    same lines checkout added, those of since deleted products included.
+    Only lines recorded before LineaVenta kept the product id of deleted
+    products (NULL ``producto``) are left out of the per-product rollup.
+    Returns {model: rows written}.
+    """
+    using = using or router.db_for_write(Venta)
+    ventas = Venta.objects.using(using).annotate(dia=TruncDate("fecha"))
+    lineas = LineaVenta.objects.using(using).annotate(dia=TruncDate("venta__fecha"))
+    sumas_venta = _sumas(
+        Sum("unidades"), Sum("subtotal"), Sum("iva_total"), Sum("total")
+    )
+    sumas_linea = _sumas(
+        Sum("cantidad"), Sum("subtotal"), Sum("iva_monto"), Sum("total")
+    )
+    consultas = {
+        ResumenVentaDiario: ventas.values("dia").annotate(
+            ventas=Count("id"), **sumas_venta
+        ),
+        ResumenVentaTrabajador: ventas.values("dia", "codigo_empleado").annotate(
+            ventas=Count("id"), **sumas_venta
+        ),
+        ResumenVentaProducto: lineas.filter(producto__isnull=False)
+        .values("dia", "producto_id")
+        .annotate(nombre=Max("nombre"), **sumas_linea),
+        ResumenVentaIva: lineas.values("dia", "iva").annotate(**sumas_linea),
+    }
+    escritas = {}
+    with transaction.atomic(using=using):
+        for model, filas in consultas.items():
+            model.objects.using(using).all().delete()
+            creadas = model.objects.using(using).bulk_create(
+                (model(fecha=fila.pop("dia"), **fila) for fila in filas.order_by()),
+                batch_size=batch_size,
+            )
+            escritas[model] = len(creadas)
+    return escritas
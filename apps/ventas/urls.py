@@ -0,0 +1,12 @@
+from django.urls import path
+
+from . import views
+
+app_name = "ventas"
+
+urlpatterns = [
+    path("", views.VentaListView.as_view(), name="list"),
+    path("create/", views.VentaCreateView.as_view(), name="create"),
+    path("reportes/", views.ReporteVentasView.as_view(), name="reportes"),
+    path("<int:pk>/", views.VentaDetailView.as_view(), name="detail"),
+]
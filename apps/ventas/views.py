@@ -0,0 +1,145 @@
+import csv
+from datetime import timedelta
+
+from django.contrib import messages
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.views.generic import DetailView, FormView, ListView, TemplateView
+
+from apps.core.views import PrimaryDatabaseMixin
+from apps.inventario.stock import StockInsuficiente
+from apps.productos.models import Producto
+
+from . import reportes
+from .checkout import VentaInvalida, registrar_venta
+from .forms import LineaVentaFormSet, ReporteForm, VentaForm
+from .models import Venta
+
+
+class VentaListView(ListView):
+    model = Venta
+    template_name = "ventas/list.html"
+    context_object_name = "ventas"
+    paginate_by = 20
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("trabajador")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        desde = timezone.localdate() - timedelta(days=13)
+        # Most recent day first, its slots summed.
+        context["resumenes"] = reportes.reporte("total", desde=desde)[::-1]
+        return context
+
+
+class VentaDetailView(DetailView):
+    model = Venta
+    template_name = "ventas/detail.html"
+    context_object_name = "venta"
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("trabajador")
+            .prefetch_related("lineas")
+        )
+
+
+class VentaCreateView(PrimaryDatabaseMixin, FormView):
+    form_class = VentaForm
+    template_name = "ventas/create.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.setdefault("lineas", LineaVentaFormSet(prefix="lineas"))
+        return context
+
+    def post(self, request, *args, **kwargs):
+        form = self.get_form()
+        lineas = LineaVentaFormSet(request.POST, prefix="lineas")
+        if not (form.is_valid() and lineas.is_valid()):
+            return self.render_to_response(
+                self.get_context_data(form=form, lineas=lineas)
+            )
+        try:
+            venta = registrar_venta(
+                form.cleaned_data["trabajador"], lineas.cantidades()
+            )
+        except StockInsuficiente as exc:
+            nombres = Producto.objects.filter(pk__in=exc.producto_ids).values_list(
+                "nombre", flat=True
+            )
+            form.add_error(None, f"Stock insuficiente: {', '.join(nombres)}.")
+        except VentaInvalida as exc:
+            form.add_error(None, str(exc))
+        else:
+            messages.success(request, f"Venta #{venta.pk} registrada exitosamente.")
+            return redirect(venta)
+        return self.render_to_response(self.get_context_data(form=form, lineas=lineas))
+
+
+def celda_csv(valor):
+    """
+    ``valor`` safe to open in a spreadsheet: text starting with a formula
+    character is prefixed with a quote so it is not evaluated.
+    """
+    if valor is None:
+        return ""
+    if isinstance(valor, str) and valor.startswith(("=", "+", "-", "@")):
+        return f"'{valor}"
+    return valor
+
+
+class ReporteVentasView(TemplateView):
+    """
+    Sales report over the rollups. ``?formato=csv`` downloads the rows and
+    ``?formato=json`` returns them ready for a chart (labels + datasets).
+    """
+
+    template_name = "ventas/reportes.html"
+
+    def get(self, request, *args, **kwargs):
+        form = ReporteForm(request.GET)
+        formato = request.GET.get("formato")
+        if not form.is_valid():
+            if formato:
+                return JsonResponse({"errors": form.errors}, status=400)
+            return self.render_to_response(self.get_context_data(form=form))
+
+        filtros = form.cleaned_data
+        filas = reportes.reporte(**filtros)
+        columnas = reportes.columnas(filtros["dimension"])
+        if formato == "json":
+            return JsonResponse(reportes.serie(filas))
+        if formato == "csv":
+            return self.csv_response(filtros, filas, columnas)
+        return self.render_to_response(
+            self.get_context_data(
+                form=form,
+                filas=filas,
+                con_ventas="ventas" in columnas,
+                con_clave=filtros["dimension"] != "total",
+            )
+        )
+
+    def csv_response(self, filtros, filas, columnas):
+        nombre = f"ventas-{filtros['dimension']}-{filtros['periodo']}.csv"
+        response = HttpResponse(
+            content_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{nombre}"'},
+        )
+        writer = csv.writer(response)
+        writer.writerow(["periodo", "clave", "etiqueta", *columnas])
+        for fila in filas:
+            writer.writerow(
+                [
+                    fila["periodo"],
+                    celda_csv(fila["clave"]),
+                    celda_csv(fila["etiqueta"]),
+                    *(fila[columna] for columna in columnas),
+                ]
+            )
+        return response
@@ -0,0 +1,90 @@
+"""
+Throughput of the JSON API against the HTML list views for the same rows.
+
+    python -m benchmarks.api [rows] [requests]
+
+Each entity gets ``rows`` rows. Every HTML list page is compared with an
+API page of the same size, then with a full 200-row API page (JSON and,
+if installed, msgpack) to show rows served per second.
+"""
+
+import sys
+import time
+from importlib.util import find_spec
+
+from benchmarks.harness import report, setup
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+REQUESTS = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+
+def throughput(client, url, **headers):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, (url, response.status_code)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(url, headers=headers)
+    elapsed = time.perf_counter() - start
+    return REQUESTS / elapsed, len(response.content)
+
+
+def main():
+    setup()
+
+    from django.test import Client
+
+    from tests.factories import (
+        EmpresaFactory,
+        ProductoFactory,
+        ProveedorFactory,
+        TrabajadorFactory,
+    )
+
+    for factory in [ProductoFactory, ProveedorFactory, TrabajadorFactory]:
+        factory.create_batch(ROWS)
+    EmpresaFactory()
+
+    client = Client()
+    rows = []
+    for entity, html_url, page_size in [
+        ("productos", "/productos/", 12),
+        ("proveedores", "/proveedores/", 12),
+        ("trabajadores", "/trabajadores/", 8),
+    ]:
+        api_url = f"/api/{entity}/"
+        cases = [
+            ("HTML list", html_url, page_size, {}),
+            ("API json", f"{api_url}?limit={page_size}", page_size, {}),
+            ("API json", f"{api_url}?limit=200", 200, {}),
+        ]
+        if find_spec("msgpack"):
+            cases.append(
+                (
+                    "API msgpack",
+                    f"{api_url}?limit=200",
+                    200,
+                    {"accept": "application/msgpack"},
+                )
+            )
+        for label, url, size, headers in cases:
+            per_second, length = throughput(client, url, **headers)
+            rows.append(
+                (
+                    entity,
+                    label,
+                    size,
+                    f"{per_second:.0f}",
+                    f"{per_second * size:.0f}",
+                    f"{length:,}",
+                )
+            )
+
+    report(
+        f"{ROWS} rows per entity, {REQUESTS} requests per case",
+        ["entity", "view", "rows/page", "req/s", "rows/s", "bytes"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+CPU against bytes for the response compression middleware: size and
+compression time per coding for real pages, and the cost of a hit in the
+compressed-body cache (apps.core.compression.CompressedCache).
+
+brotli and zstd are measured when installed (uv sync --extra compression).
+
+    python -m benchmarks.compression [rows] [number]
+"""
+
+import sys
+
+from benchmarks.harness import measure, report, setup
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+NUMBER = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+
+def main():
+    setup()
+
+    from django.test import Client
+
+    from apps.core import compression
+    from tests.factories import ProductoFactory
+
+    ProductoFactory.create_batch(ROWS)
+    client = Client()
+    pages = {
+        url: client.get(url).content
+        for url in ["/", "/productos/", "/api/productos/?limit=200"]
+    }
+
+    rows = []
+    for url, body in pages.items():
+        rows.append((url, "identity", len(body), "1.00", "-", "-"))
+        for coding, compress in compression.encoders().items():
+            cache = compression.CompressedCache(max_bytes=64 * 1024 * 1024)
+            compressed = cache.compress(coding, body)
+            miss = measure(lambda: compress(body), repeat=5, number=NUMBER)
+            hit = measure(lambda: cache.compress(coding, body), repeat=5, number=NUMBER)
+            rows.append(
+                (
+                    url,
+                    coding,
+                    len(compressed),
+                    f"{len(body) / len(compressed):.2f}",
+                    f"{miss['median'] * 1000:.3f}",
+                    f"{hit['median'] * 1000:.4f}",
+                )
+            )
+
+    report(
+        f"Bytes and milliseconds per response ({ROWS} products, median of 5 x {NUMBER})",
+        ["page", "coding", "bytes", "ratio", "compress ms", "cache hit ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Duplicate supplier detection as the number of suppliers grows: the GROUP BY
+over the indexed canonical columns (apps.proveedores.contacto.duplicados)
+against normalising every row in Python.
+
+    python -m benchmarks.duplicados [sizes]
+
+``sizes`` is a comma-separated list of supplier counts (default
+100000,1000000); one supplier in a hundred repeats another's phone and
+email, typed differently.
+"""
+
+import sys
+from collections import defaultdict
+
+from benchmarks.harness import measure, report, setup
+
+SIZES = sys.argv[1] if len(sys.argv) > 1 else "100000,1000000"
+BATCH = 5000
+
+
+def populate(start, count):
+    """Insert suppliers ``start`` to ``start + count`` in batches."""
+    from apps.proveedores import contacto
+    from apps.proveedores.models import Proveedor
+
+    for offset in range(start, start + count, BATCH):
+        proveedores = []
+        for i in range(offset, min(offset + BATCH, start + count)):
+            # Every hundredth supplier repeats the previous one.
+            n = i - 1 if i % 100 == 0 else i
+            telefono = f"(02) {n:08d}" if n != i else f"+593 2 {n:08d}"
+            correo = (
+                f"Ventas{n}@Proveedor.com" if n != i else f"ventas{n}@proveedor.com"
+            )
+            proveedores.append(
+                Proveedor(
+                    nombre=f"Proveedor {i}",
+                    descripcion="-",
+                    telefono=telefono,
+                    pais="Ecuador",
+                    pais_codigo="EC",
+                    telefono_e164=contacto.telefono_e164(telefono, "EC"),
+                    correo=correo,
+                    correo_normalizado=contacto.correo_normalizado(correo),
+                    direccion="-",
+                )
+            )
+        Proveedor.objects.bulk_create(proveedores)
+
+
+def main():
+    setup()
+
+    from django.db import connection
+
+    from apps.proveedores import contacto
+    from apps.proveedores.models import Proveedor
+
+    def indexed():
+        return contacto.duplicados(Proveedor.objects.all(), "telefono")
+
+    def python():
+        grupos = defaultdict(list)
+        filas = Proveedor.objects.order_by("pk").values_list(
+            "pk", "nombre", "telefono", "pais_codigo"
+        )
+        for pk, nombre, telefono, pais_codigo in filas.iterator(chunk_size=5000):
+            if clave := contacto.telefono_e164(telefono, pais_codigo):
+                grupos[clave].append((pk, nombre))
+        return {clave: filas for clave, filas in grupos.items() if len(filas) > 1}
+
+    rows, loaded = [], 0
+    for size in map(int, SIZES.split(",")):
+        populate(loaded, size - loaded)
+        loaded = size
+        assert indexed() == python()
+        grupos = len(indexed())
+        python_time = measure(python, repeat=1)["median"]
+        indexed_time = measure(indexed, repeat=3)["median"]
+        rows.append(
+            (
+                f"{loaded:,}",
+                f"{grupos:,}",
+                f"{python_time:.2f}",
+                f"{indexed_time:.2f}",
+                f"{python_time / indexed_time:.0f}x",
+            )
+        )
+
+    report(
+        f"Seconds to find suppliers sharing a phone on {connection.vendor}",
+        ["suppliers", "groups", "python s", "indexed s", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Form page render time with the shared/form_field.html includes against the
+form_field/image_field tags (apps.core.templatetags.form_tags), which render
+the same templates without the include's lookup and context push. Both
+versions are compiled once with the cached loader and rendered with the
+same bound forms, so only the per-field cost differs. A third version
+renders the bare widgets only; subtracting it gives the cost of the field
+markup itself.
+
+    python -m benchmarks.forms [renders]
+"""
+
+import re
+import sys
+
+from benchmarks.harness import measure, report, setup
+
+RENDERS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+def as_include(source):
+    source = re.sub(
+        r"\{% form_field (\S+) ",
+        r"{% include 'shared/form_field.html' with field=\1 ",
+        source,
+    )
+    source = re.sub(
+        r"\{% image_field (\S+)",
+        r"{% include 'shared/image_field.html' with field=\1",
+        source,
+    )
+    return source.replace("object=object", "imagen=object.imagen")
+
+
+def bare_widgets(source):
+    return re.sub(r"\{% (?:form|image)_field (\S+) [^%]*%\}", r"{{ \1 }}", source)
+
+
+def main():
+    setup()
+
+    from django.conf import settings
+    from django.template import engines
+    from django.test import override_settings
+
+    from apps.empresa.forms import EmpresaForm
+    from apps.productos.forms import ProductoForm
+    from apps.proveedores.forms import ProveedorForm
+    from apps.trabajadores.forms import TrabajadorForm
+
+    pages = [
+        ("productos/create.html", ProductoForm),
+        ("proveedores/create.html", ProveedorForm),
+        ("trabajadores/create.html", TrabajadorForm),
+        ("empresa/create.html", EmpresaForm),
+    ]
+    engine = settings.TEMPLATES[0]
+    cached = {
+        **engine,
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **engine["OPTIONS"],
+            "loaders": [("django.template.loaders.cached.Loader", LOADERS)],
+        },
+    }
+
+    rows = []
+    with override_settings(TEMPLATES=[cached]):
+        django_engine = engines["django"]
+        for name, form_class in pages:
+            # Bound with errors: every branch of the field markup renders.
+            form = form_class(data={})
+            form.is_valid()
+            context = {"form": form, "object": None}
+            source = django_engine.engine.get_template(name).source
+            tag = django_engine.from_string(source)
+            include = django_engine.from_string(as_include(source))
+            widgets = django_engine.from_string(bare_widgets(source))
+            assert tag.render(context) == include.render(context)
+
+            # Alternate the two versions so machine noise hits both alike.
+            versions = {"include": include, "tag": tag, "widgets": widgets}
+            times = {label: [] for label in versions}
+            for _ in range(7):
+                for label, template in versions.items():
+                    result = measure(
+                        lambda: template.render(context), repeat=1, number=RENDERS
+                    )
+                    times[label].append(result["min"])
+            include_ms, tag_ms, widgets_ms = (
+                min(times[label]) * 1000 for label in versions
+            )
+            rows.append(
+                (
+                    name,
+                    len(form.fields),
+                    f"{include_ms:.3f}",
+                    f"{tag_ms:.3f}",
+                    f"{include_ms / tag_ms:.2f}x",
+                    f"{include_ms - widgets_ms:.3f}",
+                    f"{tag_ms - widgets_ms:.3f}",
+                )
+            )
+
+    report(
+        f"Milliseconds per page render (best of 7 interleaved rounds of {RENDERS})",
+        [
+            "page",
+            "fields",
+            "include",
+            "tag",
+            "speedup",
+            "markup (include)",
+            "markup (tag)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Shared setup for the benchmark scripts.
+
+Benchmarks run against throwaway test databases (SQLite in memory with the
+default ``cosmeticos_store.settings_test``) so they never touch real data.
+Run them from the project root, e.g. ``python -m benchmarks.sessions``;
+set DJANGO_SETTINGS_MODULE to benchmark against another database.
+"""
+
+import os
+import statistics
+import time
+
+
+def setup(settings_module="cosmeticos_store.settings_test"):
+    """Configure Django and create empty test databases."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+
+    django.setup()
+
+    from django.db import connections
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    for connection in connections.all():
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+
+
+def measure(fn, repeat=5, number=1):
+    """Run ``fn`` ``number`` times per round; return per-call seconds."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "max": max(rounds),
+    }
+
+
+def report(title, headers, rows):
+    """Print a fixed-width results table."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    print(f"\n{title}")
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(cell).ljust(w) for cell, w in zip(row, widths)))
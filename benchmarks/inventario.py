@@ -0,0 +1,115 @@
+"""
+Concurrent stock decrements against PostgreSQL: a naive read-modify-write
+against the F()-guarded apps.inventario.stock.descontar, with many writer
+threads competing for the same product.
+
+    docker compose up -d db
+    DJANGO_SETTINGS_MODULE=cosmeticos_store.settings \
+        python -m benchmarks.inventario [writers] [orders-per-writer]
+
+Initial stock is half the orders, so half must fail. The guarded version
+must sell exactly the initial stock and write one ledger row per sale.
+"""
+
+import sys
+import threading
+import time
+
+from benchmarks.harness import report, setup
+
+WRITERS = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+ORDERS = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+
+def naive(producto_id):
+    from apps.inventario.models import Stock
+
+    nivel = Stock.objects.get(pk=producto_id)
+    if nivel.disponible < 1:
+        return False
+    nivel.disponible -= 1
+    nivel.save(update_fields=["disponible"])
+    return True
+
+
+def guarded(producto_id):
+    from apps.inventario import stock
+
+    try:
+        stock.descontar({producto_id: 1}, referencia="benchmark")
+    except stock.StockInsuficiente:
+        return False
+    return True
+
+
+def run(strategy, producto_id):
+    from django.db import connections
+
+    sold = [0] * WRITERS
+    barrier = threading.Barrier(WRITERS)
+
+    def writer(index):
+        barrier.wait()
+        try:
+            for _ in range(ORDERS):
+                sold[index] += strategy(producto_id)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(sold), time.perf_counter() - start
+
+
+def main():
+    setup()
+
+    from django.db import connection
+
+    from apps.inventario import stock
+    from apps.inventario.models import MovimientoStock, Stock
+    from apps.productos.models import Producto
+
+    if connection.vendor != "postgresql":
+        sys.exit("Este benchmark necesita PostgreSQL (DJANGO_SETTINGS_MODULE).")
+
+    initial = WRITERS * ORDERS // 2
+    rows = []
+    for label, strategy in [("read-modify-write", naive), ("F() guarded", guarded)]:
+        producto = Producto.objects.create(
+            nombre=f"Benchmark {label}", descripcion="-", precio=1, iva=0
+        )
+        stock.ingresar({producto.pk: initial})
+        sold, elapsed = run(strategy, producto.pk)
+        final = Stock.objects.get(pk=producto.pk).disponible
+        ledger = MovimientoStock.objects.filter(
+            producto=producto, tipo=MovimientoStock.Tipo.SALIDA
+        ).count()
+        # Units reported sold beyond what the stock really lost.
+        lost = sold - (initial - final)
+        rows.append(
+            (
+                label,
+                WRITERS * ORDERS,
+                sold,
+                final,
+                lost,
+                ledger,
+                "ok" if lost == 0 and sold == initial else "WRONG",
+                f"{WRITERS * ORDERS / elapsed:.0f}",
+            )
+        )
+
+    report(
+        f"{WRITERS} writers x {ORDERS} orders, initial stock {initial}",
+        ["strategy", "orders", "sold", "final", "lost", "ledger", "check", "ops/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
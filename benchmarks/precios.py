@@ -0,0 +1,80 @@
+"""
+Price-with-IVA quotes for a basket: one query and model instance per
+product, in_bulk() plus get_precio_con_iva(), and apps.productos.precios
+(one IN query with the math in SQL, then the per-product cache).
+
+    python -m benchmarks.precios [basket-size] [products]
+"""
+
+import random
+import sys
+
+from benchmarks.harness import measure, report, setup
+
+BASKET = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+PRODUCTS = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def main():
+    setup()
+
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+
+    from apps.productos import precios
+    from apps.productos.models import Producto
+    from tests.factories import ProductoFactory
+
+    ProductoFactory.create_batch(PRODUCTS)
+    ids = random.sample(list(Producto.objects.values_list("pk", flat=True)), BASKET)
+
+    def one_by_one():
+        return {pk: Producto.objects.get(pk=pk).get_precio_con_iva() for pk in ids}
+
+    def in_bulk():
+        productos = Producto.objects.in_bulk(ids)
+        return {pk: p.get_precio_con_iva() for pk, p in productos.items()}
+
+    def cold():
+        cache.clear()
+        return precios.cotizar(ids)
+
+    def warm():
+        return precios.cotizar(ids)
+
+    client = Client()
+    url = f"/api/productos/precios/?ids={','.join(map(str, ids))}"
+
+    def endpoint():
+        return client.get(url)
+
+    rows = []
+    with override_settings(CACHES=LOCMEM_CACHE):
+        warm()
+        for label, fn in [
+            ("get() per product", one_by_one),
+            ("in_bulk + get_precio_con_iva", in_bulk),
+            ("cotizar, cold cache", cold),
+            ("cotizar, warm cache", warm),
+            ("endpoint, warm cache", endpoint),
+        ]:
+            timing = measure(fn, repeat=5)
+            rows.append(
+                (
+                    label,
+                    f"{timing['median'] * 1000:.2f}",
+                    f"{BASKET / timing['median']:.0f}",
+                )
+            )
+
+    report(
+        f"Basket of {BASKET} out of {PRODUCTS} products",
+        ["strategy", "ms", "quotes/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+First contentful paint and load time of pages with and without the preload
+Link headers (apps.core.middleware.PreloadLinkMiddleware), in headless
+Chromium with a cold cache on every navigation. The two servers run side by
+side and navigations alternate between them.
+
+Needs playwright (``pip install playwright && playwright install
+chromium``) and network access for the CDN stylesheets.
+
+    python -m benchmarks.preload [navigations]
+"""
+
+import statistics
+import sys
+from importlib.util import find_spec
+
+from benchmarks.harness import report, setup
+
+NAVIGATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+PAGES = ["/", "/productos/", "/productos/create/"]
+
+PAINT = """() => {
+    const paint = performance.getEntriesByName("first-contentful-paint")[0];
+    const navigation = performance.getEntriesByType("navigation")[0];
+    return [paint ? paint.startTime : null, navigation.loadEventEnd];
+}"""
+
+
+def start_server(connections):
+    from django.contrib.staticfiles.handlers import StaticFilesHandler
+    from django.test.testcases import LiveServerThread
+
+    server = LiveServerThread("localhost", StaticFilesHandler, connections)
+    server.daemon = True
+    server.start()
+    server.is_ready.wait()
+    if server.error:
+        raise server.error
+    return server
+
+
+def main():
+    if not find_spec("playwright"):
+        sys.exit(
+            "Este benchmark necesita playwright: pip install playwright && "
+            "playwright install chromium"
+        )
+    setup()
+
+    from django.conf import settings
+    from django.db import connections
+    from django.test import override_settings
+
+    from playwright.sync_api import sync_playwright
+
+    # Share the in-memory test database with the server threads.
+    connection = connections["default"]
+    connection.inc_thread_sharing()
+    shared = {"default": connection}
+
+    without = [
+        name
+        for name in settings.MIDDLEWARE
+        if name != "apps.core.middleware.PreloadLinkMiddleware"
+    ]
+    servers = {"Link preload": start_server(shared)}
+    # The handler (and its middleware) is built when the thread starts.
+    with override_settings(MIDDLEWARE=without):
+        servers["sin Link"] = start_server(shared)
+
+    times = {(label, page): ([], []) for label in servers for page in PAGES}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        for _ in range(NAVIGATIONS):
+            for page_path in PAGES:
+                for label, server in servers.items():
+                    context = browser.new_context()
+                    page = context.new_page()
+                    page.goto(f"http://localhost:{server.port}{page_path}")
+                    paint, load = page.evaluate(PAINT)
+                    context.close()
+                    if paint is not None:
+                        times[label, page_path][0].append(paint)
+                    times[label, page_path][1].append(load)
+        browser.close()
+
+    for server in servers.values():
+        server.terminate()
+
+    report(
+        f"Median milliseconds over {NAVIGATIONS} cold navigations",
+        ["page", "variant", "first contentful paint", "load"],
+        [
+            (
+                page,
+                label,
+                f"{statistics.median(paints):.1f}" if paints else "-",
+                f"{statistics.median(loads):.1f}",
+            )
+            for (label, page), (paints, loads) in times.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Sales report latency as the number of sale lines grows: the same reports
+computed from the raw lines (GROUP BY over every line in the range) and from
+the rollups in apps.ventas.resumenes.
+
+    python -m benchmarks.reportes [sizes]
+
+``sizes`` is a comma-separated list of line counts (default
+10000,100000,1000000). Lines are spread over one year, 200 products and 20
+sellers, so the per-product rollup never exceeds 365 x 200 rows per slot
+(``resumenes.RANURAS``) whatever the volume.
+For 10M lines use PostgreSQL (DJANGO_SETTINGS_MODULE) and some patience.
+"""
+
+import random
+import sys
+from datetime import timedelta
+from decimal import Decimal
+
+from benchmarks.harness import measure, report, setup
+
+SIZES = sys.argv[1] if len(sys.argv) > 1 else "10000,100000,1000000"
+LINES_PER_SALE = 4
+PRODUCTS = 200
+SELLERS = 20
+DAYS = 365
+BATCH = 5000
+
+
+def populate(productos, lines, start):
+    """Insert ``lines`` synthetic sale lines in batches."""
+    from django.db import transaction
+
+    from apps.ventas.checkout import calcular_linea
+    from apps.ventas.models import LineaVenta, Venta
+
+    rng = random.Random(lines)
+    for offset in range(0, lines, BATCH):
+        ventas, lineas = [], []
+        for _ in range(min(BATCH, lines - offset) // LINES_PER_SALE):
+            propias = [
+                calcular_linea(producto, rng.randint(1, 5))
+                for producto in rng.sample(productos, LINES_PER_SALE)
+            ]
+            ventas.append(
+                Venta(
+                    codigo_empleado=f"EMP{rng.randrange(SELLERS):04d}",
+                    fecha=start + timedelta(seconds=rng.randrange(DAYS * 86400)),
+                    unidades=sum(linea.cantidad for linea in propias),
+                    subtotal=sum(linea.subtotal for linea in propias),
+                    iva_total=sum(linea.iva_monto for linea in propias),
+                    total=sum(linea.total for linea in propias),
+                )
+            )
+            lineas.append(propias)
+        with transaction.atomic():
+            Venta.objects.bulk_create(ventas)
+            for venta, propias in zip(ventas, lineas):
+                for linea in propias:
+                    linea.venta = venta
+            LineaVenta.objects.bulk_create(
+                linea for propias in lineas for linea in propias
+            )
+
+
+def main():
+    setup()
+
+    from django.db.models import Sum
+    from django.db.models.functions import TruncDate, TruncMonth
+    from django.utils import timezone
+
+    from apps.productos.models import Producto
+    from apps.ventas import reportes, resumenes
+    from apps.ventas.models import LineaVenta, ResumenVentaProducto, Venta
+
+    productos = Producto.objects.bulk_create(
+        Producto(
+            nombre=f"Producto {i}",
+            descripcion="-",
+            precio=Decimal(random.randint(100, 5000)) / 100,
+            iva=random.choice([0, 15]),
+        )
+        for i in range(PRODUCTS)
+    )
+    start = timezone.now() - timedelta(days=DAYS)
+    desde, hasta = timezone.localdate(start), timezone.localdate()
+
+    def raw_por_producto():
+        return list(
+            LineaVenta.objects.filter(venta__fecha__gte=start)
+            .annotate(periodo=TruncMonth("venta__fecha"))
+            .values("periodo", "producto_id")
+            .annotate(Sum("cantidad"), Sum("total"))
+            .order_by()
+        )
+
+    def raw_diario():
+        return list(
+            Venta.objects.filter(fecha__gte=start)
+            .annotate(periodo=TruncDate("fecha"))
+            .values("periodo")
+            .annotate(Sum("unidades"), Sum("total"))
+            .order_by()
+        )
+
+    def rollup(dimension, periodo):
+        return lambda: reportes.reporte(dimension, periodo, desde, hasta)
+
+    rows, loaded = [], 0
+    for size in map(int, SIZES.split(",")):
+        populate(productos, size - loaded, start)
+        loaded = LineaVenta.objects.count()
+        resumenes.reconstruir()
+        rollup_rows = ResumenVentaProducto.objects.count()
+        for label, raw, fast in [
+            ("producto/mes", raw_por_producto, rollup("producto", "mes")),
+            ("total/día", raw_diario, rollup("total", "dia")),
+        ]:
+            raw_time = measure(raw, repeat=3)["median"]
+            fast_time = measure(fast, repeat=5)["median"]
+            rows.append(
+                (
+                    f"{loaded:,}",
+                    label,
+                    f"{rollup_rows:,}",
+                    f"{raw_time * 1000:.1f}",
+                    f"{fast_time * 1000:.1f}",
+                    f"{raw_time / fast_time:.0f}x",
+                )
+            )
+
+    report(
+        f"{PRODUCTS} products, {SELLERS} sellers, {DAYS} days",
+        ["lines", "report", "product rollups", "raw ms", "rollup ms", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
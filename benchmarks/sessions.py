@@ -0,0 +1,83 @@
+"""
+Session write amplification: the old production setup (database sessions
+saved on every request) against cached_db sessions refreshed by
+SessionRefreshMiddleware.
+
+    python -m benchmarks.sessions [requests]
+"""
+
+import sys
+
+from benchmarks.harness import report, setup
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def session_writes(queries):
+    return sum(
+        1
+        for query in queries
+        if "django_session" in query["sql"]
+        and query["sql"].lstrip().startswith(("INSERT", "UPDATE"))
+    )
+
+
+def run(overrides):
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    with override_settings(CACHES=LOCMEM_CACHE, **overrides(settings)):
+        client = Client()
+        session = client.session
+        session["carrito"] = [1, 2, 3]
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(REQUESTS):
+                client.get("/productos/")
+        return session_writes(queries), len(queries)
+
+
+def main():
+    setup()
+
+    def before(settings):
+        middleware = [
+            m
+            for m in settings.MIDDLEWARE
+            if m != "apps.core.middleware.SessionRefreshMiddleware"
+        ]
+        return {
+            "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+            "SESSION_SAVE_EVERY_REQUEST": True,
+            "MIDDLEWARE": middleware,
+        }
+
+    def after(settings):
+        return {
+            "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+            "SESSION_SAVE_EVERY_REQUEST": False,
+        }
+
+    rows = []
+    for label, overrides in [
+        ("db, SAVE_EVERY_REQUEST", before),
+        ("cached_db + refresh", after),
+    ]:
+        writes, total = run(overrides)
+        rows.append((label, REQUESTS, writes, total, f"{writes / REQUESTS:.3f}"))
+
+    report(
+        "Session writes per request (/productos/)",
+        ["mode", "requests", "session writes", "total queries", "writes/request"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Cold start: interpreter launch, django.setup() and the first request served
+through the WSGI handler, each run in a fresh process, for the full
+settings and the admin-less worker role. ``manage.py check`` shows what a
+management command pays for the system checks (URLconf, every view and
+form module, Pillow); the maintenance commands skip them.
+
+    python -m benchmarks.startup [runs]
+
+The first request is GET / on the home page, which needs no database.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.harness import report
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+SETTINGS = ["cosmeticos_store.settings_production", "cosmeticos_store.settings_worker"]
+
+CHILD = """
+import time
+start = time.perf_counter()
+import io, json, os, sys
+os.environ["DJANGO_SETTINGS_MODULE"] = sys.argv[1]
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+from django.conf import settings
+environ = {
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": "/",
+    "SERVER_NAME": "localhost",
+    "SERVER_PORT": "443",
+    "SERVER_PROTOCOL": "HTTP/1.1",
+    "HTTP_HOST": settings.ALLOWED_HOSTS[0],
+    "HTTP_X_FORWARDED_PROTO": "https",
+    "wsgi.url_scheme": "https",
+    "wsgi.input": io.BytesIO(),
+    "wsgi.errors": sys.stderr,
+}
+status = []
+b"".join(application(environ, lambda s, headers: status.append(s)))
+served = time.perf_counter()
+print(json.dumps({
+    "setup": ready - start,
+    "first": served - start,
+    "status": status[0],
+    "modules": len(sys.modules),
+}))
+"""
+
+
+def child(settings_module):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, settings_module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    data = json.loads(result.stdout)
+    data["wall"] = time.perf_counter() - start
+    return data
+
+
+def command(settings_module):
+    start = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "manage.py",
+            "check",
+            f"--settings={settings_module}",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def ms(values):
+    return f"{statistics.median(values) * 1000:.0f}"
+
+
+def main():
+    runs = {settings_module: [] for settings_module in SETTINGS}
+    checks = {settings_module: [] for settings_module in SETTINGS}
+    # Interleave the roles so machine noise affects both alike.
+    for _ in range(RUNS):
+        for settings_module in SETTINGS:
+            runs[settings_module].append(child(settings_module))
+            checks[settings_module].append(command(settings_module))
+
+    rows = []
+    for settings_module in SETTINGS:
+        results = runs[settings_module]
+        assert results[0]["status"].startswith("200"), results[0]["status"]
+        rows.append(
+            (
+                settings_module.rsplit(".", 1)[-1],
+                ms([run["setup"] for run in results]),
+                ms([run["first"] for run in results]),
+                ms([run["wall"] for run in results]),
+                results[0]["modules"],
+                ms(checks[settings_module]),
+            )
+        )
+
+    report(
+        f"Median of {RUNS} cold starts (ms)",
+        ["settings", "setup", "first request", "process", "modules", "check"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
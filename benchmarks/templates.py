@@ -0,0 +1,94 @@
+"""
+Form page render time with and without the cached template loader, and
+the first request a worker serves with and without the boot warm-up
+(apps.core.templating.warm_templates).
+
+    python -m benchmarks.templates [requests]
+"""
+
+import sys
+import time
+
+from benchmarks.harness import measure, report, setup
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+PAGES = [
+    "/productos/create/",
+    "/trabajadores/create/",
+    "/proveedores/create/",
+    "/nosotros/create/",
+    "/ventas/create/",
+]
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+def templates(settings, loaders):
+    engine = settings.TEMPLATES[0]
+    return [
+        {
+            **engine,
+            "APP_DIRS": False,
+            "OPTIONS": {**engine["OPTIONS"], "loaders": loaders},
+        }
+    ]
+
+
+def main():
+    setup()
+
+    from django.conf import settings
+    from django.test import Client, override_settings
+
+    from apps.core.templating import warm_templates
+
+    client = Client()
+    uncached = templates(settings, LOADERS)
+    cached = templates(settings, [("django.template.loaders.cached.Loader", LOADERS)])
+
+    def first_request(config, warm):
+        # override_settings resets the template engines: a fresh worker.
+        with override_settings(TEMPLATES=config):
+            if warm:
+                warm_templates()
+            start = time.perf_counter()
+            client.get(PAGES[0])
+            return time.perf_counter() - start
+
+    rows = []
+    for label, config, warm in [
+        ("uncached", uncached, False),
+        ("cached", cached, False),
+        ("cached + warm-up", cached, True),
+    ]:
+        first = min(first_request(config, warm) for _ in range(5))
+        with override_settings(TEMPLATES=config):
+            if warm:
+                warm_templates()
+            for page in PAGES:
+                client.get(page)
+            steady = {
+                page: measure(lambda: client.get(page), repeat=5, number=REQUESTS)
+                for page in PAGES
+            }
+        rows.append(
+            (
+                label,
+                f"{first * 1000:.1f}",
+                *(f"{steady[page]['median'] * 1000:.2f}" for page in PAGES),
+            )
+        )
+
+    report(
+        f"Milliseconds per request ({REQUESTS} requests x 5 rounds per page)",
+        ["loader", "first request", *PAGES],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
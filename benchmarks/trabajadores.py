@@ -0,0 +1,74 @@
+"""
+Type-ahead latency of the staff directory search (apps.trabajadores.busqueda)
+as the number of workers grows, for name, surname, cédula and code prefixes.
+
+The prefix indexes of Trabajador.Meta only serve the search on PostgreSQL;
+SQLite compiles istartswith to a LIKE they do not cover, so every query is a
+table scan. Run against PostgreSQL (DJANGO_SETTINGS_MODULE)
+to measure the indexed path.
+
+    python -m benchmarks.trabajadores [sizes]
+"""
+
+import random
+import sys
+
+from benchmarks.harness import measure, report, setup
+
+SIZES = sys.argv[1] if len(sys.argv) > 1 else "10000,100000"
+BATCH = 5000
+NOMBRES = ["Ana", "Luis", "María", "José", "Carmen", "Jorge", "Lucía", "Pedro"]
+APELLIDOS = ["Pérez", "Zambrano", "Torres", "Vera", "Mora", "Cedeño", "Ruiz"]
+QUERIES = ["ma", "ana pé", "zamb", "0900001", "EMP00012", "xyz"]
+
+
+def populate(start, count):
+    """Insert workers ``start`` to ``start + count`` in batches."""
+    from apps.trabajadores.models import Trabajador
+
+    rng = random.Random(start)
+    for offset in range(start, start + count, BATCH):
+        Trabajador.objects.bulk_create(
+            Trabajador(
+                nombre=f"{rng.choice(NOMBRES)}{i % 97}",
+                apellido=rng.choice(APELLIDOS),
+                correo=f"trabajador{i}@example.com",
+                cedula=f"{rng.randrange(1, 25):02d}{i:08d}",
+                codigo_empleado=f"EMP{i:06d}",
+            )
+            for i in range(offset, min(offset + BATCH, start + count))
+        )
+
+
+def main():
+    setup()
+
+    from django.db import connection
+
+    from apps.trabajadores import busqueda
+
+    rows, loaded = [], 0
+    for size in map(int, SIZES.split(",")):
+        populate(loaded, size - loaded)
+        loaded = size
+        for q in QUERIES:
+            times = measure(lambda: busqueda.buscar(q), repeat=5, number=20)
+            rows.append(
+                (
+                    f"{loaded:,}",
+                    q,
+                    len(busqueda.buscar(q)),
+                    f"{times['median'] * 1000:.2f}",
+                    f"{times['max'] * 1000:.2f}",
+                )
+            )
+
+    report(
+        f"Milliseconds per search on {connection.vendor}",
+        ["workers", "query", "results", "median ms", "max ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
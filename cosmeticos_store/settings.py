@@ -46,15 +46,25 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
+    "apps.core",
     "apps.trabajadores",
     "apps.empresa",
     "apps.productos",
     "apps.proveedores",
+    "apps.inventario",
+    "apps.ventas",
+    "apps.api",
 ]
 
 MIDDLEWARE = [
+    "apps.core.log.RequestLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.middleware.CompressionMiddleware",
+    "apps.core.middleware.PreloadLinkMiddleware",
+    "apps.core.middleware.ReplicaPinningMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "apps.core.middleware.SessionRefreshMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -96,6 +106,12 @@ DATABASES = {
     }
 }
 
+# Read replicas: aliases from DATABASES that serve reads. Writes, form views
+# and the requests right after a write stay on "default".
+DATABASE_ROUTERS = ["apps.core.routers.PrimaryReplicaRouter"]
+DATABASE_REPLICAS = []
+REPLICA_PIN_SECONDS = 5
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -139,6 +155,28 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Home page carousels: (image in the default storage, alt text). After
+# uploading the originals run ``manage.py carruseles`` to build the resized
+# variants, placeholders and the manifest the templates read.
+CAROUSELS = {
+    "empresa": [
+        ("carrusel/cosmetic-flat-lay.jpg", "Professional cosmetic products"),
+        ("carrusel/makeup-brushes.jpg", "Professional makeup brushes"),
+        ("carrusel/skincare-bottles.jpg", "Premium skincare products"),
+        (
+            "carrusel/professional-cosmetic-products.jpg",
+            "Professional cosmetic products",
+        ),
+    ],
+    "historia": [
+        ("carrusel/lipstick-collection.jpg", "Lipstick collection"),
+        ("carrusel/beauty-products-assortment.jpg", "Cosmetic products assortment"),
+        ("carrusel/beauty-products-minimal.jpg", "Minimal beauty products"),
+        ("carrusel/luxury-cosmetic-display.jpg", "Luxury cosmetic display"),
+    ],
+}
+CAROUSEL_WIDTHS = [480, 960, 1440]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
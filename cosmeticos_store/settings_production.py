@@ -1,9 +1,13 @@
 """
 Production settings for cosmeticos_store project.
 These settings prioritize security and performance for production deployment.
-All values are hardcoded for simplicity.
+All values are hardcoded for simplicity, except the object storage
+credentials, which are shared with the MinIO service in docker-compose.yml,
+and the Redis URL.
 """
 
+import os
+
 from .settings import *
 
 # SECURITY WARNING: keep the secret key used in production secret!
@@ -42,7 +46,12 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 # Session Security
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_AGE = 3600  # 1 hour
-SESSION_SAVE_EVERY_REQUEST = True
+# Sessions live in the shared Redis cache (CACHES below) and are written
+# through to PostgreSQL only when they change; SessionRefreshMiddleware renews the expiry once less than
+# SESSION_REFRESH_THRESHOLD seconds remain instead of on every request.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_THRESHOLD = 900  # 15 minutes
 
 # CSRF Protection
 CSRF_COOKIE_HTTPONLY = True
@@ -59,31 +68,107 @@ DATABASES = {
         "OPTIONS": {
             "sslmode": "require",
         },
-    }
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": "practicatpe2_prod",
+        "USER": "practicausr25",
+        "PASSWORD": "practic35_prod_secure",
+        "HOST": "localhost",
+        "PORT": "5433",
+        "OPTIONS": {
+            "sslmode": "require",
+        },
+        "TEST": {
+            "MIRROR": "default",
+        },
+    },
 }
 
+# List, detail and export reads go to the replicas (see apps.core.routers)
+DATABASE_REPLICAS = ["replica"]
+
+# Templates: explicit cached loader, and every project template compiled at
+# worker boot (see cosmeticos_store/wsgi.py and apps.core.templating).
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+TEMPLATE_WARMUP = True
+
 # Static files for production
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 # Media files for production
-MEDIA_ROOT = BASE_DIR / "media"
+# Uploads go to an S3-compatible bucket (apps.core.storage) served through the
+# CDN domain, so image URLs are built without touching the bucket.
+STORAGES = {
+    "default": {
+        "BACKEND": "apps.core.storage.S3Storage",
+        "OPTIONS": {
+            "bucket_name": "cosmeticos-media",
+            "endpoint_url": "http://localhost:9000",
+            "access_key": os.environ.get("MINIO_ROOT_USER", "practicausr25"),
+            "secret_key": os.environ.get("MINIO_ROOT_PASSWORD", "practic35"),
+            "location": "media",
+            "custom_domain": "media.cosmeticos-store.com",
+            "cache_control": "public, max-age=31536000, immutable",
+            "multipart_threshold": 8 * 1024 * 1024,
+            "max_concurrency": 8,
+        },
+    },
+    # collectstatic also writes the preload manifest (apps.core.preload).
+    "staticfiles": {
+        "BACKEND": "apps.core.preload.PreloadStaticFilesStorage",
+    },
+}
 
 # Logging configuration for production
+# JSON lines written by a background thread (apps.core.log).
+# Per-request INFO logs are sampled at LOG_REQUEST_SAMPLE_RATE; warnings and
+# errors are always kept.
+LOG_REQUEST_SAMPLE_RATE = 0.1
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
+        "json": {
+            "()": "apps.core.log.JsonFormatter",
+        },
         "verbose": {
             "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
             "style": "{",
         },
     },
+    "filters": {
+        "request_sample": {
+            "()": "apps.core.log.RequestSampleFilter",
+            "rate": LOG_REQUEST_SAMPLE_RATE,
+        },
+    },
     "handlers": {
         "file": {
             "level": "INFO",
-            "class": "logging.FileHandler",
+            # A factory, not "class": see apps.core.log.QueuedFileHandler.
+            # Rotated by logrotate (README), not by the workers.
+            "()": "apps.core.log.QueuedFileHandler",
             "filename": "django.log",
-            "formatter": "verbose",
+            "formatter": "json",
         },
         "console": {
             "level": "ERROR",
@@ -101,14 +186,22 @@ LOGGING = {
             "level": "INFO",
             "propagate": False,
         },
+        "apps.core.requests": {
+            "handlers": ["file", "console"],
+            "level": "INFO",
+            "filters": ["request_sample"],
+            "propagate": False,
+        },
     },
 }
 
 # Cache configuration for production
+# Shared by every worker: sessions, and the entries other modules invalidate
+# after a write, must not survive in one process once dropped in another.
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "cosmetics-store-cache",
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/1"),
     }
 }
 
@@ -125,8 +218,13 @@ USE_L10N = True
 
 # Additional security middleware
 MIDDLEWARE = [
+    "apps.core.log.RequestLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.middleware.CompressionMiddleware",
+    "apps.core.middleware.PreloadLinkMiddleware",
+    "apps.core.middleware.ReplicaPinningMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "apps.core.middleware.SessionRefreshMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -0,0 +1,10 @@
+"""
+Fast test profile: parallel processes and per-test timing on top of the
+SQLite test settings.
+
+    python manage.py test --settings=cosmeticos_store.settings_test_fast
+"""
+
+from .settings_test import *
+
+TEST_RUNNER = "cosmeticos_store.test_runner.FastTestRunner"
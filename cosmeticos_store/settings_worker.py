@@ -0,0 +1,12 @@
+"""
+Worker role: production settings without django.contrib.admin, for
+gunicorn workers that only serve the shop and the API and for cron-driven
+management commands. Skips importing the admin, every admin.py module and
+the auth forms at startup.
+
+    DJANGO_SETTINGS_MODULE=cosmeticos_store.settings_worker gunicorn ...
+"""
+
+from .settings_production import *
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "django.contrib.admin"]
@@ -0,0 +1,27 @@
+"""
+Test runner for the fast test profile (settings_test_fast).
+"""
+
+from django.test.runner import DiscoverRunner
+from django.utils.version import PY312
+
+
+class FastTestRunner(DiscoverRunner):
+    """
+    DiscoverRunner that defaults to one process per CPU core, each with its
+    own copy of the in-memory SQLite databases, and prints the slowest tests
+    at the end of the run (``--durations``, Python 3.12+).
+
+    Both defaults can be overridden on the command line, e.g.
+    ``--parallel 1 --durations 0``.
+    """
+
+    default_parallel = "auto"
+    default_durations = 15
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(parallel=cls.default_parallel)
+        if PY312:
+            parser.set_defaults(durations=cls.default_durations)
@@ -2,20 +2,27 @@
 URL configuration for cosmeticos_store project.
 """
 
+from django.apps import apps
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import TemplateView
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("", TemplateView.as_view(template_name="home.html"), name="home"),
     path("nosotros/", include("apps.empresa.urls")),
     path("trabajadores/", include("apps.trabajadores.urls")),
     path("productos/", include("apps.productos.urls")),
     path("proveedores/", include("apps.proveedores.urls")),
+    path("ventas/", include("apps.ventas.urls")),
+    path("api/", include("apps.api.urls")),
 ]
 
+# Worker roles (settings_worker) run without the admin.
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cosmeticos_store.settings")
 
 application = get_wsgi_application()
+
+# Compile every template before the (possibly forked) workers serve traffic.
+if getattr(settings, "TEMPLATE_WARMUP", False):
+    from apps.core.templating import warm_templates
+
+    warm_templates()
@@ -97,6 +97,10 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    // Type-ahead suggestions
+    document.querySelectorAll('input[data-autocomplete-url]').forEach(setupAutocomplete);
+    document.querySelectorAll('input[data-unique-url]').forEach(setupUniqueCheck);
+
     // Add fade-in animation to cards
     const cards = document.querySelectorAll('.card-cosmetic');
     cards.forEach((card, index) => {
@@ -106,6 +110,106 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 });
 
+// Suggestions for inputs with data-autocomplete-url, shown in the form's
+// .autocomplete-results list. Requests wait for a pause in typing and a new
+// keystroke aborts the one in flight, so only the latest answer is shown.
+function setupAutocomplete(input) {
+    const results = input.form.querySelector('.autocomplete-results');
+    const delay = 200;
+    const minLength = 2;
+    let timer = null;
+    let controller = null;
+
+    function hide() {
+        results.hidden = true;
+    }
+
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        if (controller) {
+            controller.abort();
+        }
+        const query = input.value.trim();
+        if (query.length < minLength) {
+            hide();
+            return;
+        }
+        timer = setTimeout(() => {
+            controller = new AbortController();
+            const url = input.dataset.autocompleteUrl + '?q=' + encodeURIComponent(query);
+            fetch(url, { signal: controller.signal, headers: { 'Accept': 'application/json' } })
+                .then(response => response.json())
+                .then(data => {
+                    results.replaceChildren(...data.results.map(item => {
+                        const link = document.createElement('a');
+                        link.href = item.url;
+                        link.className = 'list-group-item list-group-item-action';
+                        link.textContent = item.label;
+                        const detail = document.createElement('small');
+                        detail.className = 'text-muted ms-2';
+                        detail.textContent = item.detail;
+                        link.append(detail);
+                        return link;
+                    }));
+                    results.hidden = data.results.length === 0;
+                })
+                .catch(error => {
+                    if (error.name !== 'AbortError') {
+                        console.error('Error:', error);
+                    }
+                });
+        }, delay);
+    });
+
+    input.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') {
+            hide();
+        }
+    });
+    // Keep the list open while a suggestion is being clicked.
+    results.addEventListener('mousedown', e => e.preventDefault());
+    input.addEventListener('blur', hide);
+}
+
+// Flags inputs with data-unique-url whose value is already registered, before
+// the form is submitted. Same debounce and abort as the autocomplete; the
+// server still validates on submit.
+function setupUniqueCheck(input) {
+    const delay = 300;
+    const feedback = document.createElement('div');
+    feedback.className = 'invalid-feedback';
+    feedback.textContent = 'Este valor ya está registrado';
+    input.after(feedback);
+    let timer = null;
+    let controller = null;
+
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        if (controller) {
+            controller.abort();
+        }
+        input.classList.remove('is-invalid');
+        const value = input.value.trim();
+        if (!value) {
+            return;
+        }
+        timer = setTimeout(() => {
+            controller = new AbortController();
+            const url = input.dataset.uniqueUrl + '&valor=' + encodeURIComponent(value);
+            fetch(url, { signal: controller.signal, headers: { 'Accept': 'application/json' } })
+                .then(response => response.json())
+                .then(data => {
+                    input.classList.toggle('is-invalid', data.disponible === false);
+                })
+                .catch(error => {
+                    if (error.name !== 'AbortError') {
+                        console.error('Error:', error);
+                    }
+                });
+        }, delay);
+    });
+}
+
 // Utility function for AJAX calls (if needed)
 function makeAjaxCall(url, method = 'GET', data = null) {
     return fetch(url, {
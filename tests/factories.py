@@ -0,0 +1,68 @@
+"""
+factory_boy factories shared by the test suite.
+"""
+
+from decimal import Decimal
+
+import factory
+
+from apps.empresa.models import Empresa
+from apps.productos.models import Producto, ProductoProveedor
+from apps.proveedores.models import Proveedor
+from apps.trabajadores.models import Trabajador
+
+
+class TrabajadorFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Trabajador
+
+    nombre = factory.Faker("first_name", locale="es_ES")
+    apellido = factory.Faker("last_name", locale="es_ES")
+    correo = factory.LazyAttribute(
+        lambda t: f"{t.codigo_empleado.lower()}@cosmeticos.com"
+    )
+    cedula = factory.Sequence(lambda n: f"{1700000000 + n}")
+    codigo_empleado = factory.Sequence(lambda n: f"EMP{n:04d}")
+
+
+class EmpresaFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Empresa
+
+    nombre = "Cosméticos Bella"
+    direccion = "Calle Principal 123, Quito"
+    mision = "Proveer productos de belleza de alta calidad"
+    vision = "Ser la tienda líder en cosméticos del Ecuador"
+    anio_fundacion = 2010
+    ruc = factory.Sequence(lambda n: f"{1790000000001 + n}")
+
+
+class ProductoFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Producto
+
+    nombre = factory.Sequence(lambda n: f"Producto {n}")
+    descripcion = "Producto cosmético de prueba"
+    precio = Decimal("10.00")
+    iva = 15
+
+
+class ProveedorFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Proveedor
+
+    nombre = factory.Sequence(lambda n: f"Proveedor {n}")
+    descripcion = "Proveedor de cosméticos"
+    telefono = "+593-2-123-4567"
+    pais = "Ecuador"
+    correo = factory.Sequence(lambda n: f"ventas{n}@proveedor.com")
+    direccion = "Av. Amazonas 456, Quito"
+
+
+class ProductoProveedorFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ProductoProveedor
+
+    producto = factory.SubFactory(ProductoFactory)
+    proveedor = factory.SubFactory(ProveedorFactory)
+    costo = Decimal("6.00")
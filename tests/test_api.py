@@ -0,0 +1,163 @@
+"""
+Test cases for the read-only JSON API.
+"""
+
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.core.pagination import encode_cursor
+from apps.productos.models import Producto
+
+from .factories import (
+    EmpresaFactory,
+    ProductoFactory,
+    ProveedorFactory,
+    TrabajadorFactory,
+)
+
+HAS_MSGPACK = find_spec("msgpack") is not None
+
+
+class ApiTest(TestCase):
+    """Test cases for the API list and detail endpoints"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.productos = ProductoFactory.create_batch(5, precio="12.50")
+        cls.url = reverse("api:productos")
+
+    def test_list_from_values(self):
+        """Test the list shape and that it costs one query"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = response.json()
+        self.assertEqual(len(data["results"]), Producto.objects.count())
+        self.assertEqual(
+            list(data["results"][0]),
+            ["id", "nombre", "descripcion", "precio", "iva", "imagen"],
+        )
+        precios = {row["id"]: row["precio"] for row in data["results"]}
+        self.assertEqual(precios[self.productos[0].pk], "12.50")
+        self.assertIsNone(data["next"])
+
+    def test_cursor_pagination(self):
+        """Test walking forward and back with the cursor links"""
+        first = self.client.get(self.url, {"limit": 2}).json()
+        second = self.client.get(first["next"]).json()
+        back = self.client.get(second["previous"]).json()
+
+        ids = list(Producto.objects.order_by("pk").values_list("pk", flat=True))
+        self.assertEqual([r["id"] for r in first["results"]], ids[:2])
+        self.assertEqual([r["id"] for r in second["results"]], ids[2:4])
+        self.assertEqual(back["results"], first["results"])
+        self.assertIn("limit=2", first["next"])
+
+    def test_sparse_fieldsets(self):
+        """Test that fields= selects the columns and always keeps the id"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"fields": "nombre,precio"})
+
+        self.assertEqual(
+            list(response.json()["results"][0]), ["id", "nombre", "precio"]
+        )
+
+    def test_unknown_field_rejected(self):
+        """Test that unknown fields are a 400 error"""
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(self.url, {"fields": "nombre,costo"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Campos desconocidos: costo."})
+
+    def test_invalid_cursor_rejected(self):
+        """Test that a tampered cursor is a 400 error"""
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(self.url, {"cursor": "nope"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_with_invalid_values_rejected(self):
+        """Test that well-formed cursors with unusable ids are a 400 error"""
+        for values in [["abc"], [None], [[1]]]:
+            with self.subTest(values=values):
+                with self.assertLogs("django.request", "WARNING"):
+                    response = self.client.get(
+                        self.url, {"cursor": encode_cursor(values)}
+                    )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"error": "Cursor inválido."})
+
+    def test_etag_not_modified(self):
+        """Test conditional requests with If-None-Match"""
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        self.productos[0].nombre = "Renombrado"
+        self.productos[0].save()
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail(self):
+        """Test the detail endpoint and its 404"""
+        producto = self.productos[0]
+        url = reverse("api:producto", args=[producto.pk])
+
+        self.assertEqual(self.client.get(url).json()["nombre"], producto.nombre)
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(reverse("api:producto", args=[999999]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_file_fields_as_urls(self):
+        """Test that images are returned as URLs"""
+        producto = self.productos[0]
+        producto.imagen = SimpleUploadedFile("foto.jpg", b"data", "image/jpeg")
+        producto.save()
+
+        data = self.client.get(reverse("api:producto", args=[producto.pk])).json()
+        self.assertEqual(data["imagen"], producto.imagen.url)
+
+    def test_other_entities(self):
+        """Test the proveedores, trabajadores and empresa endpoints"""
+        proveedor = ProveedorFactory()
+        trabajador = TrabajadorFactory()
+        empresa = EmpresaFactory()
+
+        for name, obj, field in [
+            ("api:proveedores", proveedor, "pais"),
+            ("api:trabajadores", trabajador, "codigo_empleado"),
+            ("api:empresas", empresa, "ruc"),
+        ]:
+            with self.subTest(name):
+                results = self.client.get(reverse(name)).json()["results"]
+                row = next(row for row in results if row["id"] == obj.pk)
+                self.assertEqual(row[field], getattr(obj, field))
+
+    def test_unknown_format(self):
+        """Test that unknown encodings are a 406 error"""
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(self.url, {"format": "xml"})
+
+        self.assertEqual(response.status_code, 406)
+
+    @skipUnless(HAS_MSGPACK, "msgpack no está instalado")
+    def test_msgpack(self):
+        """Test the msgpack encoding through the Accept header"""
+        import msgpack
+
+        response = self.client.get(self.url, headers={"accept": "application/msgpack"})
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertIn("Accept", response["Vary"])
+        data = msgpack.unpackb(response.content)
+        self.assertEqual(len(data["results"]), Producto.objects.count())
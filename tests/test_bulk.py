@@ -0,0 +1,209 @@
+"""
+Test cases for bulk edit and bulk delete actions on the list pages.
+"""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.core.bulk import bulk_delete, bulk_update, chunked
+from apps.productos.models import Producto
+from apps.proveedores.models import Proveedor
+from apps.trabajadores.models import Trabajador
+
+from .factories import ProductoFactory
+
+
+class BulkServiceTest(TestCase):
+    """Test cases for the set-based bulk helpers"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        Producto.objects.all().delete()
+        cls.productos = ProductoFactory.create_batch(5, iva=15)
+
+    def test_chunked(self):
+        """Test that chunked splits an iterable into bounded lists"""
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_bulk_update_single_statement(self):
+        """Test that a small selection is updated with one UPDATE statement"""
+        queryset = Producto.objects.filter(pk__in=[p.pk for p in self.productos])
+
+        with CaptureQueriesContext(connection) as queries:
+            updated = bulk_update(queryset, iva=0)
+
+        statements = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(updated, 5)
+        self.assertFalse(Producto.objects.filter(iva=15).exists())
+
+    def test_bulk_update_batched(self):
+        """Test that batched mode updates every row in pk batches"""
+        updated = bulk_update(Producto.objects.filter(iva=15), batch_size=2, iva=0)
+
+        self.assertEqual(updated, 5)
+        self.assertFalse(Producto.objects.filter(iva=15).exists())
+
+    def test_bulk_delete_batched(self):
+        """Test that batched mode deletes every selected row"""
+        deleted = bulk_delete(Producto.objects.all(), batch_size=2)
+
+        self.assertEqual(deleted, 5)
+        self.assertFalse(Producto.objects.exists())
+
+
+class ProductoBulkViewTest(TestCase):
+    """Test cases for ProductoBulkView"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.url = reverse("productos:bulk")
+        cls.labial = ProductoFactory(nombre="Labial Nude", precio="20.00", iva=15)
+        cls.serum = ProductoFactory(nombre="Sérum Noche", precio="40.00", iva=0)
+
+    def test_preview_shows_count_without_changes(self):
+        """Test that the first POST previews the action and changes nothing"""
+        response = self.client.post(
+            self.url,
+            {"accion": "eliminar", "ids": [self.labial.pk, self.serum.pk]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["total"], 2)
+        self.assertContains(response, 'name="confirmar"')
+        self.assertTrue(Producto.objects.filter(pk=self.labial.pk).exists())
+
+    def test_price_change_percentage(self):
+        """Test percentage price change on the selected products"""
+        response = self.client.post(
+            self.url,
+            {
+                "accion": "precio",
+                "porcentaje": "10",
+                "ids": [self.labial.pk, self.serum.pk],
+                "confirmar": "1",
+            },
+        )
+
+        self.assertRedirects(response, reverse("productos:list"))
+        self.labial.refresh_from_db()
+        self.serum.refresh_from_db()
+        self.assertEqual(self.labial.precio, Decimal("22.00"))
+        self.assertEqual(self.serum.precio, Decimal("44.00"))
+
+    def test_iva_reassignment(self):
+        """Test IVA reassignment on the selected products only"""
+        self.client.post(
+            self.url,
+            {"accion": "iva", "iva": "0", "ids": [self.labial.pk], "confirmar": "1"},
+        )
+
+        self.labial.refresh_from_db()
+        self.assertEqual(self.labial.iva, 0)
+
+    def test_bulk_delete_selected(self):
+        """Test deleting the selected products in one action"""
+        self.client.post(
+            self.url,
+            {
+                "accion": "eliminar",
+                "ids": [self.labial.pk, self.serum.pk],
+                "confirmar": "1",
+            },
+        )
+
+        self.assertFalse(
+            Producto.objects.filter(pk__in=[self.labial.pk, self.serum.pk]).exists()
+        )
+
+    def test_price_change_requires_percentage(self):
+        """Test that a price change without percentage is rejected"""
+        response = self.client.post(
+            self.url,
+            {"accion": "precio", "ids": [self.labial.pk], "confirmar": "1"},
+        )
+
+        self.assertRedirects(response, reverse("productos:list"))
+        self.labial.refresh_from_db()
+        self.assertEqual(self.labial.precio, Decimal("20.00"))
+
+    def test_price_change_out_of_range_rejected(self):
+        """Test percentages that would zero or overflow a selected price"""
+        caro = ProductoFactory(precio="10000000.00")
+        for porcentaje in ["-99.99", "999.99"]:
+            with self.subTest(porcentaje=porcentaje):
+                response = self.client.post(
+                    self.url,
+                    {
+                        "accion": "precio",
+                        "porcentaje": porcentaje,
+                        "ids": [self.labial.pk, caro.pk],
+                        "confirmar": "1",
+                    },
+                )
+
+                self.assertRedirects(response, reverse("productos:list"))
+                self.labial.refresh_from_db()
+                caro.refresh_from_db()
+                self.assertEqual(self.labial.precio, Decimal("20.00"))
+                self.assertEqual(caro.precio, Decimal("10000000.00"))
+
+    def test_empty_selection_rejected(self):
+        """Test that an action without selection does nothing"""
+        response = self.client.post(self.url, {"accion": "eliminar", "confirmar": "1"})
+
+        self.assertRedirects(response, reverse("productos:list"))
+        self.assertTrue(Producto.objects.filter(pk=self.labial.pk).exists())
+
+    def test_list_view_renders_bulk_toolbar(self):
+        """Test that the product list offers the bulk toolbar"""
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertContains(response, 'id="bulk-form"')
+        self.assertContains(response, f'name="ids" value="{self.labial.pk}"')
+
+
+class BulkDeleteViewTest(TestCase):
+    """Test cases for bulk delete of suppliers and workers"""
+
+    def test_proveedor_bulk_delete(self):
+        """Test bulk delete of suppliers"""
+        proveedor = Proveedor.objects.create(
+            nombre="Avon",
+            descripcion="Proveedor",
+            telefono="0999999999",
+            pais="Ecuador",
+            correo="ventas@avon.com",
+            direccion="Quito",
+        )
+
+        self.client.post(
+            reverse("proveedores:bulk"),
+            {"accion": "eliminar", "ids": [proveedor.pk], "confirmar": "1"},
+        )
+
+        self.assertFalse(Proveedor.objects.exists())
+
+    def test_trabajador_bulk_delete_all(self):
+        """Test bulk delete of every worker with the select-all option"""
+        for i in range(3):
+            Trabajador.objects.create(
+                nombre="Ana",
+                apellido=f"Ruiz {i}",
+                correo=f"ana{i}@cosmeticos.com",
+                cedula=f"17000000{i}",
+                codigo_empleado=f"EMP10{i}",
+            )
+
+        self.client.post(
+            reverse("trabajadores:bulk"),
+            {"accion": "eliminar", "todos": "on", "confirmar": "1"},
+        )
+
+        self.assertFalse(Trabajador.objects.exists())
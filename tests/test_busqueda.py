@@ -0,0 +1,131 @@
+"""
+Test cases for the staff directory type-ahead search.
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.trabajadores import busqueda
+
+from .factories import TrabajadorFactory
+
+
+class BuscarTest(TestCase):
+    """Test cases for busqueda.buscar"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.ana = TrabajadorFactory(
+            nombre="Ana",
+            apellido="Pérez",
+            cedula="0912345678",
+            codigo_empleado="EMP001",
+        )
+        cls.anabel = TrabajadorFactory(
+            nombre="Anabel",
+            apellido="Ruiz",
+            cedula="1712345678",
+            codigo_empleado="EMP002",
+        )
+        cls.luis = TrabajadorFactory(
+            nombre="Luis",
+            apellido="Zambrano",
+            cedula="0998765432",
+            codigo_empleado="VEN010",
+        )
+
+    def nombres(self, q):
+        return [trabajador["nombre"] for trabajador in busqueda.buscar(q)]
+
+    def test_prefix_of_every_field(self):
+        """Test prefixes of name, surname, cédula and code, any case"""
+        self.assertEqual(self.nombres("ana"), ["Ana", "Anabel"])
+        self.assertEqual(self.nombres("ZAM"), ["Luis"])
+        self.assertEqual(self.nombres("09"), ["Ana", "Luis"])
+        self.assertEqual(self.nombres("emp00"), ["Ana", "Anabel"])
+        self.assertEqual(self.nombres("ven"), ["Luis"])
+
+    def test_terms_are_combined(self):
+        """Test that every term must match some field"""
+        self.assertEqual(self.nombres("ana ru"), ["Anabel"])
+        self.assertEqual(self.nombres("ana 09"), ["Ana"])
+        self.assertEqual(self.nombres("ana luis"), [])
+
+    def test_only_prefixes(self):
+        """Test that infixes and LIKE wildcards do not match"""
+        self.assertEqual(self.nombres("bel"), [])
+        self.assertEqual(self.nombres("%na"), [])
+        self.assertEqual(self.nombres("EMP_01"), [])
+
+    def test_short_queries(self):
+        """Test that one character returns nothing without querying"""
+        with self.assertNumQueries(0):
+            self.assertEqual(busqueda.buscar("a"), [])
+            self.assertEqual(busqueda.buscar("  "), [])
+
+    def test_limit(self):
+        """Test the number of suggestions"""
+        self.assertEqual(len(busqueda.buscar("an", limit=1)), 1)
+
+
+class TrabajadorBuscarViewTest(TestCase):
+    """Test cases for the search endpoint and the list filter"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.ana = TrabajadorFactory(
+            nombre="Ana",
+            apellido="Pérez",
+            cedula="0912345678",
+            codigo_empleado="EMP001",
+        )
+        TrabajadorFactory.create_batch(10, nombre="Luis")
+
+    def test_suggestions(self):
+        """Test the JSON suggestions in one query"""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("trabajadores:buscar"), {"q": "ana p"})
+
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "id": self.ana.pk,
+                    "nombre": "Ana",
+                    "apellido": "Pérez",
+                    "cedula": "0912345678",
+                    "codigo_empleado": "EMP001",
+                    "label": "Ana Pérez",
+                    "detail": "0912345678 · EMP001",
+                    "url": reverse("trabajadores:update", args=[self.ana.pk]),
+                }
+            ],
+        )
+
+    def test_list_filter(self):
+        """Test ?q= on the list, kept by the pagination links"""
+        url = reverse("trabajadores:list")
+
+        response = self.client.get(url, {"q": "ana"})
+        self.assertEqual(list(response.context["trabajadores"]), [self.ana])
+        self.assertContains(response, 'value="ana"')
+
+        response = self.client.get(url, {"q": "luis"})
+        self.assertContains(response, "?q=luis&amp;page=2")
+
+        response = self.client.get(url, {"q": "nadie"})
+        self.assertContains(response, "No se encontraron trabajadores")
+
+    def test_prefix_indexes(self):
+        """Test the PostgreSQL prefix indexes created by migration 0003"""
+        if connection.vendor != "postgresql":
+            self.skipTest("Índices solo en PostgreSQL")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname LIKE %s",
+                ["trabajador_%_prefix_idx"],
+            )
+            self.assertEqual(len(cursor.fetchall()), 4)
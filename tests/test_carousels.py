@@ -0,0 +1,156 @@
+"""
+Test cases for the home page carousel manifest.
+"""
+
+import re
+from io import BytesIO, StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from PIL import Image
+
+from apps.core import carousels
+
+IN_MEMORY_STORAGE = {
+    "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+CAROUSELS = {
+    "portada": [
+        ("carrusel/ancha.png", "Foto ancha"),
+        ("carrusel/falta.jpg", "Sin subir"),
+    ],
+    "pequeno": [("carrusel/mini.png", "Mini")],
+}
+
+
+def png(size, color="pink"):
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return ContentFile(buffer.getvalue())
+
+
+def sin_hash(name):
+    """Variant names without their digest: 'ancha-480w-<digest>.jpg' -> 'ancha-480w.jpg'"""
+    return re.sub(r"-[0-9a-f]{16}\.jpg", ".jpg", name)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    CAROUSELS=CAROUSELS,
+    CAROUSEL_WIDTHS=[960, 480, 3000],
+)
+class CarouselManifestTest(TestCase):
+    """Test cases for apps.core.carousels"""
+
+    def setUp(self):
+        # A fresh storage per test.
+        self.enterContext(override_settings(STORAGES=IN_MEMORY_STORAGE))
+        carousels.cache.clear()
+        default_storage.save("carrusel/ancha.png", png((2000, 1000)))
+        default_storage.save("carrusel/mini.png", png((300, 200)))
+
+    def test_build_variants_and_placeholders(self):
+        """Test the dimensions, the narrower variants and the placeholder"""
+        manifest, missing = carousels.build()
+
+        self.assertEqual(missing, ["carrusel/falta.jpg"])
+        ancha = manifest["carrusel/ancha.png"]
+        self.assertEqual((ancha["width"], ancha["height"]), (2000, 1000))
+        self.assertEqual(
+            [[sin_hash(name), width] for name, width in ancha["variants"]],
+            [["carrusel/ancha-480w.jpg", 480], ["carrusel/ancha-960w.jpg", 960]],
+        )
+        with default_storage.open(ancha["variants"][0][0]) as file:
+            self.assertEqual(Image.open(file).size, (480, 240))
+        self.assertTrue(ancha["placeholder"].startswith("data:image/jpeg;base64,"))
+        self.assertLess(len(ancha["placeholder"]), 1000)
+        # Never upscaled.
+        self.assertEqual(manifest["carrusel/mini.png"]["variants"], [])
+
+    def test_rebuild_keeps_names(self):
+        """Test that a second build reuses the variants it already stored"""
+        primero, _ = carousels.build()
+        _, antes = default_storage.listdir("carrusel")
+        segundo, _ = carousels.build()
+
+        self.assertEqual(segundo, primero)
+        self.assertEqual(default_storage.listdir("carrusel")[1], antes)
+        self.assertEqual(len(antes), 5)
+
+    def test_changed_image_gets_new_names(self):
+        """Test that new content never replaces a variant under its name"""
+        primero, _ = carousels.build()
+        default_storage.delete("carrusel/ancha.png")
+        default_storage.save("carrusel/ancha.png", png((2000, 1000), "gold"))
+        segundo, _ = carousels.build()
+
+        viejos = {w: name for name, w in primero["carrusel/ancha.png"]["variants"]}
+        nuevos = {w: name for name, w in segundo["carrusel/ancha.png"]["variants"]}
+        for width in (480, 960):
+            with self.subTest(width=width):
+                self.assertNotEqual(nuevos[width], viejos[width])
+                # Pages cached with the old manifest still find theirs.
+                self.assertTrue(default_storage.exists(viejos[width]))
+
+    def test_slides(self):
+        """Test the slide context, with and without a built manifest"""
+        self.assertEqual(
+            carousels.imagenes("pequeno"),
+            [{"src": "/media/carrusel/mini.png", "alt": "Mini"}],
+        )
+
+        carousels.build()
+        ancha, falta = carousels.imagenes("portada")
+
+        self.assertEqual((ancha["width"], ancha["height"]), (2000, 1000))
+        self.assertEqual(
+            sin_hash(ancha["srcset"]),
+            "/media/carrusel/ancha-480w.jpg 480w, /media/carrusel/ancha-960w.jpg "
+            "960w, /media/carrusel/ancha.png 2000w",
+        )
+        self.assertEqual(
+            falta, {"src": "/media/carrusel/falta.jpg", "alt": "Sin subir"}
+        )
+
+    def test_manifest_is_cached(self):
+        """Test that the manifest is read from the storage once"""
+        carousels.build()
+        carousels.imagenes("portada")
+        default_storage.delete(carousels.MANIFEST_NAME)
+
+        self.assertIn("srcset", carousels.imagenes("portada")[0])
+
+    def test_command(self):
+        """Test the carruseles management command"""
+        out, err = StringIO(), StringIO()
+
+        call_command("carruseles", stdout=out, stderr=err)
+
+        self.assertIn("2 imágenes procesadas, 2 variantes", out.getvalue())
+        self.assertIn("carrusel/falta.jpg", err.getvalue())
+
+
+@override_settings(STORAGES=IN_MEMORY_STORAGE)
+class HomeCarouselTest(TestCase):
+    """Test cases for the carousels on the home page"""
+
+    def test_one_slide_per_image(self):
+        """Test that every configured image renders as one dimensioned slide"""
+        default_storage.save("carrusel/lipstick-collection.jpg", png((1600, 900)))
+        carousels.build()
+
+        response = self.client.get(reverse("home"))
+
+        self.assertContains(response, 'class="carousel-item', count=8)
+        self.assertContains(response, 'width="1600" height="900"', count=1)
+        self.assertRegex(
+            response.content.decode(),
+            r"lipstick-collection-960w-[0-9a-f]{16}\.jpg 960w",
+        )
+        self.assertContains(response, 'loading="lazy"', count=6)
@@ -0,0 +1,168 @@
+"""
+Test cases for the Producto-Proveedor catalogue and keyset pagination.
+"""
+
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.pagination import KeysetPaginator, encode_cursor
+from apps.productos.models import Producto, ProductoProveedor
+
+from .factories import ProductoFactory, ProductoProveedorFactory, ProveedorFactory
+
+
+class ProductoListQueriesTest(TestCase):
+    """Test cases for supplier names on the product list"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        Producto.objects.all().delete()
+        cls.proveedores = ProveedorFactory.create_batch(3)
+        for producto in ProductoFactory.create_batch(10):
+            for proveedor in cls.proveedores[:2]:
+                ProductoProveedorFactory(producto=producto, proveedor=proveedor)
+
+    def test_list_shows_supplier_names(self):
+        """Test that each product card lists its suppliers"""
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertContains(response, self.proveedores[0].nombre, count=10)
+        self.assertNotContains(response, self.proveedores[2].nombre)
+
+    def test_list_query_count_is_constant(self):
+        """Test that supplier names do not cause one query per product"""
+        # count + page + suppliers prefetch
+        with self.assertNumQueries(3):
+            self.client.get(reverse("productos:list"))
+
+        ProductoProveedorFactory(
+            producto=ProductoFactory(nombre="Zafiro"), proveedor=self.proveedores[2]
+        )
+        with self.assertNumQueries(3):
+            self.client.get(reverse("productos:list"))
+
+
+class ProveedorDetailViewTest(TestCase):
+    """Test cases for ProveedorDetailView"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.proveedor = ProveedorFactory()
+        cls.url = reverse("proveedores:detail", kwargs={"pk": cls.proveedor.pk})
+        # Two products share a name so the pk tie-breaker is exercised.
+        nombres = [f"Producto {i:02d}" for i in range(24)] + ["Producto 05"]
+        for nombre in nombres:
+            ProductoProveedorFactory(
+                producto=ProductoFactory(nombre=nombre), proveedor=cls.proveedor
+            )
+        ProductoProveedorFactory(producto=ProductoFactory(nombre="Ajeno"))
+
+    def nombres(self, response):
+        return [s.producto.nombre for s in response.context["page_obj"]]
+
+    def test_first_page(self):
+        """Test that the first page lists 20 products in name order"""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.nombres(response)), 20)
+        self.assertEqual(self.nombres(response)[0], "Producto 00")
+        self.assertNotContains(response, "Ajeno")
+        self.assertContains(response, "?cursor=")
+
+    def test_next_and_previous_pages(self):
+        """Test walking forward and back with cursors"""
+        first = self.client.get(self.url)
+        next_cursor = first.context["page_obj"].next_cursor
+
+        with self.assertNumQueries(2):
+            second = self.client.get(self.url, {"cursor": next_cursor})
+        self.assertEqual(
+            self.nombres(second), [f"Producto {i:02d}" for i in range(19, 24)]
+        )
+        self.assertFalse(second.context["page_obj"].has_next())
+
+        back = self.client.get(
+            self.url, {"cursor": second.context["page_obj"].previous_cursor}
+        )
+        self.assertEqual(self.nombres(back), self.nombres(first))
+        self.assertFalse(back.context["page_obj"].has_previous())
+
+    def test_pages_cover_every_product_once(self):
+        """Test that keyset pages neither skip nor repeat rows"""
+        paginator = KeysetPaginator(
+            self.proveedor.suministros.all(), ("producto__nombre", "producto_id"), 7
+        )
+        seen, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            seen.extend(s.pk for s in page)
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(sorted(seen), sorted(set(seen)))
+        self.assertEqual(len(seen), 25)
+
+    def test_invalid_cursor(self):
+        """Test that a tampered cursor is rejected with 400"""
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(self.url, {"cursor": "no-es-un-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_with_invalid_values(self):
+        """Test that well-formed cursors with unusable values are rejected with 400"""
+        for values in [["x", "abc"], [None, None], ["x", None], ["x", [1]]]:
+            with self.subTest(values=values):
+                with self.assertLogs("django.request", "WARNING"):
+                    response = self.client.get(
+                        self.url, {"cursor": encode_cursor(values)}
+                    )
+                self.assertEqual(response.status_code, 400)
+
+
+class SincronizarCatalogoTest(TestCase):
+    """Test cases for Proveedor.sincronizar_catalogo"""
+
+    databases = {"default", "replica"}
+
+    def test_upserts_and_removes_entries(self):
+        """Test that the catalogue is replaced in one upsert and one delete"""
+        proveedor = ProveedorFactory()
+        labial, base, rubor = ProductoFactory.create_batch(3)
+        ProductoProveedorFactory(producto=labial, proveedor=proveedor, costo="5.00")
+        ProductoProveedorFactory(producto=base, proveedor=proveedor)
+
+        proveedor.sincronizar_catalogo({labial.pk: Decimal("4.50"), rubor.pk: 8})
+
+        self.assertEqual(
+            dict(proveedor.suministros.values_list("producto_id", "costo")),
+            {labial.pk: Decimal("4.50"), rubor.pk: Decimal("8.00")},
+        )
+        self.assertEqual(list(labial.proveedores.all()), [proveedor])
+        self.assertEqual(ProductoProveedor.objects.count(), 2)
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_writes_and_reads_on_primary(self):
+        """Test that the upsert and the delete both run on the primary"""
+        proveedor = ProveedorFactory()
+        labial, base = ProductoFactory.create_batch(2)
+        ProductoProveedorFactory(producto=base, proveedor=proveedor)
+
+        with self.assertNumQueries(0, using="replica"):
+            proveedor.sincronizar_catalogo({labial.pk: 3})
+
+        self.assertEqual(
+            list(
+                proveedor.suministros.using("default").values_list(
+                    "producto_id", flat=True
+                )
+            ),
+            [labial.pk],
+        )
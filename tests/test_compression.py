@@ -0,0 +1,151 @@
+"""
+Test cases for response compression.
+"""
+
+import gzip
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from apps.core import compression
+from apps.core.middleware import CompressionMiddleware
+
+from .factories import ProductoFactory
+
+BODY = "<p>Labial rojo mate</p>" * 100
+
+
+class NegotiateTest(TestCase):
+    """Test cases for compression.negotiate"""
+
+    def test_accept_encoding(self):
+        """Test q-values, wildcards and refusals"""
+        preferred = next(iter(compression.encoders()))
+        for header, expected in [
+            ("gzip, deflate", "gzip"),
+            ("GZIP;q=0.5, deflate", "gzip"),
+            ("gzip;q=0", None),
+            ("identity", None),
+            ("", None),
+            ("*", preferred),
+            ("gzip;q=0.1, *;q=0.5", preferred),
+            ("br;q=1, zstd;q=1, gzip;q=1", preferred),
+        ]:
+            with self.subTest(header=header):
+                self.assertEqual(compression.negotiate(header), expected)
+
+    def test_restricted_codings(self):
+        """Test that only the listed codings are chosen"""
+        self.assertEqual(compression.negotiate("br, gzip", ["gzip"]), "gzip")
+        self.assertIsNone(compression.negotiate("br", compression.PADDED))
+
+
+class PaddingTest(TestCase):
+    """Test cases for the random padding of compressed bodies"""
+
+    def lengths(self, coding):
+        return {len(compression.encoders()[coding](BODY.encode())) for _ in range(20)}
+
+    def test_gzip(self):
+        """Test that gzip lengths vary and the body survives"""
+        body = compression.encoders()["gzip"](BODY.encode())
+        self.assertEqual(gzip.decompress(body), BODY.encode())
+        self.assertGreater(len(self.lengths("gzip")), 1)
+
+    @skipUnless(find_spec("zstandard"), "zstandard is not installed")
+    def test_zstd(self):
+        """Test that zstd lengths vary and decoders skip the padding"""
+        import zstandard
+
+        body = compression.encoders()["zstd"](BODY.encode())
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        self.assertEqual(decompressor.decompress(body), BODY.encode())
+        self.assertGreater(len(self.lengths("zstd")), 1)
+
+
+class CompressionMiddlewareTest(TestCase):
+    """Test cases for CompressionMiddleware"""
+
+    def get(self, response, **headers):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(RequestFactory().get("/", headers=headers))
+
+    def test_page_is_gzipped(self):
+        """Test a full page: same bytes once decompressed, Vary set"""
+        url = reverse("home")
+        plain = self.client.get(url)
+
+        response = self.client.get(url, headers={"accept-encoding": "gzip"})
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(len(response.content), len(plain.content) // 3)
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertIn("Accept-Encoding", plain["Vary"])
+        self.assertNotIn("Content-Encoding", plain)
+
+    def test_etag_is_weakened(self):
+        """Test that API ETags stay usable for conditional requests"""
+        ProductoFactory.create_batch(10)
+        url = reverse("api:productos")
+        headers = {"accept-encoding": "gzip"}
+
+        response = self.client.get(url, headers=headers)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+        response = self.client.get(
+            url, headers={**headers, "if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_skipped_responses(self):
+        """Test streaming, encoded, no-transform, short and binary responses"""
+        encoded = HttpResponse(BODY)
+        encoded["Content-Encoding"] = "br"
+        no_transform = HttpResponse(BODY, headers={"Cache-Control": "no-transform"})
+        for response in [
+            StreamingHttpResponse(iter([BODY])),
+            encoded,
+            no_transform,
+            HttpResponse("<p>corto</p>"),
+            HttpResponse(BODY, content_type="image/png"),
+        ]:
+            with self.subTest(response=response):
+                result = self.get(response, accept_encoding="gzip")
+                self.assertNotEqual(result.get("Content-Encoding"), "gzip")
+
+    def test_secrets_use_padded_codings(self):
+        """Test that pages with a CSRF token or a cookie are padded"""
+        form = self.client.get(
+            reverse("productos:create"), headers={"accept-encoding": "br, zstd, gzip"}
+        )
+        cookie = HttpResponse(BODY)
+        cookie.set_cookie("sessionid", "secreto")
+        for response in [form, self.get(cookie, accept_encoding="br, zstd, gzip")]:
+            with self.subTest(response=response):
+                self.assertIn(response["Content-Encoding"], compression.PADDED)
+
+    def test_identical_bodies_compressed_once(self):
+        """Test that a repeated body reuses the cached compressed bytes"""
+        middleware = CompressionMiddleware(lambda request: HttpResponse(BODY))
+        request = RequestFactory().get("/", headers={"accept-encoding": "gzip"})
+
+        first = middleware(request).content
+        second = middleware(request).content
+
+        self.assertIs(first, second)
+        self.assertEqual(len(middleware.cache.entries), 1)
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used bodies are evicted"""
+        cache = compression.CompressedCache(max_bytes=8000)
+        for i in range(100):
+            cache.compress("gzip", f"{i}:{BODY}".encode())
+
+        self.assertLessEqual(cache.size, 8000)
+        self.assertLess(len(cache.entries), 100)
+        self.assertEqual(cache.size, sum(len(body) for body in cache.entries.values()))
@@ -0,0 +1,102 @@
+"""
+Test cases for canonical supplier phones and emails and duplicate detection.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.proveedores import contacto
+from apps.proveedores.models import Proveedor
+
+from .factories import ProveedorFactory
+
+
+class ContactoTest(TestCase):
+    """Test cases for contacto.telefono_e164 and contacto.correo_normalizado"""
+
+    def test_telefono_e164(self):
+        """Test international, national and unusable numbers"""
+        for telefono, pais, esperado in [
+            ("+593-2-123-4567", "EC", "+59321234567"),
+            ("+593 2 123 4567", "", "+59321234567"),
+            ("00593 2 123 4567", "CO", "+59321234567"),
+            ("(02) 123-4567", "EC", "+59321234567"),
+            ("099 123 4567", "EC", "+593991234567"),
+            ("1-555-123-4567", "US", "+15551234567"),
+            ("555.123.4567", "US", "+15551234567"),
+            ("06 1234 5678", "IT", "+390612345678"),
+            ("333 123 4567", "IT", "+393331234567"),
+            ("02 123 4567", "", ""),
+            ("+593 12", "EC", ""),
+            ("+1 234 567 890 123 456", "US", ""),
+            ("", "EC", ""),
+        ]:
+            with self.subTest(telefono=telefono, pais=pais):
+                self.assertEqual(contacto.telefono_e164(telefono, pais), esperado)
+
+    def test_correo_normalizado(self):
+        """Test that addresses are trimmed and lower-cased"""
+        self.assertEqual(
+            contacto.correo_normalizado(" Ventas@Loreal.EC "), "ventas@loreal.ec"
+        )
+
+    def test_save_fills_columns(self):
+        """Test the canonical columns on create and on partial saves"""
+        proveedor = ProveedorFactory(
+            pais="Ecuador", telefono="(02) 123-4567", correo="Ventas@Loreal.ec"
+        )
+        self.assertEqual(proveedor.telefono_e164, "+59321234567")
+        self.assertEqual(proveedor.correo_normalizado, "ventas@loreal.ec")
+
+        proveedor.pais = "Colombia"
+        proveedor.save(update_fields=["pais"])
+        proveedor.correo = "COMPRAS@loreal.ec"
+        proveedor.save(update_fields=["correo"])
+
+        proveedor.refresh_from_db()
+        self.assertEqual(proveedor.telefono_e164, "+5721234567")
+        self.assertEqual(proveedor.correo_normalizado, "compras@loreal.ec")
+
+
+class DuplicadosTest(TestCase):
+    """Test cases for contacto.duplicados and the proveedores_duplicados command"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.a = ProveedorFactory(
+            nombre="Dup A", telefono="+593 2 999 0000", correo="dup@x.ec"
+        )
+        cls.b = ProveedorFactory(
+            nombre="Dup B", telefono="(02) 999-0000", correo="DUP@x.ec "
+        )
+        cls.c = ProveedorFactory(
+            nombre="Dup C", telefono="02 999 0000", correo="otro@x.ec"
+        )
+
+    def test_groups(self):
+        """Test groups by phone and by email in two queries"""
+        with self.assertNumQueries(2):
+            telefonos = contacto.duplicados(Proveedor.objects.all(), "telefono")
+
+        self.assertEqual(
+            telefonos["+59329990000"],
+            [(self.a.pk, "Dup A"), (self.b.pk, "Dup B"), (self.c.pk, "Dup C")],
+        )
+        correos = contacto.duplicados(Proveedor.objects.all(), "correo")
+        self.assertEqual(
+            correos["dup@x.ec"], [(self.a.pk, "Dup A"), (self.b.pk, "Dup B")]
+        )
+        self.assertNotIn("otro@x.ec", correos)
+
+    def test_command(self):
+        """Test the command output for one field"""
+        stdout = StringIO()
+        call_command("proveedores_duplicados", campo=["correo"], stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("dup@x.ec", output)
+        self.assertIn(f"#{self.b.pk} Dup B", output)
+        self.assertNotIn("+59329990000", output)
@@ -0,0 +1,124 @@
+"""
+Test cases for the batch-aware data migration helpers.
+"""
+
+from importlib import import_module
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps
+from django.db import OperationalError, connection
+from django.test import TestCase
+
+from apps.core.data_migrations import (
+    batched_backfill,
+    bulk_update_by_key,
+    bulk_upsert,
+)
+from apps.productos.models import Producto
+
+sample_products = import_module("apps.productos.migrations.0002_add_sample_products")
+product_images = import_module("apps.productos.migrations.0003_update_product_images")
+
+
+class DataMigrationHelpersTest(TestCase):
+    """Test cases for bulk_upsert, bulk_update_by_key and batched_backfill"""
+
+    def setUp(self):
+        """Set up test data"""
+        Producto.objects.all().delete()
+        self.rows = [
+            {"nombre": f"Polvo {i}", "descripcion": "Polvo", "precio": 9, "iva": 15}
+            for i in range(5)
+        ]
+
+    def test_bulk_upsert_inserts_missing_rows(self):
+        """Test that bulk_upsert only inserts rows whose key is missing"""
+        Producto.objects.create(**{**self.rows[0], "precio": 1})
+
+        created, updated = bulk_upsert(Producto, self.rows, key="nombre", batch_size=2)
+
+        self.assertEqual((created, updated), (4, 0))
+        self.assertEqual(Producto.objects.get(nombre="Polvo 0").precio, 1)
+
+    def test_bulk_upsert_updates_existing_rows(self):
+        """Test that bulk_upsert updates the given fields on existing rows"""
+        Producto.objects.create(**{**self.rows[0], "precio": 1})
+
+        created, updated = bulk_upsert(
+            Producto, self.rows, key="nombre", update_fields=["precio"]
+        )
+
+        self.assertEqual((created, updated), (4, 1))
+        self.assertEqual(Producto.objects.get(nombre="Polvo 0").precio, 9)
+
+    def test_bulk_update_by_key(self):
+        """Test chunked updates by key, skipping unknown keys"""
+        bulk_upsert(Producto, self.rows, key="nombre")
+        values = {f"Polvo {i}": {"iva": 0} for i in range(3)}
+        values["No existe"] = {"iva": 0}
+
+        updated = bulk_update_by_key(Producto, "nombre", values, batch_size=2)
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(Producto.objects.filter(iva=0).count(), 3)
+
+    def test_batched_backfill_reports_progress(self):
+        """Test that backfills walk the queryset in batches with progress"""
+        bulk_upsert(Producto, self.rows, key="nombre")
+        out = StringIO()
+
+        done = batched_backfill(
+            Producto.objects.filter(iva=15),
+            lambda batch: batch.update(iva=0),
+            batch_size=2,
+            stdout=out,
+        )
+
+        self.assertEqual(done, 5)
+        self.assertFalse(Producto.objects.filter(iva=15).exists())
+        self.assertIn("backfill: 5/5", out.getvalue())
+
+    def test_batched_backfill_retries_lock_timeouts(self):
+        """Test that a batch failing with a lock timeout is retried"""
+        bulk_upsert(Producto, self.rows[:1], key="nombre")
+        apply = mock.Mock(side_effect=[OperationalError("lock timeout"), None])
+
+        done = batched_backfill(
+            Producto.objects.all(), apply, retry_delay=0, stdout=StringIO()
+        )
+
+        self.assertEqual(done, 1)
+        self.assertEqual(apply.call_count, 2)
+
+
+class SampleDataMigrationTest(TestCase):
+    """Test cases for the ported sample data migrations"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.schema_editor = SimpleNamespace(connection=connection)
+
+    def test_sample_products_are_idempotent(self):
+        """Test that the sample product migration can run repeatedly"""
+        sample_products.create_sample_products(apps, self.schema_editor)
+        sample_products.create_sample_products(apps, self.schema_editor)
+
+        self.assertEqual(
+            Producto.objects.filter(imagen__startswith="productos/samples/").count(),
+            10,
+        )
+
+    def test_product_images_roundtrip(self):
+        """Test that the image migration and its reverse update in bulk"""
+        sample_products.create_sample_products(apps, self.schema_editor)
+
+        product_images.remove_product_images(apps, self.schema_editor)
+        self.assertEqual(Producto.objects.filter(imagen="").count(), 10)
+
+        product_images.update_product_images(apps, self.schema_editor)
+        self.assertEqual(
+            Producto.objects.get(nombre="Perfume Floral Elegante 50ml").imagen.name,
+            "productos/samples/perfume.jpg",
+        )
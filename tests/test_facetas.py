@@ -0,0 +1,203 @@
+"""
+Test cases for supplier country codes and the per-country counts.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.proveedores import facetas, paises
+from apps.proveedores.models import FacetaPais, Proveedor
+
+from .factories import ProveedorFactory
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def conteos():
+    return dict(FacetaPais.objects.exclude(total=0).values_list("codigo", "total"))
+
+
+class PaisesTest(TestCase):
+    """Test cases for paises.codigo"""
+
+    def test_codigo(self):
+        """Test names, aliases and codes in any case and accents"""
+        for pais, codigo in [
+            ("Ecuador", "EC"),
+            ("  ecuador ", "EC"),
+            ("México", "MX"),
+            ("mexico", "MX"),
+            ("EE.UU.", "US"),
+            ("Estados Unidos", "US"),
+            ("USA", "US"),
+            ("Corea del Sur", "KR"),
+            ("fr", "FR"),
+            ("Atlántida", ""),
+            ("", ""),
+        ]:
+            with self.subTest(pais=pais):
+                self.assertEqual(paises.codigo(pais), codigo)
+
+
+class FacetasTest(TestCase):
+    """Test cases for the incremental per-country counts"""
+
+    def setUp(self):
+        facetas.recalcular()
+
+    def test_save_sets_codigo(self):
+        """Test that saving derives pais_codigo, also with update_fields"""
+        proveedor = ProveedorFactory(pais="Brasil")
+        self.assertEqual(proveedor.pais_codigo, "BR")
+
+        proveedor.pais = "Perú"
+        proveedor.save(update_fields=["pais"])
+
+        proveedor.refresh_from_db()
+        self.assertEqual(proveedor.pais_codigo, "PE")
+
+    def test_counts_follow_writes(self):
+        """Test creates, country changes and deletes, including bulk ones"""
+        base = conteos()
+        ecuador = ProveedorFactory.create_batch(3, pais="Ecuador")
+        ProveedorFactory(pais="Colombia")
+
+        proveedor = Proveedor.objects.get(pk=ecuador[0].pk)
+        proveedor.pais = "Colombia"
+        proveedor.save()
+        # Loaded without pais_codigo: the stored code is looked up on save.
+        proveedor = Proveedor.objects.only("pk", "nombre").get(pk=ecuador[1].pk)
+        proveedor.pais = "España"
+        proveedor.save()
+        Proveedor.objects.filter(pk=ecuador[2].pk).delete()
+
+        esperado = dict(base)
+        esperado["CO"] = base.get("CO", 0) + 2
+        esperado["ES"] = base.get("ES", 0) + 1
+        self.assertEqual(conteos(), esperado)
+
+        facetas.recalcular()
+        self.assertEqual(conteos(), esperado)
+
+    def test_bulk_delete_one_update_per_country(self):
+        """Test that a delete() of many suppliers adjusts each count once"""
+        base = conteos()
+        ProveedorFactory.create_batch(5, pais="Ecuador")
+        ProveedorFactory.create_batch(3, pais="Chile")
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks() as callbacks:
+                Proveedor.objects.filter(pais_codigo__in=["EC", "CL"]).delete()
+
+        updates = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('UPDATE "proveedores_facetapais"')
+        ]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(
+            conteos(),
+            {
+                codigo: total
+                for codigo, total in base.items()
+                if codigo not in ("EC", "CL")
+            },
+        )
+
+    def test_recalcular_command(self):
+        """Test that the command repairs counts after a QuerySet.update"""
+        ProveedorFactory(pais="Chile")
+        Proveedor.objects.filter(pais="Chile").update(pais_codigo="AR")
+
+        call_command("recalcular_facetas", stdout=StringIO())
+
+        self.assertEqual(conteos().get("AR"), 1)
+        self.assertNotIn("CL", conteos())
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ProveedorListFacetasTest(TestCase):
+    """Test cases for the country filter of the supplier list"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        Proveedor.objects.all().delete()
+        ProveedorFactory.create_batch(2, pais="Ecuador")
+        cls.mexico = ProveedorFactory(pais="México")
+        cls.url = reverse("proveedores:list")
+
+    def setUp(self):
+        facetas.cache.clear()
+
+    def test_filter(self):
+        """Test ?pais= and the counts shown for each country"""
+        response = self.client.get(self.url, {"pais": "mx"})
+
+        self.assertEqual(list(response.context["proveedores"]), [self.mexico])
+        self.assertEqual(
+            response.context["facetas"],
+            [
+                {"codigo": "EC", "nombre": "Ecuador", "total": 2},
+                {"codigo": "MX", "nombre": "México", "total": 1},
+            ],
+        )
+        self.assertContains(response, 'href="?pais=EC"')
+
+        response = self.client.get(self.url, {"pais": "PE"})
+        self.assertContains(response, "No hay proveedores de este país")
+
+    def test_counts_cached(self):
+        """Test that the counts cost no query once cached, until a write"""
+        facetas.por_pais()
+        with self.assertNumQueries(0):
+            facetas.por_pais()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProveedorFactory(pais="Ecuador")
+
+        self.assertEqual(facetas.por_pais()[0]["total"], 3)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=["replica"])
+class FacetasReplicaTest(TestCase):
+    """Test cases for the cached counts with a lagging replica"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        facetas.cache.clear()
+
+    def test_refill_reads_primary(self):
+        """Test that the cache is refilled with the counts on the primary"""
+        ProveedorFactory(pais="Uruguay")
+
+        self.assertIn(
+            {"codigo": "UY", "nombre": "Uruguay", "total": 1}, facetas.por_pais()
+        )
+
+
+class CountRollbackTest(TransactionTestCase):
+    """Test cases for the counts when a supplier save fails"""
+
+    def test_failed_save_takes_count_back(self):
+        """Test that the row and its count roll back together"""
+
+        def falla(**kwargs):
+            raise RuntimeError("falla")
+
+        post_save.connect(falla, sender=Proveedor)
+        self.addCleanup(post_save.disconnect, falla, sender=Proveedor)
+
+        with self.assertRaises(RuntimeError):
+            ProveedorFactory(pais="Ecuador")
+
+        self.assertFalse(Proveedor.objects.exists())
+        self.assertEqual(conteos(), {})
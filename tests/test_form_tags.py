@@ -0,0 +1,137 @@
+"""
+Test cases for the compiled form_field and image_field template tags.
+"""
+
+import re
+from types import SimpleNamespace
+
+from django import forms
+from django.template import TemplateSyntaxError, engines
+from django.test import TestCase
+
+from apps.empresa.forms import EmpresaForm
+from apps.productos.forms import ProductoForm
+from apps.proveedores.forms import ProveedorForm
+from apps.trabajadores.forms import TrabajadorForm
+
+FORMS = [ProductoForm, ProveedorForm, TrabajadorForm, EmpresaForm]
+
+PAGES = {
+    "productos/create.html": ProductoForm,
+    "proveedores/create.html": ProveedorForm,
+    "proveedores/update.html": ProveedorForm,
+    "trabajadores/create.html": TrabajadorForm,
+    "trabajadores/update.html": TrabajadorForm,
+    "empresa/create.html": EmpresaForm,
+    "empresa/update.html": EmpresaForm,
+}
+
+IMAGEN = SimpleNamespace(imagen=SimpleNamespace(url="/media/a&b.jpg"))
+
+
+def render(source, **context):
+    return engines["django"].from_string(source).render(context)
+
+
+def as_include(source):
+    """The template as it was written with the shared includes."""
+    source = re.sub(
+        r"\{% form_field (\S+) ",
+        r"{% include 'shared/form_field.html' with field=\1 ",
+        source,
+    )
+    source = re.sub(
+        r"\{% image_field (\S+)",
+        r"{% include 'shared/image_field.html' with field=\1",
+        source,
+    )
+    return source.replace("object=object", "imagen=object.imagen")
+
+
+class FormFieldTagTest(TestCase):
+    """Test cases for the form_field and image_field tags"""
+
+    def assertSameMarkup(self, tag, **context):
+        source = "{% load form_tags %}" + tag
+        self.assertEqual(
+            render(source, **context), render(as_include(source), **context)
+        )
+
+    def test_fields_match_include(self):
+        """Test every field of the four forms, unbound and with errors"""
+        for form_class in FORMS:
+            for form in (form_class(), form_class(data={})):
+                form.is_valid()
+                for name in form.fields:
+                    with self.subTest(form=form_class.__name__, field=name):
+                        self.assertSameMarkup(
+                            '{% form_field field icon="fas fa-user" color="c" %}',
+                            field=form[name],
+                        )
+
+    def test_optional_arguments_match_include(self):
+        """Test col_class and help_text, escaped like {{ }}"""
+        form = ProductoForm(data={"nombre": "Labial", "precio": "-1"})
+        form.is_valid()
+        self.assertSameMarkup(
+            '{% form_field form.precio icon=icon color="c" col_class="col-md-6 mb-3"'
+            " help_text=help %}",
+            form=form,
+            icon='"><script>',
+            help="Precio <b>final</b>",
+        )
+
+    def test_image_field_matches_include(self):
+        """Test the image field with and without the current image"""
+        form = TrabajadorForm(data={})
+        form.is_valid()
+        for context in ({}, {"object": IMAGEN}, {"help": "Logo <png>"}):
+            with self.subTest(context=context):
+                self.assertSameMarkup(
+                    "{% image_field form.imagen object=object help_text=help %}",
+                    form=form,
+                    **context,
+                )
+
+    def test_image_taken_from_field_name(self):
+        """Test that the current image is the object's attribute named like the field"""
+
+        class LogoForm(forms.Form):
+            logo = forms.ImageField(required=False)
+
+        obj = SimpleNamespace(imagen=None, logo=SimpleNamespace(url="/media/logo.png"))
+        html = render(
+            "{% load form_tags %}{% image_field form.logo object=object %}",
+            form=LogoForm(),
+            object=obj,
+        )
+
+        self.assertIn('<img src="/media/logo.png"', html)
+
+    def test_pages_match_include(self):
+        """Test that whole create/update pages render the same bytes"""
+        engine = engines["django"].engine
+        for name, form_class in PAGES.items():
+            with self.subTest(page=name):
+                source = engine.get_template(name).source
+                form = form_class(data={})
+                form.is_valid()
+                # CreateView leaves object as None.
+                obj = IMAGEN if "update" in name else None
+                context = {"form": form, "object": obj}
+                self.assertIn("{% form_field", source)
+                self.assertEqual(
+                    render(source, **context), render(as_include(source), **context)
+                )
+
+    def test_syntax_errors(self):
+        """Test that bad arguments fail when the template is compiled"""
+        for tag in (
+            "{% form_field %}",
+            "{% form_field form.nombre icon='a' %}",
+            "{% form_field form.nombre icon='a' color='b' size=2 %}",
+            "{% form_field form.nombre 'a' 'b' %}",
+        ):
+            with self.subTest(tag=tag):
+                with self.assertRaises(TemplateSyntaxError):
+                    render("{% load form_tags %}" + tag)
@@ -14,15 +14,13 @@ from apps.trabajadores.forms import TrabajadorForm
 class TrabajadorFormTest(TestCase):
     """Test cases for TrabajadorForm"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Carlos",
-            "apellido": "Mendoza",
-            "correo": "carlos.mendoza@cosmeticos.com",
-            "cedula": "1234567890",
-            "codigo_empleado": "EMP001",
-        }
+    valid_data = {
+        "nombre": "Carlos",
+        "apellido": "Mendoza",
+        "correo": "carlos.mendoza@cosmeticos.com",
+        "cedula": "1234567890",
+        "codigo_empleado": "EMP001",
+    }
 
     def test_form_valid_with_complete_data(self):
         """Test form validation with all required fields"""
@@ -68,16 +66,14 @@ class TrabajadorFormTest(TestCase):
 class EmpresaFormTest(TestCase):
     """Test cases for EmpresaForm"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Cosméticos Premium",
-            "direccion": "Av. Principal 456, Guayaquil",
-            "mision": "Brindar productos de belleza de excelencia",
-            "vision": "Ser líderes en el mercado de cosméticos",
-            "anio_fundacion": 2015,
-            "ruc": "0987654321123",
-        }
+    valid_data = {
+        "nombre": "Cosméticos Premium",
+        "direccion": "Av. Principal 456, Guayaquil",
+        "mision": "Brindar productos de belleza de excelencia",
+        "vision": "Ser líderes en el mercado de cosméticos",
+        "anio_fundacion": 2015,
+        "ruc": "0987654321123",
+    }
 
     def test_form_valid_with_complete_data(self):
         """Test form validation with all required fields"""
@@ -105,14 +101,12 @@ class EmpresaFormTest(TestCase):
 class ProductoFormTest(TestCase):
     """Test cases for ProductoForm"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Base de Maquillaje Natural",
-            "descripcion": "Base líquida con cobertura natural para todo tipo de piel",
-            "precio": "35.50",
-            "iva": 15,
-        }
+    valid_data = {
+        "nombre": "Base de Maquillaje Natural",
+        "descripcion": "Base líquida con cobertura natural para todo tipo de piel",
+        "precio": "35.50",
+        "iva": 15,
+    }
 
     def test_form_valid_with_complete_data(self):
         """Test form validation with all required fields"""
@@ -156,16 +150,14 @@ class ProductoFormTest(TestCase):
 class ProveedorFormTest(TestCase):
     """Test cases for ProveedorForm"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Revlon Internacional",
-            "descripcion": "Proveedor de cosméticos premium y maquillaje profesional",
-            "telefono": "+1-555-123-4567",
-            "pais": "Estados Unidos",
-            "correo": "ventas@revlon.com",
-            "direccion": "237 Park Avenue, New York, NY 10017",
-        }
+    valid_data = {
+        "nombre": "Revlon Internacional",
+        "descripcion": "Proveedor de cosméticos premium y maquillaje profesional",
+        "telefono": "+1-555-123-4567",
+        "pais": "Estados Unidos",
+        "correo": "ventas@revlon.com",
+        "direccion": "237 Park Avenue, New York, NY 10017",
+    }
 
     def test_form_valid_with_complete_data(self):
         """Test form validation with all required fields"""
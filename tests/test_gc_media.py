@@ -0,0 +1,173 @@
+"""
+Test cases for the gc_media command and the Bloom filter behind it.
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.bloom import BloomFilter
+from apps.core.models import ReferenciaMedia
+
+from .factories import ProductoFactory, TrabajadorFactory
+
+IN_MEMORY_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+
+class BloomFilterTest(SimpleTestCase):
+    """Test cases for BloomFilter"""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present"""
+        bloom = BloomFilter(1000)
+        names = [f"productos/{i}.jpg" for i in range(1000)]
+        for name in names:
+            bloom.add(name)
+
+        self.assertTrue(all(name in bloom for name in names))
+
+    def test_false_positive_rate(self):
+        """Test that the false positive rate stays near the target"""
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"productos/{i}.jpg")
+
+        false_positives = sum(f"otros/{i}.jpg" in bloom for i in range(10000))
+
+        self.assertLess(false_positives, 300)
+
+
+class GcMediaCommandTest(TestCase):
+    """Test cases for the gc_media management command"""
+
+    def setUp(self):
+        """Set up test data in a fresh in-memory storage"""
+        self.enterContext(override_settings(STORAGES=IN_MEMORY_STORAGES))
+        self.kept = [
+            ProductoFactory(imagen=self.store("productos/labial.jpg")).imagen.name,
+            TrabajadorFactory(imagen=self.store("trabajadores/ana.jpg")).imagen.name,
+        ]
+        self.orphans = [
+            self.store("productos/viejo.jpg"),
+            self.store("productos/ab/huerfano.png"),
+            self.store("trabajadores/ex.jpg"),
+        ]
+
+    def store(self, name):
+        return default_storage.save(name, ContentFile(b"imagen"))
+
+    def gc_media(self, *args):
+        out = StringIO()
+        call_command("gc_media", "--min-age=0", *args, stdout=out)
+        return out.getvalue()
+
+    def test_deletes_only_orphans(self):
+        """Test that unreferenced files are deleted and referenced ones kept"""
+        output = self.gc_media("--workers=2", "--batch-size=2")
+
+        self.assertTrue(all(default_storage.exists(name) for name in self.kept))
+        self.assertFalse(any(default_storage.exists(name) for name in self.orphans))
+        self.assertIn("5 archivos revisados, 3 huérfanos, 3 eliminados", output)
+        self.assertIn("archivos/s", output)
+
+    def test_dry_run_changes_nothing(self):
+        """Test that a dry run only reports orphans"""
+        output = self.gc_media("--dry-run", "--verbosity=2")
+
+        self.assertTrue(all(default_storage.exists(name) for name in self.orphans))
+        self.assertIn("huérfano: productos/viejo.jpg", output)
+        self.assertIn("3 huérfanos (simulación)", output)
+
+    def test_quarantine_moves_orphans(self):
+        """Test that orphans are moved instead of deleted with --quarantine"""
+        self.gc_media("--quarantine=cuarentena")
+
+        self.assertFalse(default_storage.exists("productos/viejo.jpg"))
+        self.assertTrue(default_storage.exists("cuarentena/productos/viejo.jpg"))
+        self.assertTrue(all(default_storage.exists(name) for name in self.kept))
+
+    def test_bloom_filter_mode(self):
+        """Test that the Bloom filter mode keeps every referenced file"""
+        self.gc_media("--bloom")
+
+        self.assertTrue(all(default_storage.exists(name) for name in self.kept))
+        self.assertFalse(default_storage.exists("productos/viejo.jpg"))
+
+    def test_recent_files_are_skipped(self):
+        """Test that files newer than --min-age are left alone"""
+        out = StringIO()
+        call_command("gc_media", "--min-age=3600", stdout=out)
+
+        self.assertTrue(all(default_storage.exists(name) for name in self.orphans))
+        self.assertIn("0 huérfanos", out.getvalue())
+
+    def test_listing_times_skip_lookups(self):
+        """Test that times from the listing need no lookup per file"""
+        ayer = timezone.now() - timedelta(days=1)
+
+        def listdir_modified(path):
+            directories, files = default_storage.listdir(path)
+            return directories, [(name, ayer) for name in files]
+
+        with (
+            mock.patch.object(
+                default_storage,
+                "listdir_modified",
+                side_effect=listdir_modified,
+                create=True,
+            ),
+            mock.patch.object(default_storage, "get_modified_time") as lookup,
+        ):
+            call_command("gc_media", "--min-age=3600", stdout=StringIO())
+
+        lookup.assert_not_called()
+        self.assertFalse(any(default_storage.exists(name) for name in self.orphans))
+        self.assertTrue(all(default_storage.exists(name) for name in self.kept))
+
+    def test_blob_counted_after_snapshot_is_kept(self):
+        """Test that blobs are re-checked against their count before deletion"""
+        compartido = self.store(f"productos/aa/{'a' * 64}.png")
+        huerfano = self.store(f"productos/bb/{'b' * 64}.png")
+        # An upload of the same bytes counted after the references were read.
+        ReferenciaMedia.objects.create(nombre=compartido, total=1)
+
+        with mock.patch(
+            "apps.core.management.commands.gc_media.Command.referenced_names",
+            return_value=set(self.kept),
+        ):
+            self.gc_media()
+
+        self.assertTrue(default_storage.exists(compartido))
+        self.assertFalse(default_storage.exists(huerfano))
+        self.assertEqual(
+            list(ReferenciaMedia.objects.values_list("nombre", flat=True)),
+            [compartido],
+        )
+
+    def test_storage_errors_do_not_abort(self):
+        """Test that a failing delete is logged and the others still run"""
+        delete = default_storage.delete
+
+        def flaky_delete(name):
+            if name == "productos/viejo.jpg":
+                raise OSError("sin permiso")
+            delete(name)
+
+        with (
+            mock.patch.object(default_storage, "delete", side_effect=flaky_delete),
+            self.assertLogs("apps.core.management.commands.gc_media", "ERROR"),
+        ):
+            output = self.gc_media("--workers=2")
+
+        self.assertTrue(default_storage.exists("productos/viejo.jpg"))
+        self.assertFalse(default_storage.exists("trabajadores/ex.jpg"))
+        self.assertIn("2 eliminados, 1 con error", output)
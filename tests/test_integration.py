@@ -4,7 +4,7 @@ Tests the full user workflows and system integration.
 """
 
 from django.db import IntegrityError, transaction
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 
 from apps.empresa.models import Empresa
@@ -16,10 +16,6 @@ from apps.trabajadores.models import Trabajador
 class EndToEndIntegrationTest(TestCase):
     """Complete end-to-end integration tests"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
     def test_complete_cosmetics_store_workflow(self):
         """Test the complete workflow of the cosmetics store application"""
 
@@ -0,0 +1,177 @@
+"""
+Test cases for stock levels and the append-only stock ledger.
+Concurrency is exercised against PostgreSQL by benchmarks.inventario.
+"""
+
+from datetime import date, datetime, timezone
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from apps.inventario import stock
+from apps.inventario.models import MovimientoStock, Stock
+from apps.inventario.partitions import (
+    add_months,
+    ensure_monthly_partitions,
+    partition_name,
+)
+
+from .factories import ProductoFactory
+
+
+class StockServiceTest(TestCase):
+    """Test cases for the F()-guarded stock operations"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.labial, cls.base = ProductoFactory.create_batch(2)
+        stock.ingresar({cls.labial.pk: 10, cls.base.pk: 2}, referencia="compra-1")
+
+    def niveles(self, producto):
+        nivel = Stock.objects.get(pk=producto.pk)
+        return nivel.disponible, nivel.reservado
+
+    def test_ingresar_creates_and_increments(self):
+        """Test that received units create the stock row and add up"""
+        stock.ingresar({self.labial.pk: 5})
+
+        self.assertEqual(self.niveles(self.labial), (15, 0))
+
+    def test_reservar_and_confirmar(self):
+        """Test that reserved units leave the stock when confirmed"""
+        stock.reservar({self.labial.pk: 3}, referencia="venta-1")
+        self.assertEqual(self.niveles(self.labial), (7, 3))
+
+        stock.confirmar({self.labial.pk: 3}, referencia="venta-1")
+        self.assertEqual(self.niveles(self.labial), (7, 0))
+
+    def test_liberar_returns_reserved_units(self):
+        """Test that cancelling a reservation restores availability"""
+        stock.reservar({self.labial.pk: 4})
+        stock.liberar({self.labial.pk: 4})
+
+        self.assertEqual(self.niveles(self.labial), (10, 0))
+
+    def test_insufficient_stock_changes_nothing(self):
+        """Test that an order fails as a whole when one product is short"""
+        with self.assertRaises(stock.StockInsuficiente) as error:
+            stock.descontar({self.labial.pk: 1, self.base.pk: 3})
+
+        self.assertEqual(error.exception.producto_ids, [self.base.pk])
+        self.assertEqual(self.niveles(self.labial), (10, 0))
+        self.assertEqual(self.niveles(self.base), (2, 0))
+        self.assertFalse(MovimientoStock.objects.filter(tipo="salida").exists())
+
+    def test_cannot_confirm_more_than_reserved(self):
+        """Test that shipping is bounded by the reserved units"""
+        stock.reservar({self.labial.pk: 1})
+
+        with self.assertRaises(stock.StockInsuficiente):
+            stock.confirmar({self.labial.pk: 2})
+
+    def test_negative_quantities_rejected(self):
+        """Test that negative quantities cannot bypass the guards"""
+        with self.assertRaises(ValueError):
+            stock.descontar({self.labial.pk: -5})
+
+    def test_ledger_records_each_change(self):
+        """Test that each change appends one ledger row"""
+        stock.descontar({self.labial.pk: 2}, referencia="venta-2")
+
+        movimientos = MovimientoStock.objects.filter(producto=self.labial)
+        self.assertEqual(
+            list(movimientos.order_by("id").values_list("tipo", "cantidad")),
+            [("ingreso", 10), ("salida", 2)],
+        )
+        self.assertEqual(movimientos.latest("id").referencia, "venta-2")
+
+    def test_product_list_shows_stock(self):
+        """Test that the product list shows available stock"""
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertContains(response, "Stock: 10")
+
+
+class LedgerAppendOnlyTest(TestCase):
+    """Test cases for the append-only guarantees of MovimientoStock"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.producto = ProductoFactory()
+        stock.ingresar({self.producto.pk: 1})
+        self.movimiento = MovimientoStock.objects.get()
+
+    def test_update_rejected(self):
+        """Test that ledger rows cannot be modified"""
+        self.movimiento.cantidad = 99
+        with self.assertRaises(TypeError):
+            self.movimiento.save()
+        with self.assertRaises(TypeError):
+            MovimientoStock.objects.update(cantidad=99)
+
+    def test_delete_rejected(self):
+        """Test that ledger rows cannot be deleted"""
+        with self.assertRaises(TypeError):
+            self.movimiento.delete()
+        with self.assertRaises(TypeError):
+            MovimientoStock.objects.all().delete()
+
+    def test_ledger_outlives_product(self):
+        """Test that deleting a product keeps its ledger"""
+        self.producto.delete()
+
+        self.assertTrue(MovimientoStock.objects.exists())
+        self.assertFalse(Stock.objects.exists())
+
+
+class PartitionHelpersTest(SimpleTestCase):
+    """Test cases for the monthly partition helpers"""
+
+    def test_add_months_wraps_year(self):
+        """Test month arithmetic across the year boundary"""
+        self.assertEqual(add_months(date(2025, 11, 17), 2), date(2026, 1, 1))
+        self.assertEqual(add_months(date(2025, 1, 31), 0), date(2025, 1, 1))
+
+    def test_partition_name(self):
+        """Test partition naming by year and month"""
+        self.assertEqual(
+            partition_name(date(2025, 3, 1)), "inventario_movimientostock_y2025m03"
+        )
+
+    def test_command_on_sqlite(self):
+        """Test that the command is a no-op outside PostgreSQL"""
+        out = StringIO()
+        call_command("crear_particiones", stdout=out)
+
+        self.assertIn("no usa particiones", out.getvalue())
+
+
+@skipUnless(connection.vendor == "postgresql", "partitions need PostgreSQL")
+class LateMonthPartitionTest(TestCase):
+    """Test cases for creating a month whose rows already sit in DEFAULT"""
+
+    def test_rows_move_from_default(self):
+        """Test that a late partition takes over the month's DEFAULT rows"""
+        producto = ProductoFactory()
+        mes = date(2099, 5, 1)
+        MovimientoStock.objects.create(
+            producto=producto,
+            tipo=MovimientoStock.Tipo.INGRESO,
+            cantidad=3,
+            referencia="tarde",
+            creado=datetime(2099, 5, 10, tzinfo=timezone.utc),
+        )
+
+        creadas = ensure_monthly_partitions(connection, start=mes, months=1)
+
+        self.assertEqual(creadas, [partition_name(mes)])
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT referencia FROM {partition_name(mes)}")
+            self.assertEqual(cursor.fetchall(), [("tarde",)])
+            cursor.execute("SELECT count(*) FROM inventario_movimientostock_default")
+            self.assertEqual(cursor.fetchone()[0], 0)
@@ -0,0 +1,177 @@
+"""
+Test cases for the buffered JSON logging pipeline.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from apps.core.log import (
+    JsonFormatter,
+    QueuedFileHandler,
+    RequestSampleFilter,
+    request_context,
+)
+
+
+def make_record(level=logging.INFO, msg="mensaje", **extra):
+    record = logging.LogRecord("test", level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class JsonFormatterTest(SimpleTestCase):
+    """Test cases for JsonFormatter"""
+
+    def test_formats_record_as_json(self):
+        """Test that records become one JSON object with request fields"""
+        record = make_record(request_id="abc", view="productos:list", latency_ms=1.5)
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(payload["message"], "mensaje")
+        self.assertEqual(payload["level"], "INFO")
+        self.assertEqual(payload["request_id"], "abc")
+        self.assertEqual(payload["view"], "productos:list")
+        self.assertEqual(payload["latency_ms"], 1.5)
+
+    def test_uses_request_context(self):
+        """Test that records logged during a request carry its id"""
+        token = request_context.set({"request_id": "ctx-id"})
+        try:
+            payload = json.loads(JsonFormatter().format(make_record()))
+        finally:
+            request_context.reset(token)
+
+        self.assertEqual(payload["request_id"], "ctx-id")
+
+
+class RequestSampleFilterTest(SimpleTestCase):
+    """Test cases for RequestSampleFilter"""
+
+    def test_rate_zero_drops_info(self):
+        """Test that INFO records are dropped with a zero sample rate"""
+        self.assertFalse(RequestSampleFilter(rate=0).filter(make_record()))
+
+    def test_warnings_always_kept(self):
+        """Test that records above INFO are never sampled out"""
+        record = make_record(level=logging.WARNING)
+        self.assertTrue(RequestSampleFilter(rate=0).filter(record))
+
+    def test_rate_one_keeps_everything(self):
+        """Test that a sample rate of one keeps every record"""
+        self.assertTrue(RequestSampleFilter(rate=1).filter(make_record()))
+
+
+class QueuedFileHandlerTest(SimpleTestCase):
+    """Test cases for QueuedFileHandler"""
+
+    def test_writes_through_background_listener(self):
+        """Test that queued records reach the file, reopened after rotation"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "app.log"
+            handler = QueuedFileHandler(path)
+            handler.setFormatter(JsonFormatter())
+            logger = logging.getLogger("tests.queued")
+            logger.addHandler(handler)
+            logger.propagate = False
+            try:
+                logger.warning("antes")
+                handler.listener.stop()
+                # What logrotate does between two records.
+                path.rename(f"{path}.1")
+                handler.start()
+                for i in range(50):
+                    logger.warning("linea %s", i)
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+
+            rotated = Path(f"{path}.1").read_text().splitlines()
+            lines = path.read_text().splitlines()
+            self.assertEqual(json.loads(rotated[-1])["message"], "antes")
+            self.assertEqual(len(lines), 50)
+            self.assertEqual(json.loads(lines[-1])["message"], "linea 49")
+
+
+class ProductionLoggingTest(SimpleTestCase):
+    """Test cases for the LOGGING dict of the production settings"""
+
+    # django.setup() runs the production LOGGING through dictConfig; a
+    # forked child (a gunicorn --preload worker) logs through the same
+    # handler.
+    SCRIPT = textwrap.dedent(
+        """
+        import logging, os, django
+        django.setup()
+        logging.getLogger("django").warning("padre")
+        pid = os.fork()
+        if pid == 0:
+            logging.getLogger("django").warning("hijo")
+            logging.shutdown()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        logging.shutdown()
+        """
+    )
+
+    def test_no_queue_handler_under_class(self):
+        """Test that QueueHandler subclasses are built with a factory"""
+        from cosmeticos_store import settings_production
+
+        for name, handler in settings_production.LOGGING["handlers"].items():
+            if "class" in handler:
+                with self.subTest(handler=name):
+                    klass = import_string(handler["class"])
+                    self.assertFalse(issubclass(klass, QueueHandler))
+
+    def test_dict_config_and_fork(self):
+        """Test that the settings load and forked workers still log"""
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "cosmeticos_store.settings_production",
+                "PYTHONPATH": str(settings.BASE_DIR),
+            }
+            subprocess.run(
+                [sys.executable, "-c", self.SCRIPT],
+                cwd=tmp,
+                env=env,
+                check=True,
+                capture_output=True,
+            )
+
+            lines = (Path(tmp) / "django.log").read_text().splitlines()
+            messages = [json.loads(line)["message"] for line in lines]
+            self.assertIn("padre", messages)
+            self.assertIn("hijo", messages)
+
+
+class RequestLogMiddlewareTest(TestCase):
+    """Test cases for RequestLogMiddleware"""
+
+    def test_logs_request_with_view_and_latency(self):
+        """Test that each request is logged with id, view name and latency"""
+        with self.assertLogs("apps.core.requests", level="INFO") as logs:
+            response = self.client.get(
+                reverse("productos:list"), HTTP_X_REQUEST_ID="req-123"
+            )
+
+        self.assertEqual(response["X-Request-ID"], "req-123")
+        record = logs.records[0]
+        self.assertEqual(record.status, 200)
+        payload = json.loads(JsonFormatter().format(record))
+        self.assertEqual(payload["request_id"], "req-123")
+        self.assertEqual(payload["view"], "productos:list")
+        self.assertIn("latency_ms", payload)
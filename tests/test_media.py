@@ -0,0 +1,165 @@
+"""
+Test cases for content-addressed media storage and orphan cleanup.
+"""
+
+import hashlib
+from io import BytesIO, StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import TestCase, TransactionTestCase
+
+from PIL import Image
+
+from apps.core.media import count_references, is_content_addressed
+from apps.core.models import ReferenciaMedia
+from apps.productos.models import Producto
+from apps.trabajadores.models import Trabajador
+
+from .factories import ProductoFactory, TrabajadorFactory
+
+
+def make_image(color="red", name="foto.PNG"):
+    buffer = BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), "image/png")
+
+
+class ContentAddressedMediaTest(TestCase):
+    """Test cases for ContentAddressedImageField"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.image = make_image()
+        self.digest = hashlib.sha256(self.image.read()).hexdigest()
+        self.image.seek(0)
+
+    def test_upload_stored_under_digest(self):
+        """Test that uploads are named after the SHA-256 of their content"""
+        producto = ProductoFactory(imagen=self.image)
+
+        self.assertEqual(
+            producto.imagen.name, f"productos/{self.digest[:2]}/{self.digest}.png"
+        )
+        self.assertTrue(is_content_addressed(producto.imagen.name))
+        self.assertTrue(producto.imagen.storage.exists(producto.imagen.name))
+
+    def test_same_content_is_stored_once(self):
+        """Test that identical uploads share one stored file"""
+        primero = ProductoFactory(imagen=self.image)
+        segundo = ProductoFactory(imagen=make_image(name="copia.png"))
+
+        self.assertEqual(primero.imagen.name, segundo.imagen.name)
+        self.assertEqual(count_references(primero.imagen.name), 2)
+        _, files = primero.imagen.storage.listdir(f"productos/{self.digest[:2]}")
+        self.assertEqual(files, [f"{self.digest}.png"])
+
+    def test_delete_keeps_shared_file(self):
+        """Test that deleting one of several references keeps the file"""
+        primero = ProductoFactory(imagen=self.image)
+        ProductoFactory(imagen=make_image())
+        name, storage = primero.imagen.name, primero.imagen.storage
+
+        with self.captureOnCommitCallbacks(execute=True):
+            primero.delete()
+
+        self.assertTrue(storage.exists(name))
+
+    def test_delete_last_reference_removes_file(self):
+        """Test that the file is removed with its last referencing row"""
+        trabajador = TrabajadorFactory(imagen=self.image)
+        name, storage = trabajador.imagen.name, trabajador.imagen.storage
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Trabajador.objects.filter(pk=trabajador.pk).delete()
+
+        self.assertFalse(storage.exists(name))
+
+    def test_replacing_image_removes_orphan(self):
+        """Test that replacing an image cleans up the previous file"""
+        producto = ProductoFactory(imagen=self.image)
+        old_name, storage = producto.imagen.name, producto.imagen.storage
+
+        with self.captureOnCommitCallbacks(execute=True):
+            producto = Producto.objects.get(pk=producto.pk)
+            producto.imagen = make_image(color="blue")
+            producto.save()
+
+        self.assertFalse(storage.exists(old_name))
+        self.assertTrue(storage.exists(producto.imagen.name))
+
+    def test_replacing_with_same_content_keeps_count(self):
+        """Test that uploading the stored image again neither leaks nor deletes"""
+        producto = ProductoFactory(imagen=self.image)
+        name, storage = producto.imagen.name, producto.imagen.storage
+
+        with self.captureOnCommitCallbacks(execute=True):
+            producto = Producto.objects.get(pk=producto.pk)
+            producto.imagen = make_image(name="otra.png")
+            producto.save()
+
+        self.assertEqual(producto.imagen.name, name)
+        self.assertEqual(count_references(name), 1)
+        self.assertTrue(storage.exists(name))
+
+    def test_cleanup_rechecks_count(self):
+        """Test that an upload between a release and its cleanup keeps the file"""
+        trabajador = TrabajadorFactory(imagen=self.image)
+        name, storage = trabajador.imagen.name, trabajador.imagen.storage
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            trabajador.delete()
+        TrabajadorFactory(imagen=make_image())
+        for callback in callbacks:
+            callback()
+
+        self.assertTrue(storage.exists(name))
+        self.assertEqual(count_references(name), 1)
+
+    def test_recalcular_command(self):
+        """Test that the command repairs counts after a QuerySet.update"""
+        producto = ProductoFactory(imagen=self.image)
+        Producto.objects.filter(pk=producto.pk).update(imagen="")
+        ProductoFactory(imagen=make_image(color="blue"))
+
+        call_command("recalcular_referencias_media", stdout=StringIO())
+
+        self.assertEqual(
+            list(ReferenciaMedia.objects.values_list("total", flat=True)), [1]
+        )
+        self.assertEqual(count_references(producto.imagen.name), 0)
+
+    def test_unchanged_save_skips_lookup(self):
+        """Test that saving without a new image does not query the old name"""
+        producto = ProductoFactory(imagen=self.image)
+        producto = Producto.objects.get(pk=producto.pk)
+        producto.nombre = "Renombrado"
+
+        with self.assertNumQueries(1):
+            producto.save()
+
+    def test_legacy_names_are_never_deleted(self):
+        """Test that files outside the content-addressed layout are kept"""
+        name = default_storage.save("productos/legacy/perfume.jpg", ContentFile(b"x"))
+        producto = ProductoFactory(imagen=name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            producto.delete()
+
+        self.assertTrue(default_storage.exists(name))
+
+
+class ReferenceRollbackTest(TransactionTestCase):
+    """Test cases for reference counts when the row write fails"""
+
+    def test_failed_insert_takes_reference_back(self):
+        """Test that a duplicate row leaves no reference to its upload"""
+        TrabajadorFactory(cedula="0911111111")
+
+        with self.assertRaises(IntegrityError):
+            TrabajadorFactory(cedula="0911111111", imagen=make_image())
+
+        self.assertFalse(ReferenciaMedia.objects.filter(total__gt=0).exists())
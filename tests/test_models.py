@@ -3,6 +3,8 @@ Test cases for all models following TDD London School approach.
 Target: 100% test coverage for model layer.
 """
 
+from decimal import Decimal
+
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.test import TestCase
@@ -12,23 +14,33 @@ from apps.productos.models import Producto
 from apps.proveedores.models import Proveedor
 from apps.trabajadores.models import Trabajador
 
+from .factories import (
+    EmpresaFactory,
+    ProductoFactory,
+    ProveedorFactory,
+    TrabajadorFactory,
+)
+
 
 class TrabajadorModelTest(TestCase):
     """Test cases for Trabajador model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Ana",
-            "apellido": "García",
-            "correo": "ana.garcia@cosmeticos.com",
-            "cedula": "1234567890",
-            "codigo_empleado": "EMP001",
-        }
+    valid_data = {
+        "nombre": "Ana",
+        "apellido": "García",
+        "correo": "ana.garcia@cosmeticos.com",
+        "cedula": "1234567890",
+        "codigo_empleado": "EMP001",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador = Trabajador.objects.create(**cls.valid_data)
 
     def test_trabajador_creation_with_valid_data(self):
         """Test creating a worker with valid data"""
-        trabajador = Trabajador.objects.create(**self.valid_data)
+        trabajador = Trabajador.objects.get(pk=self.trabajador.pk)
         self.assertEqual(trabajador.nombre, "Ana")
         self.assertEqual(trabajador.apellido, "García")
         self.assertEqual(trabajador.correo, "ana.garcia@cosmeticos.com")
@@ -37,13 +49,10 @@ class TrabajadorModelTest(TestCase):
 
     def test_trabajador_string_representation(self):
         """Test the string representation of worker"""
-        trabajador = Trabajador.objects.create(**self.valid_data)
-        self.assertEqual(str(trabajador), "Ana García")
+        self.assertEqual(str(self.trabajador), "Ana García")
 
     def test_trabajador_unique_cedula_constraint(self):
         """Test that cedula must be unique"""
-        Trabajador.objects.create(**self.valid_data)
-
         duplicate_data = self.valid_data.copy()
         duplicate_data["correo"] = "otro@email.com"
         duplicate_data["codigo_empleado"] = "EMP002"
@@ -53,8 +62,6 @@ class TrabajadorModelTest(TestCase):
 
     def test_trabajador_unique_codigo_empleado_constraint(self):
         """Test that codigo_empleado must be unique"""
-        Trabajador.objects.create(**self.valid_data)
-
         duplicate_data = self.valid_data.copy()
         duplicate_data["correo"] = "otro@email.com"
         duplicate_data["cedula"] = "0987654321"
@@ -64,43 +71,35 @@ class TrabajadorModelTest(TestCase):
 
     def test_trabajador_ordering(self):
         """Test default ordering by nombre, apellido"""
-        Trabajador.objects.create(
-            nombre="Zara",
-            apellido="Alvarez",
-            correo="zara@test.com",
-            cedula="111",
-            codigo_empleado="EMP001",
-        )
-        Trabajador.objects.create(
-            nombre="Ana",
-            apellido="Benítez",
-            correo="ana@test.com",
-            cedula="222",
-            codigo_empleado="EMP002",
-        )
+        TrabajadorFactory(nombre="Zara", apellido="Alvarez")
+        TrabajadorFactory(nombre="Ana", apellido="Benítez")
 
-        trabajadores = list(Trabajador.objects.all())
-        self.assertEqual(trabajadores[0].nombre, "Ana")
-        self.assertEqual(trabajadores[1].nombre, "Zara")
+        self.assertEqual(
+            [str(trabajador) for trabajador in Trabajador.objects.all()],
+            ["Ana Benítez", "Ana García", "Zara Alvarez"],
+        )
 
 
 class EmpresaModelTest(TestCase):
     """Test cases for Empresa model (singleton pattern)"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Cosméticos Bella",
-            "direccion": "Calle Principal 123, Quito",
-            "mision": "Proveer productos de belleza de alta calidad",
-            "vision": "Ser la tienda líder en cosméticos del Ecuador",
-            "anio_fundacion": 2010,
-            "ruc": "1234567890123",
-        }
+    valid_data = {
+        "nombre": "Cosméticos Bella",
+        "direccion": "Calle Principal 123, Quito",
+        "mision": "Proveer productos de belleza de alta calidad",
+        "vision": "Ser la tienda líder en cosméticos del Ecuador",
+        "anio_fundacion": 2010,
+        "ruc": "1234567890123",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.empresa = Empresa.objects.create(**cls.valid_data)
 
     def test_empresa_creation_with_valid_data(self):
         """Test creating company with valid data"""
-        empresa = Empresa.objects.create(**self.valid_data)
+        empresa = Empresa.objects.get(pk=self.empresa.pk)
         self.assertEqual(empresa.nombre, "Cosméticos Bella")
         self.assertEqual(empresa.direccion, "Calle Principal 123, Quito")
         self.assertEqual(empresa.anio_fundacion, 2010)
@@ -108,13 +107,10 @@ class EmpresaModelTest(TestCase):
 
     def test_empresa_string_representation(self):
         """Test the string representation of company"""
-        empresa = Empresa.objects.create(**self.valid_data)
-        self.assertEqual(str(empresa), "Cosméticos Bella")
+        self.assertEqual(str(self.empresa), "Cosméticos Bella")
 
     def test_empresa_singleton_constraint(self):
         """Test that only one company can exist (singleton pattern)"""
-        Empresa.objects.create(**self.valid_data)
-
         duplicate_data = self.valid_data.copy()
         duplicate_data["nombre"] = "Otra Empresa"
         duplicate_data["ruc"] = "different_ruc"
@@ -126,43 +122,42 @@ class EmpresaModelTest(TestCase):
 class ProductoModelTest(TestCase):
     """Test cases for Producto model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "Lápiz Labial Rojo Clásico",
-            "descripcion": "Lápiz labial de larga duración con color intenso",
-            "precio": 25.99,
-            "iva": 15,
-        }
+    valid_data = {
+        "nombre": "Lápiz Labial Rojo Clásico",
+        "descripcion": "Lápiz labial de larga duración con color intenso",
+        "precio": Decimal("25.99"),
+        "iva": 15,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.producto = Producto.objects.create(**cls.valid_data)
 
     def test_producto_creation_with_valid_data(self):
         """Test creating product with valid data"""
-        producto = Producto.objects.create(**self.valid_data)
+        producto = Producto.objects.get(pk=self.producto.pk)
         self.assertEqual(producto.nombre, "Lápiz Labial Rojo Clásico")
-        self.assertEqual(producto.precio, 25.99)
+        self.assertEqual(producto.precio, Decimal("25.99"))
         self.assertEqual(producto.iva, 15)
 
     def test_producto_string_representation(self):
         """Test the string representation of product"""
-        producto = Producto.objects.create(**self.valid_data)
+        producto = self.producto
         self.assertEqual(str(producto), "Lápiz Labial Rojo Clásico")
 
     def test_producto_iva_choices(self):
         """Test IVA can only be 0 or 15"""
         # Test valid IVA values
-        producto_0 = Producto.objects.create(
-            **{**self.valid_data, "iva": 0, "nombre": "Producto sin IVA"}
-        )
-        self.assertEqual(producto_0.iva, 0)
+        producto_0 = ProductoFactory(iva=0, nombre="Producto sin IVA")
+        self.assertEqual(Producto.objects.get(pk=producto_0.pk).iva, 0)
 
-        producto_15 = Producto.objects.create(
-            **{**self.valid_data, "iva": 15, "nombre": "Producto con IVA"}
-        )
-        self.assertEqual(producto_15.iva, 15)
+        producto_15 = ProductoFactory(iva=15, nombre="Producto con IVA")
+        self.assertEqual(Producto.objects.get(pk=producto_15.pk).iva, 15)
 
     def test_producto_precio_calculation(self):
         """Test price calculation method with IVA"""
-        producto = Producto.objects.create(**self.valid_data)
+        producto = self.producto
         expected_price = 25.99 * 1.15  # 25.99 + 15% IVA
         self.assertAlmostEqual(
             float(producto.get_precio_con_iva()), expected_price, places=2
@@ -172,28 +167,30 @@ class ProductoModelTest(TestCase):
 class ProveedorModelTest(TestCase):
     """Test cases for Proveedor model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.valid_data = {
-            "nombre": "L'Oréal Ecuador",
-            "descripcion": "Distribuidor oficial de productos L'Oréal",
-            "telefono": "+593-2-123-4567",
-            "pais": "Ecuador",
-            "correo": "contacto@loreal.ec",
-            "direccion": "Av. Amazonas 456, Quito",
-        }
+    valid_data = {
+        "nombre": "L'Oréal Ecuador",
+        "descripcion": "Distribuidor oficial de productos L'Oréal",
+        "telefono": "+593-2-123-4567",
+        "pais": "Ecuador",
+        "correo": "contacto@loreal.ec",
+        "direccion": "Av. Amazonas 456, Quito",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.proveedor = Proveedor.objects.create(**cls.valid_data)
 
     def test_proveedor_creation_with_valid_data(self):
         """Test creating supplier with valid data"""
-        proveedor = Proveedor.objects.create(**self.valid_data)
+        proveedor = Proveedor.objects.get(pk=self.proveedor.pk)
         self.assertEqual(proveedor.nombre, "L'Oréal Ecuador")
         self.assertEqual(proveedor.pais, "Ecuador")
         self.assertEqual(proveedor.correo, "contacto@loreal.ec")
 
     def test_proveedor_string_representation(self):
         """Test the string representation of supplier"""
-        proveedor = Proveedor.objects.create(**self.valid_data)
-        self.assertEqual(str(proveedor), "L'Oréal Ecuador")
+        self.assertEqual(str(self.proveedor), "L'Oréal Ecuador")
 
     def test_proveedor_email_validation(self):
         """Test email validation for supplier"""
@@ -211,35 +208,10 @@ class ModelIntegrationTest(TestCase):
     def test_all_models_can_be_created_together(self):
         """Test that all models can coexist without conflicts"""
         # Create one of each model
-        Trabajador.objects.create(
-            nombre="María",
-            apellido="López",
-            correo="maria@test.com",
-            cedula="123456789",
-            codigo_empleado="EMP001",
-        )
-
-        Empresa.objects.create(
-            nombre="Test Company",
-            direccion="Test Address",
-            mision="Test Mission",
-            vision="Test Vision",
-            anio_fundacion=2020,
-            ruc="1234567890123",
-        )
-
-        Producto.objects.create(
-            nombre="Test Product", descripcion="Test Description", precio=10.99, iva=15
-        )
-
-        Proveedor.objects.create(
-            nombre="Test Supplier",
-            descripcion="Test Supplier Desc",
-            telefono="123456789",
-            pais="Ecuador",
-            correo="supplier@test.com",
-            direccion="Supplier Address",
-        )
+        TrabajadorFactory()
+        EmpresaFactory()
+        ProductoFactory()
+        ProveedorFactory()
 
         # Verify all were created
         self.assertEqual(Trabajador.objects.count(), 1)
@@ -250,23 +222,10 @@ class ModelIntegrationTest(TestCase):
     def test_database_constraints_enforcement(self):
         """Test that database constraints are properly enforced"""
         # Test unique constraints across different models
-        Trabajador.objects.create(
-            nombre="Test",
-            apellido="User",
-            correo="test@same.com",
-            cedula="111",
-            codigo_empleado="EMP111",
-        )
+        TrabajadorFactory(correo="test@same.com")
 
         # Different model can have same email (if not globally unique)
-        Proveedor.objects.create(
-            nombre="Test Supplier",
-            descripcion="Desc",
-            telefono="123",
-            pais="Ecuador",
-            correo="test@same.com",
-            direccion="Address",
-        )
+        ProveedorFactory(correo="test@same.com")
 
         self.assertEqual(Trabajador.objects.filter(correo="test@same.com").count(), 1)
         self.assertEqual(Proveedor.objects.filter(correo="test@same.com").count(), 1)
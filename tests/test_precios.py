@@ -0,0 +1,154 @@
+"""
+Test cases for batch price-with-IVA quotes and their cache.
+"""
+
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.checks import check_shared_cache
+from apps.productos import precios
+from apps.productos.forms import ProductoBulkForm
+from apps.productos.models import Producto
+from apps.ventas.checkout import calcular_linea
+
+from .factories import ProductoFactory
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CotizarTest(TestCase):
+    """Test cases for precios.cotizar"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.productos = [
+            ProductoFactory(precio=Decimal(precio), iva=iva)
+            for precio, iva in [
+                ("12.99", 15),
+                ("0.10", 15),
+                ("25.99", 0),
+                ("19.90", 15),
+                ("1234.57", 15),
+            ]
+        ]
+        cls.ids = [p.pk for p in cls.productos]
+
+    def setUp(self):
+        precios.cache.clear()
+
+    def test_matches_checkout_rounding(self):
+        """Test that quotes equal a one-unit checkout line"""
+        cotizaciones = precios.cotizar(self.ids)
+
+        for producto in self.productos:
+            with self.subTest(precio=producto.precio):
+                self.assertEqual(
+                    cotizaciones[producto.pk]["precio_con_iva"],
+                    calcular_linea(producto, 1).total,
+                )
+        self.assertEqual(
+            cotizaciones[self.ids[0]],
+            {"precio": Decimal("12.99"), "iva": 15, "precio_con_iva": Decimal("14.94")},
+        )
+
+    def test_one_query_then_cache(self):
+        """Test a single IN query for the misses and none once cached"""
+        with self.assertNumQueries(1):
+            precios.cotizar(self.ids[:3])
+        with self.assertNumQueries(1):
+            cotizaciones = precios.cotizar(self.ids)
+        with self.assertNumQueries(0):
+            self.assertEqual(precios.cotizar(self.ids), cotizaciones)
+
+    def test_unknown_ids_left_out(self):
+        """Test that missing products are simply absent"""
+        self.assertEqual(list(precios.cotizar([self.ids[0], 999999])), [self.ids[0]])
+
+    def test_save_invalidates(self):
+        """Test that saving a product drops its cached quote on commit"""
+        producto = self.productos[0]
+        precios.cotizar([producto.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            producto.precio = Decimal("20.00")
+            producto.save()
+
+        quote = precios.cotizar([producto.pk])[producto.pk]
+        self.assertEqual(quote["precio_con_iva"], Decimal("23.00"))
+
+    def test_delete_invalidates(self):
+        """Test that deleting a product drops its cached quote on commit"""
+        producto = ProductoFactory()
+        precios.cotizar([producto.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Producto.objects.filter(pk=producto.pk).delete()
+
+        self.assertEqual(precios.cotizar([producto.pk]), {})
+
+    def test_bulk_update_invalidates(self):
+        """Test that bulk price changes invalidate every cached quote"""
+        precios.cotizar(self.ids)
+        form = ProductoBulkForm(data={"accion": "iva", "iva": "0", "ids": self.ids})
+        self.assertTrue(form.is_valid(), form.errors)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            form.execute(form.get_queryset(Producto), len(self.ids))
+
+        cotizaciones = precios.cotizar(self.ids)
+        self.assertEqual(cotizaciones[self.ids[0]]["precio_con_iva"], Decimal("12.99"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PrecioApiTest(TestCase):
+    """Test cases for the batch price endpoint"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.productos = ProductoFactory.create_batch(3, precio="10.00", iva=15)
+        cls.url = reverse("api:precios")
+
+    def setUp(self):
+        precios.cache.clear()
+
+    def test_batch_quotes(self):
+        """Test quotes in request order with unknown ids reported"""
+        ids = [p.pk for p in reversed(self.productos)]
+        query = ",".join(map(str, [*ids, 999999, ids[0]]))
+
+        with self.assertNumQueries(1):
+            data = self.client.get(self.url, {"ids": query}).json()
+
+        self.assertEqual([row["id"] for row in data["results"]], ids)
+        self.assertEqual(
+            data["results"][0],
+            {"id": ids[0], "precio": "10.00", "iva": 15, "precio_con_iva": "11.50"},
+        )
+        self.assertEqual(data["missing"], [999999])
+
+    def test_invalid_requests(self):
+        """Test missing, malformed and oversized id lists"""
+        too_many = ",".join(str(pk) for pk in range(1, 502))
+        for ids in ["", "1,a", too_many]:
+            with self.subTest(ids=ids[:10]):
+                with self.assertLogs("django.request", "WARNING"):
+                    response = self.client.get(self.url, {"ids": ids})
+                self.assertEqual(response.status_code, 400)
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+    """Test cases for the deploy check on the default cache backend"""
+
+    def test_process_local_cache_warns(self):
+        """Test that only a per-process default cache is reported"""
+        redis = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        for caches, ids in [(LOCMEM_CACHE, ["core.W001"]), (redis, [])]:
+            with self.subTest(backend=caches["default"]["BACKEND"]):
+                with override_settings(CACHES=caches):
+                    warnings = check_shared_cache(None)
+                self.assertEqual([warning.id for warning in warnings], ids)
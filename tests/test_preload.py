@@ -0,0 +1,91 @@
+"""
+Test cases for the preload manifest and the Link header middleware.
+"""
+
+import tempfile
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import preload
+
+THEME = ("/static/css/cosmetics-theme.css?v=14", "style")
+APP_JS = ("/static/js/cosmetics-app.js", "script")
+LOGO = ("/static/logo.png", "image")
+
+
+class PreloadManifestTest(TestCase):
+    """Test cases for apps.core.preload"""
+
+    def test_assets(self):
+        """Test which tags are preloaded"""
+        source = """
+            <link rel="preconnect" href="https://fonts.gstatic.com">
+            <link href="{% static 'css/a.css' %}" rel="stylesheet">
+            <script src="https://cdn.example.com/b.js"></script>
+            <link href="//cdn.example.com/c.css" rel="stylesheet">
+            <script>inline()</script>
+            <img src="{% static 'logo.png' %}" alt="Logo">
+            <img src="{{ object.imagen.url }}">
+        """
+
+        self.assertEqual(
+            preload.assets(source),
+            [("/static/css/a.css", "style"), LOGO],
+        )
+
+    def test_pages_inherit_base_assets(self):
+        """Test that pages list the assets of base.html in document order"""
+        manifest = preload.build_manifest()
+
+        assets = [tuple(asset) for asset in manifest["productos/list.html"]]
+        self.assertLess(assets.index(THEME), assets.index(LOGO))
+        self.assertLess(assets.index(LOGO), assets.index(APP_JS))
+        self.assertEqual(manifest["productos/list.html"], manifest["base.html"])
+        self.assertNotIn("shared/form_field.html", manifest)
+
+    def test_collectstatic_writes_manifest(self):
+        """Test that collectstatic stores the manifest next to the files"""
+        with (
+            tempfile.TemporaryDirectory() as root,
+            override_settings(
+                STATIC_ROOT=root,
+                STORAGES={
+                    "staticfiles": {
+                        "BACKEND": "apps.core.preload.PreloadStaticFilesStorage"
+                    }
+                },
+            ),
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+
+            self.assertTrue(staticfiles_storage.exists(preload.MANIFEST_NAME))
+            self.assertEqual(
+                preload.load_manifest(staticfiles_storage), preload.build_manifest()
+            )
+
+
+class PreloadLinkMiddlewareTest(TestCase):
+    """Test cases for PreloadLinkMiddleware"""
+
+    def test_html_pages(self):
+        """Test the Link header of a page"""
+        response = self.client.get(reverse("productos:list"))
+
+        links = response["Link"].split(", <")
+        self.assertIn(
+            "</static/css/cosmetics-theme.css?v=14>; rel=preload; as=style",
+            response["Link"],
+        )
+        self.assertIn("/static/logo.png>; rel=preload; as=image", links)
+        self.assertNotIn("cdn.jsdelivr.net", response["Link"])
+        self.assertEqual(len(links), len(preload.build_manifest()["base.html"]))
+
+    def test_other_responses(self):
+        """Test that JSON, redirects and errors get no Link header"""
+        self.assertNotIn("Link", self.client.get(reverse("api:productos")))
+        self.assertNotIn("Link", self.client.get("/productos"))
+        with self.assertLogs("django.request", "WARNING"):
+            self.assertNotIn("Link", self.client.get("/no-existe/"))
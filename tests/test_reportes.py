@@ -0,0 +1,264 @@
+"""
+Test cases for the sales rollups and the reports built on them.
+"""
+
+import csv
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.inventario import stock
+from apps.ventas import reportes
+from apps.ventas.checkout import registrar_venta
+from apps.ventas.models import (
+    ResumenVentaDiario,
+    ResumenVentaIva,
+    ResumenVentaProducto,
+    ResumenVentaTrabajador,
+)
+from apps.ventas.reportes import SUMAS
+from apps.ventas.resumenes import RESUMENES, reconstruir
+
+from .factories import ProductoFactory, TrabajadorFactory
+
+
+def dia(year, month, day):
+    return timezone.make_aware(datetime(year, month, day, 12))
+
+
+def sumas(model):
+    return [f.name for f in model._meta.fields if f.name in ("ventas", *SUMAS)]
+
+
+def sumado(model, **claves):
+    """Sums of one rollup key over its slots."""
+    return model.objects.filter(**claves).aggregate(
+        **{campo: Sum(campo) for campo in sumas(model)}
+    )
+
+
+def snapshot():
+    """Every rollup with its slots summed."""
+    resultado = {}
+    for model in RESUMENES:
+        claves = [
+            f.attname
+            for f in model._meta.fields[1:]
+            if f.name not in ("ranura", *sumas(model))
+        ]
+        resultado[model] = list(
+            model.objects.values_list(*claves)
+            .annotate(**{campo: Sum(campo) for campo in sumas(model)})
+            .order_by(*claves)
+        )
+    return resultado
+
+
+class ResumenesTest(TestCase):
+    """Test cases for the incremental rollups and their rebuild"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.ana = TrabajadorFactory(codigo_empleado="EMP001")
+        cls.luis = TrabajadorFactory(codigo_empleado="EMP002")
+        cls.labial = ProductoFactory(nombre="Labial", precio="10.00", iva=15)
+        cls.serum = ProductoFactory(nombre="Sérum", precio="20.00", iva=0)
+        cls.crema = ProductoFactory(nombre="Crema", precio="5.00", iva=15)
+        stock.ingresar({cls.labial.pk: 100, cls.serum.pk: 100, cls.crema.pk: 100})
+
+        # Monday 2 June and Wednesday 4 June 2025 (same week), and 1 July.
+        registrar_venta(cls.ana, {cls.labial.pk: 1, cls.serum.pk: 1}, dia(2025, 6, 2))
+        registrar_venta(cls.luis, {cls.labial.pk: 2}, dia(2025, 6, 2))
+        registrar_venta(cls.ana, {cls.crema.pk: 4}, dia(2025, 6, 4))
+        registrar_venta(cls.luis, {cls.serum.pk: 1}, dia(2025, 7, 1))
+
+    def test_checkout_updates_every_rollup(self):
+        """Test the per product, IVA and seller rows written by checkout"""
+        labial = sumado(
+            ResumenVentaProducto, fecha=date(2025, 6, 2), producto=self.labial
+        )
+        self.assertEqual((labial["unidades"], labial["total"]), (3, Decimal("34.50")))
+        self.assertEqual(
+            set(
+                ResumenVentaProducto.objects.filter(producto=self.labial).values_list(
+                    "nombre", flat=True
+                )
+            ),
+            {"Labial"},
+        )
+
+        iva = sumado(ResumenVentaIva, fecha=date(2025, 6, 2), iva=15)
+        self.assertEqual((iva["unidades"], iva["iva_total"]), (3, Decimal("4.50")))
+
+        ana = sumado(
+            ResumenVentaTrabajador, fecha=date(2025, 6, 2), codigo_empleado="EMP001"
+        )
+        self.assertEqual((ana["ventas"], ana["total"]), (1, Decimal("31.50")))
+
+    def test_rebuild_matches_incremental(self):
+        """Test that rebuilding from raw sales gives the same rollups"""
+        incremental = snapshot()
+        ResumenVentaDiario.objects.update(total=0)
+
+        escritas = reconstruir()
+
+        self.assertEqual(snapshot(), incremental)
+        self.assertEqual(escritas[ResumenVentaDiario], 3)
+
+    def test_rebuild_keeps_deleted_products(self):
+        """Test that lines of a deleted product are rebuilt like checkout added them"""
+        crema_pk = self.crema.pk
+        self.crema.delete()
+        incremental = snapshot()
+
+        reconstruir()
+
+        self.assertEqual(snapshot(), incremental)
+        self.assertEqual(
+            sumado(ResumenVentaProducto, producto_id=crema_pk)["unidades"], 4
+        )
+
+    def test_rebuild_command(self):
+        """Test the reconstruir_resumenes management command"""
+        ResumenVentaProducto.objects.all().delete()
+        out = StringIO()
+
+        call_command("reconstruir_resumenes", stdout=out)
+
+        self.assertEqual(ResumenVentaProducto.objects.count(), 4)
+        self.assertIn("Resúmenes reconstruidos", out.getvalue())
+
+    def test_report_by_week_and_month(self):
+        """Test that weeks and months are summed from the daily rows"""
+        semanas = reportes.reporte("total", "semana")
+        self.assertEqual(
+            [(f["periodo"], f["ventas"], f["total"]) for f in semanas],
+            [
+                (date(2025, 6, 2), 3, Decimal("77.50")),
+                (date(2025, 6, 30), 1, Decimal("20.00")),
+            ],
+        )
+
+        meses = reportes.reporte("iva", "mes", desde=date(2025, 6, 1))
+        self.assertEqual(
+            [(f["periodo"], f["etiqueta"], f["unidades"]) for f in meses],
+            [
+                (date(2025, 6, 1), "IVA 0%", 1),
+                (date(2025, 6, 1), "IVA 15%", 7),
+                (date(2025, 7, 1), "IVA 0%", 1),
+            ],
+        )
+
+    def test_report_date_range(self):
+        """Test that desde and hasta are inclusive"""
+        filas = reportes.reporte(
+            "producto", desde=date(2025, 6, 4), hasta=date(2025, 6, 4)
+        )
+        self.assertEqual([f["etiqueta"] for f in filas], ["Crema"])
+        self.assertNotIn("ventas", filas[0])
+
+    def test_chart_series(self):
+        """Test the labels/datasets shape with zeros for missing periods"""
+        serie = reportes.serie(reportes.reporte("trabajador", "mes"))
+
+        self.assertEqual(serie["labels"], ["2025-06-01", "2025-07-01"])
+        self.assertEqual(
+            serie["datasets"],
+            [
+                {"label": "EMP001", "data": [54.5, 0]},
+                {"label": "EMP002", "data": [23.0, 20.0]},
+            ],
+        )
+
+
+class ReporteVentasViewTest(TestCase):
+    """Test cases for the sales report view and its exports"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador = TrabajadorFactory(codigo_empleado="EMP001")
+        cls.labial = ProductoFactory(nombre="Labial", precio="10.00", iva=15)
+        stock.ingresar({cls.labial.pk: 100})
+        hoy = timezone.now()
+        for dias in range(5):
+            registrar_venta(
+                cls.trabajador, {cls.labial.pk: 1}, hoy - timedelta(days=dias)
+            )
+        cls.url = reverse("ventas:reportes")
+
+    def test_html_report_reads_only_rollups(self):
+        """Test that the report is a single query over the rollups"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"dimension": "producto"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Labial", count=5)
+
+    def test_csv_export(self):
+        """Test the CSV download"""
+        response = self.client.get(
+            self.url, {"dimension": "trabajador", "periodo": "mes", "formato": "csv"}
+        )
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn("ventas-trabajador-mes.csv", response["Content-Disposition"])
+        filas = list(csv.reader(StringIO(response.content.decode())))
+        self.assertEqual(
+            filas[0],
+            [
+                "periodo",
+                "clave",
+                "etiqueta",
+                "ventas",
+                "unidades",
+                "subtotal",
+                "iva_total",
+                "total",
+            ],
+        )
+        self.assertEqual(sum(int(fila[3]) for fila in filas[1:]), 5)
+
+    def test_csv_keys_and_formulas(self):
+        """Test that IVA 0 keeps its key and formula-like text is escaped"""
+        serum = ProductoFactory(nombre="=Sérum", precio="20.00", iva=0)
+        stock.ingresar({serum.pk: 1})
+        registrar_venta(
+            TrabajadorFactory(codigo_empleado="@EMP9"), {serum.pk: 1}, timezone.now()
+        )
+
+        filas = {}
+        for dimension in ["iva", "producto", "trabajador"]:
+            response = self.client.get(
+                self.url, {"dimension": dimension, "formato": "csv"}
+            )
+            filas[dimension] = list(csv.reader(StringIO(response.content.decode())))
+
+        self.assertIn("0", [fila[1] for fila in filas["iva"][1:]])
+        self.assertIn("'=Sérum", [fila[2] for fila in filas["producto"][1:]])
+        self.assertIn("'@EMP9", [fila[1] for fila in filas["trabajador"][1:]])
+
+    def test_json_export(self):
+        """Test the chart-ready JSON"""
+        response = self.client.get(self.url, {"formato": "json"})
+
+        data = response.json()
+        self.assertEqual(len(data["labels"]), 5)
+        self.assertEqual(data["datasets"], [{"label": "Total", "data": [11.5] * 5}])
+
+    def test_invalid_range(self):
+        """Test that an inverted date range is rejected"""
+        params = {"desde": "2025-06-10", "hasta": "2025-06-01"}
+
+        response = self.client.get(self.url, params)
+        self.assertContains(response, "La fecha inicial es posterior a la final.")
+
+        response = self.client.get(self.url, {**params, "formato": "json"})
+        self.assertEqual(response.status_code, 400)
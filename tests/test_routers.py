@@ -0,0 +1,126 @@
+"""
+Test cases for primary/replica database routing.
+Uses the two SQLite databases from settings_test as primary and replica.
+"""
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.routers import PrimaryReplicaRouter, use_primary
+from apps.empresa.models import Empresa
+from apps.productos.models import Producto
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class PrimaryReplicaRouterTest(TestCase):
+    """Test cases for PrimaryReplicaRouter"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """Set up test data"""
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_go_to_replica(self):
+        """Test that reads are routed to a replica"""
+        self.assertEqual(self.router.db_for_read(Producto), "replica")
+
+    def test_writes_go_to_primary(self):
+        """Test that writes are always routed to the primary"""
+        self.assertEqual(self.router.db_for_write(Producto), "default")
+
+    def test_use_primary_pins_reads(self):
+        """Test that reads inside use_primary() go to the primary"""
+        with use_primary():
+            self.assertEqual(self.router.db_for_read(Producto), "default")
+        self.assertEqual(self.router.db_for_read(Producto), "replica")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_configured(self):
+        """Test that reads fall back to the primary without replicas"""
+        self.assertEqual(self.router.db_for_read(Producto), "default")
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingViewTest(TestCase):
+    """Test cases for view-level routing against two databases"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """Set up test data"""
+        self.producto_data = {
+            "nombre": "Rubor Compacto Coral",
+            "descripcion": "Rubor en polvo de acabado satinado",
+            "precio": "19.90",
+            "iva": 15,
+        }
+
+    def test_list_view_reads_from_replica(self):
+        """Test that the list view does not see rows only present on the primary"""
+        Producto.objects.create(**self.producto_data)
+
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Rubor Compacto Coral")
+
+    def test_empresa_view_reads_from_replica(self):
+        """Test that EmpresaView reads the company from a replica"""
+        Empresa.objects.using("replica").create(
+            nombre="Empresa Replica",
+            direccion="Dirección",
+            mision="Misión",
+            vision="Visión",
+            anio_fundacion=2015,
+            ruc="1790000000001",
+        )
+
+        response = self.client.get(reverse("empresa:detail"))
+
+        self.assertContains(response, "Empresa Replica")
+
+    def test_create_view_writes_to_primary(self):
+        """Test that create views write to the primary"""
+        response = self.client.post(reverse("productos:create"), self.producto_data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            Producto.objects.using("default")
+            .filter(nombre="Rubor Compacto Coral")
+            .exists()
+        )
+        self.assertFalse(
+            Producto.objects.using("replica")
+            .filter(nombre="Rubor Compacto Coral")
+            .exists()
+        )
+
+    def test_update_view_reads_from_primary(self):
+        """Test that update views load the object from the primary"""
+        producto = Producto.objects.create(**self.producto_data)
+
+        response = self.client.get(
+            reverse("productos:update", kwargs={"pk": producto.pk})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["object"], producto)
+
+    def test_read_your_writes_after_post(self):
+        """Test that the request following a write is pinned to the primary"""
+        response = self.client.post(reverse("productos:create"), self.producto_data)
+        self.assertIn("db_pin", response.cookies)
+
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertContains(response, "Rubor Compacto Coral")
+
+    def test_pin_expires(self):
+        """Test that reads return to the replica once the pin cookie is gone"""
+        self.client.post(reverse("productos:create"), self.producto_data)
+        self.client.cookies.pop("db_pin")
+
+        response = self.client.get(reverse("productos:list"))
+
+        self.assertNotContains(response, "Rubor Compacto Coral")
@@ -0,0 +1,88 @@
+"""
+Test cases for session refresh and expired session cleanup.
+"""
+
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.middleware import SessionRefreshMiddleware
+
+
+@override_settings(SESSION_COOKIE_AGE=3600, SESSION_REFRESH_THRESHOLD=900)
+class SessionRefreshMiddlewareTest(TestCase):
+    """Test cases for SessionRefreshMiddleware"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.middleware = SessionRefreshMiddleware(lambda request: HttpResponse())
+        self.request = RequestFactory().get("/")
+
+    def make_session(self, touched=None):
+        session = SessionStore()
+        session["carrito"] = [1]
+        if touched is not None:
+            session[SessionRefreshMiddleware.TOUCHED_KEY] = touched
+        session.save()
+        return SessionStore(session_key=session.session_key)
+
+    def test_empty_session_not_saved(self):
+        """Test that anonymous requests without a session never write"""
+        self.request.session = SessionStore()
+
+        self.middleware(self.request)
+
+        self.assertFalse(self.request.session.modified)
+
+    def test_recent_session_not_saved(self):
+        """Test that a recently touched session is left untouched"""
+        self.request.session = self.make_session(touched=int(time.time()) - 60)
+
+        self.middleware(self.request)
+
+        self.assertFalse(self.request.session.modified)
+
+    def test_session_close_to_expiry_is_refreshed(self):
+        """Test that a session inside the refresh window is saved again"""
+        self.request.session = self.make_session(touched=int(time.time()) - 3000)
+
+        self.middleware(self.request)
+
+        self.assertTrue(self.request.session.modified)
+
+    def test_untracked_session_is_refreshed(self):
+        """Test that sessions without a touch timestamp get one"""
+        self.request.session = self.make_session()
+
+        self.middleware(self.request)
+
+        self.assertIn(SessionRefreshMiddleware.TOUCHED_KEY, self.request.session)
+
+
+class ExpireSessionsCommandTest(TestCase):
+    """Test cases for the expire_sessions management command"""
+
+    def create_session(self, key, expire_date):
+        Session.objects.create(
+            session_key=key, session_data="", expire_date=expire_date
+        )
+
+    def test_deletes_only_expired_sessions_in_batches(self):
+        """Test that expired sessions are removed across several batches"""
+        now = timezone.now()
+        for i in range(5):
+            self.create_session(f"expired{i}", now - timedelta(hours=1))
+        self.create_session("active", now + timedelta(hours=1))
+        out = StringIO()
+
+        call_command("expire_sessions", batch_size=2, stdout=out)
+
+        self.assertEqual(list(Session.objects.values_list("pk", flat=True)), ["active"])
+        self.assertIn("5 sesiones expiradas eliminadas", out.getvalue())
@@ -0,0 +1,93 @@
+"""
+Test cases for startup cost: the importtime command and the worker role.
+"""
+
+import json
+import subprocess
+import sys
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from apps.core.management.commands.importtime import parse, summarize
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     django.utils.functional
+import time:       300 |        420 |   django.utils
+import time:      1000 |       1000 |   django.db.models
+import time:        50 |       1470 | django
+"""
+
+WORKER_STARTUP = """
+import json, sys
+import django
+django.setup()
+from django.urls import get_resolver
+patterns = [str(p.pattern) for p in get_resolver().url_patterns]
+print(json.dumps({
+    "admin": "django.contrib.admin" in sys.modules,
+    "pil": "PIL" in sys.modules,
+    "patterns": patterns,
+}))
+"""
+
+
+class ImportTimeTest(SimpleTestCase):
+    """Test cases for the importtime management command"""
+
+    def test_parse(self):
+        """Test parsing of python -X importtime output"""
+        self.assertEqual(
+            parse(SAMPLE),
+            [
+                ("django.utils.functional", 120, 120, 2),
+                ("django.utils", 300, 420, 1),
+                ("django.db.models", 1000, 1000, 1),
+                ("django", 50, 1470, 0),
+            ],
+        )
+
+    def test_summarize_sums_self_times(self):
+        """Test grouping by package without double counting nested imports"""
+        self.assertEqual(
+            summarize(parse(SAMPLE), 2),
+            [
+                ("django.db", 1000, 1),
+                ("django.utils", 420, 2),
+                ("django", 50, 1),
+            ],
+        )
+
+    def test_command(self):
+        """Test a real measurement in a fresh interpreter"""
+        out = StringIO()
+
+        call_command("importtime", "--top", "3", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("módulos importados", lines[-1])
+
+
+class WorkerRoleTest(SimpleTestCase):
+    """Test cases for the admin-less worker settings"""
+
+    def test_worker_startup_skips_admin_and_pillow(self):
+        """Test that startup and the URLconf import neither admin nor Pillow"""
+        result = subprocess.run(
+            [sys.executable, "-c", WORKER_STARTUP],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={"DJANGO_SETTINGS_MODULE": "cosmeticos_store.settings_worker"},
+            check=True,
+        )
+
+        data = json.loads(result.stdout)
+        self.assertFalse(data["admin"])
+        self.assertFalse(data["pil"])
+        self.assertNotIn("admin/", data["patterns"])
+        self.assertIn("api/", data["patterns"])
@@ -0,0 +1,118 @@
+"""
+Test cases for the S3-compatible media storage.
+Tests that talk to a bucket need a MinIO-style server:
+
+    docker compose up -d minio
+    S3_TEST_ENDPOINT_URL=http://localhost:9000 python manage.py test tests.test_storage
+"""
+
+import os
+import uuid
+from importlib.util import find_spec
+from unittest import skipUnless
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
+
+from apps.core.storage import MB, S3Storage
+
+HAS_BOTO3 = find_spec("boto3") is not None
+ENDPOINT_URL = os.environ.get("S3_TEST_ENDPOINT_URL")
+
+
+def make_storage(**options):
+    defaults = {
+        "bucket_name": "cosmeticos-test",
+        "endpoint_url": ENDPOINT_URL or "http://localhost:9000",
+        "region_name": "us-east-1",
+        "access_key": os.environ.get("S3_TEST_ACCESS_KEY", "practicausr25"),
+        "secret_key": os.environ.get("S3_TEST_SECRET_KEY", "practic35"),
+    }
+    return S3Storage(**{**defaults, **options})
+
+
+class S3StorageUrlTest(SimpleTestCase):
+    """Test cases for S3Storage.url(), which must not perform I/O"""
+
+    def test_custom_domain_url(self):
+        """Test that a CDN domain produces a plain URL under the location"""
+        storage = make_storage(location="media", custom_domain="cdn.example.com")
+
+        self.assertEqual(
+            storage.url("productos/labial rojo.jpg"),
+            "https://cdn.example.com/media/productos/labial%20rojo.jpg",
+        )
+
+    def test_public_url_without_querystring_auth(self):
+        """Test the unsigned URL on a custom endpoint"""
+        storage = make_storage(querystring_auth=False)
+
+        self.assertEqual(
+            storage.url("productos/labial.jpg"),
+            f"{storage.endpoint_url}/cosmeticos-test/productos/labial.jpg",
+        )
+
+    @skipUnless(HAS_BOTO3, "boto3 is not installed")
+    def test_presigned_url_is_signed_locally(self):
+        """Test that presigned URLs carry a signature and the expiry"""
+        storage = make_storage(querystring_expire=600)
+
+        url = urlsplit(storage.url("productos/labial.jpg"))
+        query = parse_qs(url.query)
+
+        self.assertTrue(url.path.endswith("/cosmeticos-test/productos/labial.jpg"))
+        self.assertEqual(query["X-Amz-Expires"], ["600"])
+        self.assertIn("X-Amz-Signature", query)
+
+
+@skipUnless(HAS_BOTO3 and ENDPOINT_URL, "S3_TEST_ENDPOINT_URL is not set")
+class S3StorageBucketTest(SimpleTestCase):
+    """Test cases for S3Storage against a MinIO-style server"""
+
+    def setUp(self):
+        """Set up a bucket with a unique prefix per test"""
+        self.storage = make_storage(
+            location=f"tests/{uuid.uuid4().hex}",
+            multipart_threshold=5 * MB,
+            multipart_chunksize=5 * MB,
+        )
+        try:
+            self.storage.client.create_bucket(Bucket=self.storage.bucket_name)
+        except self.storage.client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+    def test_save_open_and_delete(self):
+        """Test the basic file lifecycle"""
+        name = self.storage.save("productos/labial.txt", ContentFile(b"rojo"))
+
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(self.storage.size(name), 4)
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b"rojo")
+        self.assertEqual(self.storage.listdir("productos"), ([], ["labial.txt"]))
+        _, files = self.storage.listdir_modified("productos")
+        self.assertEqual(files, [("labial.txt", self.storage.get_modified_time(name))])
+
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+
+    def test_multipart_upload(self):
+        """Test that files above the threshold are uploaded in parts"""
+        payload = os.urandom(11 * MB)
+        name = self.storage.save("productos/grande.bin", ContentFile(payload))
+
+        head = self.storage.client.head_object(
+            Bucket=self.storage.bucket_name, Key=self.storage._key(name)
+        )
+        self.assertTrue(head["ETag"].strip('"').endswith("-3"))
+        self.assertEqual(self.storage.size(name), len(payload))
+
+    def test_save_many_uploads_in_parallel(self):
+        """Test that derivatives are all stored and returned in order"""
+        files = {f"productos/labial-{w}.webp": ContentFile(b"x" * w) for w in (1, 2, 3)}
+
+        names = self.storage.save_many(files)
+
+        self.assertEqual(names, list(files))
+        self.assertEqual([self.storage.size(n) for n in names], [1, 2, 3])
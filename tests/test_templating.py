@@ -0,0 +1,60 @@
+"""
+Test cases for the production template loaders and the boot warm-up.
+"""
+
+import tempfile
+from pathlib import Path
+
+from django.template import engines
+from django.test import TestCase, override_settings
+
+from apps.core.templating import template_names, warm_templates
+from cosmeticos_store import settings_production
+
+CACHED_TEMPLATES = settings_production.TEMPLATES
+
+
+@override_settings(TEMPLATES=CACHED_TEMPLATES)
+class WarmTemplatesTest(TestCase):
+    """Test cases for warm_templates"""
+
+    def cache(self):
+        return engines["django"].engine.template_loaders[0].get_template_cache
+
+    def test_production_uses_cached_loader(self):
+        """Test the production template settings"""
+        loader, _ = CACHED_TEMPLATES[0]["OPTIONS"]["loaders"][0]
+        self.assertEqual(loader, "django.template.loaders.cached.Loader")
+        self.assertFalse(CACHED_TEMPLATES[0]["APP_DIRS"])
+        self.assertTrue(settings_production.TEMPLATE_WARMUP)
+
+    def test_compiles_every_project_template(self):
+        """Test that every file under templates/ ends up in the cache"""
+        names = set(template_names(engines["django"].engine))
+        self.assertIn("shared/form_field.html", names)
+
+        self.assertEqual(warm_templates(), len(names))
+        self.assertLessEqual(names, set(self.cache()))
+
+    def test_first_request_compiles_nothing(self):
+        """Test that a warmed worker serves a form page from the cache"""
+        warm_templates()
+        cached = dict(self.cache())
+
+        response = self.client.get("/productos/create/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.cache(), cached)
+
+    def test_broken_template_is_logged(self):
+        """Test that a template that does not compile does not stop boot"""
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "ok.html").write_text("{{ valor }}")
+            Path(directory, "roto.html").write_text("{% if %}")
+            config = [{**CACHED_TEMPLATES[0], "DIRS": [directory]}]
+
+            with override_settings(TEMPLATES=config):
+                with self.assertLogs("apps.core.templating", "ERROR") as logs:
+                    self.assertEqual(warm_templates(), 1)
+
+        self.assertIn("roto.html", logs.output[0])
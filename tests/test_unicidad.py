@@ -0,0 +1,172 @@
+"""
+Test cases for the uniqueness pre-checks of cédula, employee code and RUC.
+"""
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import unicidad
+from apps.empresa.forms import EmpresaForm
+from apps.trabajadores.forms import TrabajadorForm
+from apps.trabajadores.models import Trabajador
+
+from .factories import EmpresaFactory, TrabajadorFactory
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ExisteTest(TestCase):
+    """Test cases for unicidad.existe and unicidad.existentes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador = TrabajadorFactory(cedula="0911111111")
+
+    def setUp(self):
+        unicidad.cache.clear()
+
+    def test_registered_fields(self):
+        """Test the fields registered by the apps"""
+        self.assertEqual(sorted(unicidad.CAMPOS), ["cedula", "codigo_empleado", "ruc"])
+
+    def test_existe(self):
+        """Test taken and free values, excluding the row being edited"""
+        self.assertTrue(unicidad.existe("cedula", "0911111111"))
+        self.assertFalse(unicidad.existe("cedula", "0922222222"))
+        self.assertFalse(
+            unicidad.existe("cedula", "0911111111", excluir=self.trabajador.pk)
+        )
+        self.assertTrue(
+            unicidad.existe("codigo_empleado", self.trabajador.codigo_empleado)
+        )
+
+    def test_only_free_answers_cached(self):
+        """Test that free values are cached and taken ones always queried"""
+        with self.assertNumQueries(1):
+            unicidad.existe("cedula", "0922222222")
+        with self.assertNumQueries(0):
+            self.assertFalse(unicidad.existe("cedula", "0922222222"))
+        with self.assertNumQueries(2):
+            unicidad.existe("cedula", "0911111111")
+            unicidad.existe("cedula", "0911111111")
+
+    def test_save_invalidates(self):
+        """Test that a cached free value is reported taken once saved"""
+        self.assertFalse(unicidad.existe("cedula", "0922222222"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TrabajadorFactory(cedula="0922222222")
+
+        self.assertTrue(unicidad.existe("cedula", "0922222222"))
+
+    def test_existentes_one_query(self):
+        """Test thousands of values resolved in one IN query"""
+        valores = [f"{1800000000 + n}" for n in range(3000)] + ["0911111111"]
+
+        with self.assertNumQueries(1):
+            self.assertEqual(unicidad.existentes("cedula", valores), {"0911111111"})
+
+    def test_existentes_cached(self):
+        """Test that only the taken values are queried again"""
+        valores = ["0911111111", "0922222222", "0933333333"]
+        unicidad.existentes("cedula", valores)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(unicidad.existentes("cedula", valores[1:]), set())
+        with self.assertNumQueries(1):
+            self.assertEqual(unicidad.existentes("cedula", valores), {"0911111111"})
+
+    def test_invalidar(self):
+        """Test explicit invalidation after writes that send no signals"""
+        unicidad.existentes("cedula", ["0933333333"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Trabajador.objects.bulk_create(
+                [TrabajadorFactory.build(cedula="0933333333")]
+            )
+            unicidad.invalidar("cedula", ["0933333333"])
+
+        self.assertTrue(unicidad.existe("cedula", "0933333333"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE, DATABASE_REPLICAS=["replica"])
+class ExisteReplicaTest(TestCase):
+    """Test cases for the uniqueness checks with a lagging replica"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        unicidad.cache.clear()
+
+    def test_checks_read_primary(self):
+        """Test that a value only on the primary is reported taken"""
+        TrabajadorFactory(cedula="0944444444")
+
+        self.assertTrue(unicidad.existe("cedula", "0944444444"))
+        self.assertEqual(unicidad.existentes("cedula", ["0944444444"]), {"0944444444"})
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class UnicidadApiTest(TestCase):
+    """Test cases for the uniqueness pre-check endpoint"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.empresa = EmpresaFactory(ruc="0990000000001")
+        cls.url = reverse("api:unicidad")
+
+    def setUp(self):
+        unicidad.cache.clear()
+
+    def test_single_value(self):
+        """Test one value, with and without the edited row"""
+        for query, disponible in [
+            ({"valor": "0990000000001"}, False),
+            ({"valor": " 0990000000002 "}, True),
+            ({"valor": "0990000000001", "excluir": self.empresa.pk}, True),
+        ]:
+            with self.subTest(query=query):
+                data = self.client.get(self.url, {"campo": "ruc", **query}).json()
+                self.assertEqual(data["disponible"], disponible)
+                self.assertEqual(data["valor"], query["valor"].strip())
+
+    def test_batch(self):
+        """Test taken values listed in request order"""
+        data = self.client.get(
+            self.url, {"campo": "ruc", "valores": "1,0990000000001,2,1"}
+        ).json()
+
+        self.assertEqual(data, {"campo": "ruc", "tomados": ["0990000000001"]})
+
+    def test_invalid_requests(self):
+        """Test unknown fields, missing values and bad ids"""
+        too_many = ",".join(str(n) for n in range(501))
+        for query in [
+            {"campo": "nombre", "valor": "x"},
+            {"campo": "ruc"},
+            {"campo": "ruc", "valor": "x", "excluir": "a"},
+            {"campo": "ruc", "valores": " , "},
+            {"campo": "ruc", "valores": too_many},
+        ]:
+            with self.subTest(query=query):
+                with self.assertLogs("django.request", "WARNING"):
+                    response = self.client.get(self.url, query)
+                self.assertEqual(response.status_code, 400)
+
+    def test_forms_point_at_endpoint(self):
+        """Test the data-unique-url of create and update forms"""
+        self.assertEqual(
+            TrabajadorForm().fields["cedula"].widget.attrs["data-unique-url"],
+            f"{self.url}?campo=cedula",
+        )
+        self.assertEqual(
+            EmpresaForm(instance=self.empresa)
+            .fields["ruc"]
+            .widget.attrs["data-unique-url"],
+            f"{self.url}?campo=ruc&excluir={self.empresa.pk}",
+        )
+        response = self.client.get(reverse("trabajadores:create"))
+        self.assertContains(response, 'data-unique-url="/api/unicidad/?campo=cedula"')
@@ -0,0 +1,193 @@
+"""
+Test cases for checkout, sale snapshots and the daily sales rollup.
+"""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.inventario import stock
+from apps.inventario.models import MovimientoStock, Stock
+from apps.ventas.checkout import VentaInvalida, registrar_venta
+from apps.ventas.models import LineaVenta, ResumenVentaDiario, Venta
+from apps.ventas.resumenes import RANURAS
+
+from .factories import ProductoFactory, TrabajadorFactory
+
+
+class CheckoutTest(TestCase):
+    """Test cases for registrar_venta"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador = TrabajadorFactory(codigo_empleado="EMP777")
+        cls.labial = ProductoFactory(nombre="Labial", precio="10.00", iva=15)
+        cls.serum = ProductoFactory(nombre="Sérum", precio="25.99", iva=0)
+        stock.ingresar({cls.labial.pk: 10, cls.serum.pk: 5})
+
+    def vender(self, **kwargs):
+        return registrar_venta(
+            self.trabajador, {self.labial.pk: 3, self.serum.pk: 2}, **kwargs
+        )
+
+    def test_totals_are_precomputed(self):
+        """Test line and sale amounts with IVA snapshots"""
+        venta = self.vender()
+
+        lineas = {linea.nombre: linea for linea in venta.lineas.all()}
+        self.assertEqual(lineas["Labial"].subtotal, Decimal("30.00"))
+        self.assertEqual(lineas["Labial"].iva_monto, Decimal("4.50"))
+        self.assertEqual(lineas["Labial"].total, Decimal("34.50"))
+        self.assertEqual(lineas["Sérum"].total, Decimal("51.98"))
+        self.assertEqual(
+            (venta.unidades, venta.subtotal, venta.iva_total, venta.total),
+            (5, Decimal("81.98"), Decimal("4.50"), Decimal("86.48")),
+        )
+        self.assertEqual(venta.codigo_empleado, "EMP777")
+
+    def test_lines_inserted_in_bulk(self):
+        """Test that all lines are written with a single INSERT"""
+        with CaptureQueriesContext(connection) as queries:
+            self.vender()
+
+        inserts = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith('INSERT INTO "ventas_lineaventa"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+    def test_stock_and_ledger_updated(self):
+        """Test that checkout takes the stock with a ledger reference"""
+        venta = self.vender()
+
+        self.assertEqual(Stock.objects.get(pk=self.labial.pk).disponible, 7)
+        self.assertTrue(
+            MovimientoStock.objects.filter(
+                producto=self.serum, tipo="salida", referencia=f"venta-{venta.pk}"
+            ).exists()
+        )
+
+    def test_daily_summary_accumulates(self):
+        """Test that each sale is added to its day's summary"""
+        self.vender()
+        self.vender()
+
+        resumen = ResumenVentaDiario.objects.filter(
+            fecha=timezone.localdate()
+        ).aggregate(ventas=Sum("ventas"), unidades=Sum("unidades"), total=Sum("total"))
+        self.assertEqual(
+            resumen, {"ventas": 2, "unidades": 10, "total": Decimal("172.96")}
+        )
+
+    def test_concurrent_sales_use_different_rows(self):
+        """Test that consecutive sales of a day update different summary rows"""
+        ventas = [self.vender(), registrar_venta(self.trabajador, {self.labial.pk: 1})]
+
+        self.assertEqual(
+            sorted(ResumenVentaDiario.objects.values_list("ranura", flat=True)),
+            sorted(venta.pk % RANURAS for venta in ventas),
+        )
+        self.assertEqual(ResumenVentaDiario.objects.count(), 2)
+
+    def test_insufficient_stock_writes_nothing(self):
+        """Test that a failed checkout leaves no sale, lines or summary"""
+        with self.assertRaises(stock.StockInsuficiente):
+            registrar_venta(self.trabajador, {self.serum.pk: 6})
+
+        self.assertFalse(Venta.objects.exists())
+        self.assertFalse(LineaVenta.objects.exists())
+        self.assertFalse(ResumenVentaDiario.objects.exists())
+
+    def test_unknown_product_rejected(self):
+        """Test that sales of unknown products are rejected"""
+        with self.assertRaises(VentaInvalida):
+            registrar_venta(self.trabajador, {999999: 1})
+
+    def test_snapshot_survives_price_change(self):
+        """Test that sale lines keep the price they were sold at"""
+        venta = self.vender()
+        self.labial.precio = Decimal("99.00")
+        self.labial.save()
+
+        linea = venta.lineas.get(nombre="Labial")
+        self.assertEqual(linea.precio_unitario, Decimal("10.00"))
+
+    def test_sale_survives_worker_deletion(self):
+        """Test that deleting the seller keeps the sale and its code"""
+        venta = self.vender()
+        self.trabajador.delete()
+
+        venta.refresh_from_db()
+        self.assertIsNone(venta.trabajador)
+        self.assertEqual(venta.codigo_empleado, "EMP777")
+
+
+class VentaViewTest(TestCase):
+    """Test cases for the sales views"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador = TrabajadorFactory()
+        cls.labial = ProductoFactory(nombre="Labial", precio="10.00", iva=15)
+        stock.ingresar({cls.labial.pk: 2})
+
+    def post_venta(self, *lineas):
+        data = {
+            "trabajador": self.trabajador.pk,
+            "lineas-TOTAL_FORMS": len(lineas),
+            "lineas-INITIAL_FORMS": 0,
+        }
+        for i, (producto, cantidad) in enumerate(lineas):
+            data[f"lineas-{i}-producto"] = producto
+            data[f"lineas-{i}-cantidad"] = cantidad
+        return self.client.post(reverse("ventas:create"), data)
+
+    def test_create_view_get(self):
+        """Test that the form loads product choices once for all lines"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("ventas:create"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Labial ($10.00)", count=5)
+
+    def test_create_view_post_valid(self):
+        """Test that a valid sale redirects to its detail page"""
+        response = self.post_venta((self.labial.pk, 1), (self.labial.pk, 1))
+
+        venta = Venta.objects.get()
+        self.assertRedirects(response, reverse("ventas:detail", args=[venta.pk]))
+        self.assertEqual(venta.lineas.get().cantidad, 2)
+
+    def test_create_view_insufficient_stock(self):
+        """Test that a stock shortage is reported on the form"""
+        response = self.post_venta((self.labial.pk, 3))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Stock insuficiente: Labial.")
+        self.assertFalse(Venta.objects.exists())
+
+    def test_create_view_requires_lines(self):
+        """Test that a sale without products is rejected"""
+        response = self.post_venta(("", ""))
+
+        self.assertContains(response, "Agregue al menos un producto.")
+
+    def test_list_and_detail_views(self):
+        """Test that the list shows the daily summary and the detail its lines"""
+        venta = registrar_venta(self.trabajador, {self.labial.pk: 1})
+
+        response = self.client.get(reverse("ventas:list"))
+        self.assertContains(response, "ÚLTIMOS 14 DÍAS")
+        self.assertContains(response, "$11,50", count=2)
+
+        response = self.client.get(venta.get_absolute_url())
+        self.assertContains(response, f"VENTA #{venta.pk}")
+        self.assertContains(response, "Labial")
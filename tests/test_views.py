@@ -3,29 +3,36 @@ Test cases for all views following TDD London School approach.
 Target: 100% test coverage for view layer.
 """
 
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from PIL import Image
+
 from apps.empresa.models import Empresa
 from apps.productos.models import Producto
 from apps.proveedores.models import Proveedor
 from apps.trabajadores.models import Trabajador
 
+from .factories import ProductoFactory, ProveedorFactory, TrabajadorFactory
+
 
 class TrabajadorViewTest(TestCase):
     """Test cases for Trabajador views"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-        self.trabajador_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.trabajador_data = {
             "nombre": "Ana",
             "apellido": "Martínez",
             "correo": "ana.martinez@cosmeticos.com",
             "cedula": "1234567890",
             "codigo_empleado": "EMP001",
         }
-        self.trabajador = Trabajador.objects.create(**self.trabajador_data)
+        cls.trabajador = TrabajadorFactory(**cls.trabajador_data)
 
     def test_trabajador_list_view(self):
         """Test trabajador list view displays all workers"""
@@ -220,16 +227,16 @@ class EmpresaViewTest(TestCase):
 class ProductoViewTest(TestCase):
     """Test cases for Producto views"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-        self.producto_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.producto_data = {
             "nombre": "Lápiz Labial Rojo",
             "descripcion": "Lápiz labial de larga duración",
             "precio": "25.99",
             "iva": 15,
         }
-        self.producto = Producto.objects.create(**self.producto_data)
+        cls.producto = ProductoFactory(**cls.producto_data)
 
     def test_producto_list_view(self):
         """Test producto list view displays all products"""
@@ -255,6 +262,26 @@ class ProductoViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertTrue(Producto.objects.filter(nombre="Base de Maquillaje").exists())
 
+    def test_producto_create_view_with_image(self):
+        """Test producto create view stores the uploaded image"""
+        url = reverse("productos:create")
+        buffer = BytesIO()
+        Image.new("RGB", (8, 8), "red").save(buffer, "PNG")
+        imagen = SimpleUploadedFile("rubor.png", buffer.getvalue(), "image/png")
+        new_data = {
+            "nombre": "Rubor Compacto",
+            "descripcion": "Rubor en polvo",
+            "precio": "12.00",
+            "iva": 15,
+            "imagen": imagen,
+        }
+
+        response = self.client.post(url, data=new_data)
+
+        self.assertEqual(response.status_code, 302)
+        producto = Producto.objects.get(nombre="Rubor Compacto")
+        self.assertTrue(producto.imagen.storage.exists(producto.imagen.name))
+
     def test_producto_delete_view(self):
         """Test producto delete view"""
         url = reverse("productos:delete", kwargs={"pk": self.producto.pk})
@@ -268,10 +295,10 @@ class ProductoViewTest(TestCase):
 class ProveedorViewTest(TestCase):
     """Test cases for Proveedor views"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-        self.proveedor_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.proveedor_data = {
             "nombre": "L'Oréal Ecuador",
             "descripcion": "Distribuidor oficial de productos L'Oréal",
             "telefono": "+593-2-123-4567",
@@ -279,7 +306,7 @@ class ProveedorViewTest(TestCase):
             "correo": "contacto@loreal.ec",
             "direccion": "Av. Amazonas 456, Quito",
         }
-        self.proveedor = Proveedor.objects.create(**self.proveedor_data)
+        cls.proveedor = ProveedorFactory(**cls.proveedor_data)
 
     def test_proveedor_list_view(self):
         """Test proveedor list view displays all suppliers"""